@@ -0,0 +1,86 @@
+"""
+Compare HDL wrappers with and without generate loops for bus buffers
+
+A 512-bit output bus is spread over four banks as multibank fragments, with two
+different iostandards, and its Verilog and VHDL wrappers are emitted once with a
+buffer instance per bit and once with generate loops. For each the report lists
+the size of the output, the number of instance statements that synthesis has to
+parse and check, and the emission time. Run from the io-gen directory:
+
+    PYTHONPATH=. python benchmarks/bench_hdl_loops.py --width 512 --fragments 4
+
+"""
+
+import argparse
+import re
+import timeit
+
+from io_gen.bank_table import extract_bank_table
+from io_gen.build import freeze_signal_pins
+from io_gen.emit_hdl import iter_verilog, iter_vhdl
+from io_gen.pin_table import extract_pin_table
+from io_gen.signal_table import extract_signal_table
+
+IOSTANDARDS = ("LVCMOS33", "LVCMOS18")
+
+# A buffer instance statement in either language
+INSTANCE = re.compile(r"^\s*(?:[A-Z]+ #\(|\w+ : [A-Z]+$)", re.MULTILINE)
+
+
+def make_board(width: int, fragments: int) -> tuple[list[dict], dict[int, dict]]:
+    """Returns one multibank bus split evenly over `fragments` banks"""
+    step = width // fragments
+    banks = {
+        bank: {"iostandard": IOSTANDARDS[bank % 2], "performance": "HR"}
+        for bank in range(fragments)
+    }
+    multibank = [
+        {
+            "bank": bank,
+            "offset": bank * step,
+            "pins": [f"P{bit}" for bit in range(bank * step, (bank + 1) * step)],
+        }
+        for bank in range(fragments)
+    ]
+    signal = {
+        "name": "data",
+        "direction": "out",
+        "buffer": "obuf",
+        "width": step * fragments,
+        "parameters": {"DRIVE": 12, "SLEW": "FAST"},
+        "multibank": multibank,
+    }
+    return [signal], banks
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--width", type=int, default=512)
+    parser.add_argument("--fragments", type=int, default=4)
+    args = parser.parse_args()
+
+    signals, banks = make_board(args.width, args.fragments)
+    signal_table = extract_signal_table(signals)
+    pin_table = extract_pin_table(signal_table, extract_bank_table(banks))
+    signal_pins = freeze_signal_pins(signal_table, pin_table)
+
+    print(f"{args.width}-bit bus over {args.fragments} banks")
+    print(f"  {'':8} {'mode':9} {'lines':>7} {'bytes':>9} {'instances':>10} {'ms':>8}")
+    for language, iter_hdl in (("verilog", iter_verilog), ("vhdl", iter_vhdl)):
+        for mode, loops in (("per-bit", False), ("loops", True)):
+            text = "".join(iter_hdl(signal_pins, loops=loops))
+            seconds = min(
+                timeit.repeat(
+                    lambda: "".join(iter_hdl(signal_pins, loops=loops)),
+                    number=1,
+                    repeat=5,
+                )
+            )
+            print(
+                f"  {language:8} {mode:9} {text.count(chr(10)):7} {len(text):9} "
+                f"{len(INSTANCE.findall(text)):10} {seconds * 1e3:8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
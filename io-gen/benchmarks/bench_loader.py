@@ -0,0 +1,99 @@
+"""
+Compare the speed of the board loading backends
+
+The pipeline fixtures are scaled up by repeating their signals under new names,
+written out as both YAML and JSON, and then loaded with each available backend.
+Run from the io-gen directory:
+
+    PYTHONPATH=. python benchmarks/bench_loader.py --scale 200
+
+"""
+
+import argparse
+import copy
+import json
+import tempfile
+import timeit
+from pathlib import Path
+
+import yaml
+
+from io_gen.loader import iter_signals, load_board, load_json, load_yaml
+
+FIXTURES = [
+    Path("tests/fixtures/pipeline/arty-z7-20.yaml"),
+    Path("tests/fixtures/pipeline/integration.yaml"),
+]
+
+
+def scale_board(board: dict, scale: int) -> dict:
+    """Returns a copy of a board with its signals repeated `scale` times"""
+    scaled = {key: value for key, value in board.items() if key != "signals"}
+    scaled["signals"] = []
+    for copy_index in range(scale):
+        for signal in board["signals"]:
+            signal = copy.deepcopy(signal)
+            signal["name"] = f"{signal['name']}_{copy_index}"
+            scaled["signals"].append(signal)
+    return scaled
+
+
+def drain_signals(stream, loader) -> None:
+    """Consumes every signal from the incremental loader"""
+    for _ in iter_signals(stream, {}, loader):
+        pass
+
+
+def time_call(func, repeat: int) -> float:
+    """Returns the best time out of `repeat` runs of `func`, in seconds"""
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def bench_fixture(path: Path, scale: int, repeat: int, tmp_dir: Path) -> None:
+    with path.open("r", encoding="utf-8") as f:
+        board = scale_board(yaml.safe_load(f), scale)
+
+    yaml_path = tmp_dir / f"{path.stem}.yaml"
+    json_path = tmp_dir / f"{path.stem}.json"
+    yaml_path.write_text(yaml.safe_dump(board, sort_keys=False), encoding="utf-8")
+    json_path.write_text(json.dumps(board), encoding="utf-8")
+
+    yaml_text = yaml_path.read_text(encoding="utf-8")
+    json_text = json_path.read_text(encoding="utf-8")
+
+    # Every backend has to agree before its timing means anything
+    assert load_board(json_path)[0] == board
+    assert load_yaml(yaml_text, yaml.SafeLoader) == board
+
+    runs = {
+        "safe_load (pyyaml)": lambda: load_yaml(yaml_text, yaml.SafeLoader),
+        "iter_signals (pyyaml)": lambda: drain_signals(yaml_text, yaml.SafeLoader),
+        "json": lambda: load_json(json_text),
+    }
+    if yaml.__with_libyaml__:
+        assert load_yaml(yaml_text, yaml.CSafeLoader) == board
+        runs["safe_load (libyaml)"] = lambda: load_yaml(yaml_text, yaml.CSafeLoader)
+        runs["iter_signals (libyaml)"] = lambda: drain_signals(
+            yaml_text, yaml.CSafeLoader
+        )
+
+    print(f"{path.name}: {len(board['signals'])} signals, {len(yaml_text)} bytes")
+    timings = {name: time_call(func, repeat) for name, func in runs.items()}
+    baseline = timings["safe_load (pyyaml)"]
+    for name, elapsed in timings.items():
+        print(f"  {name:<24} {elapsed * 1e3:10.2f} ms {baseline / elapsed:8.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--scale", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in FIXTURES:
+            bench_fixture(path, args.scale, args.repeat, Path(tmp))
+
+
+if __name__ == "__main__":
+    main()
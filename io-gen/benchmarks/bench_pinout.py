@@ -0,0 +1,95 @@
+"""
+Compare parsing a package pinout with loading its cached binary index
+
+A synthetic pinout in the vendor ASCII layout is written with `--banks` banks of
+50 user IOs each plus power pins, then loaded cold (parsed and indexed) and warm
+(memory-mapped from the cache). The report also times looking up every pin by
+name and listing the pins of every bank in the warm index. Run from the io-gen
+directory:
+
+    PYTHONPATH=. python benchmarks/bench_pinout.py --banks 40
+
+"""
+
+import argparse
+import tempfile
+import timeit
+from pathlib import Path
+
+from io_gen.pinout import load_pinout
+
+PART = "xcbench2000-1"
+
+
+def make_pinout(banks: int) -> str:
+    """Returns a pinout with 50 user IOs and one VCCO pin in each bank"""
+    lines = [
+        "Device/Package xcbench2000",
+        "",
+        "Pin     Pin Name              Memory Byte Group  Bank  I/O Type",
+    ]
+    for bank in range(banks):
+        row = f"B{bank}_"
+        for pair in range(1, 25):
+            clock = "_MRCC" if pair in (12, 13) else ""
+            for side in "PN":
+                lines.append(
+                    f"{row}{pair}{side}  IO_L{pair}{side}_T{pair // 7}{clock}_{bank}"
+                    f"  {pair // 7}  {bank}  HP"
+                )
+        lines.append(f"{row}0  IO_0_{bank}  NA  {bank}  HP")
+        lines.append(f"{row}25  IO_25_{bank}  NA  {bank}  HP")
+        lines.append(f"{row}V  VCCO_{bank}  NA  {bank}  NA")
+    lines += ["", f"Total Number of Pins {banks * 51}"]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--banks", type=int, default=40)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pinout_dir = Path(tmp) / "pinouts"
+        pinout_dir.mkdir()
+        (pinout_dir / "xcbench2000pkg.txt").write_text(make_pinout(args.banks))
+
+        def load(cache_dir: Path) -> None:
+            load_pinout(PART, pinout_dir, cache_dir).close()
+
+        cold = min(
+            timeit.repeat(
+                lambda: load(Path(tempfile.mkdtemp(dir=tmp))), number=1, repeat=5
+            )
+        )
+        warm_dir = Path(tmp) / "warm"
+        load(warm_dir)
+        warm = min(timeit.repeat(lambda: load(warm_dir), number=1, repeat=20))
+
+        with load_pinout(PART, pinout_dir, warm_dir) as pinout:
+            names = [pin.pin for pin in pinout]
+            lookup = min(
+                timeit.repeat(
+                    lambda: [pinout.get_pin(name) for name in names],
+                    number=1,
+                    repeat=5,
+                )
+            )
+            by_bank = min(
+                timeit.repeat(
+                    lambda: [pinout.get_pins_by_bank(bank) for bank in pinout.banks],
+                    number=1,
+                    repeat=5,
+                )
+            )
+
+    print(f"{len(names)} pins in {args.banks} banks")
+    print(f"  {'cold load (parse and index)':32} {cold * 1e3:9.3f} ms")
+    print(f"  {'warm load (mapped index)':32} {warm * 1e3:9.3f} ms")
+    print(f"  {'look up every pin':32} {lookup * 1e3:9.3f} ms")
+    print(f"  {'per pin lookup':32} {lookup / len(names) * 1e6:9.3f} us")
+    print(f"  {'list every bank':32} {by_bank * 1e3:9.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
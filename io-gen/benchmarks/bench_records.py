@@ -0,0 +1,87 @@
+"""
+Compare the memory used by dict and record pin table entries
+
+A board of wide buses is flattened into slotted pin records, which reference
+their signal, and the same entries are then copied into plain dicts, which is how
+the pin table used to hold them. The report also times flattening the board and
+emitting XDC from its pin table, which read the records through their attributes.
+Run from the io-gen directory:
+
+    PYTHONPATH=. python benchmarks/bench_records.py --width 1000 --signals 20
+
+"""
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+
+from io_gen.emit_xdc import emit_xdc
+from io_gen.pin_table import extract_pin_table
+from io_gen.signal_table import extract_signal_table
+
+BANK_TABLE = {34: {"iostandard": "LVCMOS33", "performance": "HR"}}
+
+
+def make_signals(count: int, width: int) -> list[dict]:
+    """Returns `count` single-ended buses of `width` bits each"""
+    return [
+        {
+            "name": f"bus_{index}",
+            "pins": [f"P{index}_{bit}" for bit in range(width)],
+            "bank": 34,
+            "direction": "out",
+            "buffer": "obuf",
+            "width": width,
+        }
+        for index in range(count)
+    ]
+
+
+def measure(build) -> tuple[object, int]:
+    """Returns the result of `build` and the bytes still allocated for it"""
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--width", type=int, default=1000)
+    parser.add_argument("--signals", type=int, default=20)
+    args = parser.parse_args()
+
+    signal_table = extract_signal_table(make_signals(args.signals, args.width))
+
+    pin_table, record_size = measure(
+        lambda: list(extract_pin_table(signal_table, BANK_TABLE))
+    )
+    dicts, dict_size = measure(lambda: [dict(entry) for entry in pin_table])
+    assert dicts == pin_table
+
+    count = len(pin_table)
+    print(f"{count} pin entries from {args.signals} x {args.width}-bit buses")
+    print(f"  dict    {dict_size / 1024:10.1f} KiB {dict_size / count:8.1f} B/pin")
+    print(f"  record  {record_size / 1024:10.1f} KiB {record_size / count:8.1f} B/pin")
+    print(f"  saving  {dict_size / record_size:10.1f}x")
+
+    flatten_time = min(
+        timeit.repeat(
+            lambda: extract_pin_table(signal_table, BANK_TABLE), number=1, repeat=3
+        )
+    )
+    print(f"  flatten {flatten_time * 1e3:10.2f} ms")
+
+    full_table = extract_pin_table(signal_table, BANK_TABLE)
+    emit_time = min(
+        timeit.repeat(lambda: emit_xdc(signal_table, full_table), number=1, repeat=3)
+    )
+    print(f"  emit    {emit_time * 1e3:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compare the size of the default and compact XDC output
+
+Each board is run through the pipeline twice, once writing the default two lines
+per port and once writing the compact form of one `-dict` line per port, and the
+line count and size of both outputs are reported. Run from the io-gen
+directory:
+
+    PYTHONPATH=. python benchmarks/report_xdc_size.py tests/fixtures/pipeline/*.yaml
+
+"""
+
+import argparse
+from pathlib import Path
+
+from io_gen.loader import load_board
+from io_gen.pipeline import iter_xdc_lines
+
+DEFAULT_BOARDS = [
+    Path("tests/fixtures/pipeline/integration.yaml"),
+    Path("tests/fixtures/schema/valid-parameters.yaml"),
+]
+
+
+def measure(lines: list[str]) -> tuple[int, int, int]:
+    """Returns the line count, constraint count and bytes of XDC output"""
+    constraints = sum(1 for line in lines if line.startswith("set_property"))
+    size = sum(len(line.encode()) + 1 for line in lines)
+    return len(lines), constraints, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("boards", nargs="*", type=Path, default=DEFAULT_BOARDS)
+    args = parser.parse_args()
+
+    print(f"{'board':24} {'mode':8} {'lines':>7} {'props':>7} {'bytes':>9}")
+    for path in args.boards:
+        board, _ = load_board(path)
+        try:
+            default = measure(list(iter_xdc_lines(board)))
+            compact = measure(list(iter_xdc_lines(board, compact=True)))
+        except ValueError as e:
+            print(f"{path.name:24} skipped: {e}")
+            continue
+
+        for mode, (lines, constraints, size) in (
+            ("default", default),
+            ("compact", compact),
+        ):
+            print(f"{path.name:24} {mode:8} {lines:7} {constraints:7} {size:9}")
+        print(
+            f"{path.name:24} {'ratio':8} {compact[0] / default[0]:7.2f} "
+            f"{compact[1] / default[1]:7.2f} {compact[2] / default[2]:9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
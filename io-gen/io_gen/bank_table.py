@@ -1,37 +1,169 @@
-from typing import Any
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Iterator
 
+from io_gen.validate_banks import validate_bank_table
+from io_gen.validator import validate
+
+# Bank supply voltage required by each IO standard
+IOSTANDARD_VCCO = {
+    "LVCMOS12": 1.2,
+    "LVCMOS15": 1.5,
+    "LVCMOS18": 1.8,
+    "LVCMOS25": 2.5,
+    "LVCMOS33": 3.3,
+    "LVDS": 1.8,
+    "LVDS_25": 2.5,
+    "SSTL15": 1.5,
+    "SSTL18": 1.8,
+    "TMDS_33": 3.3,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class BankAttributes:
+    """Effective attributes of one bank, resolved when the bank table is built"""
+
+    iostandard: str | None
+    performance: str | None
+    vcco: float | None
+
+
+def get_missing_bank_message(
+    number: int, banks: Mapping[int, Any], name: str | None = None
+) -> str:
+    """Returns the error for a bank that is not in the bank table"""
+    user = f"Signal '{name}' uses bank {number}" if name else f"Bank {number}"
+    defined = ", ".join(str(bank) for bank in sorted(banks)) or "none"
+    return f"{user} is not in the bank table (defined banks: {defined})"
+
+
+class BankTable(Mapping):
+    """Bank table keyed by bank number, with each bank's attributes precomputed
+
+    Indexing a bank table returns the bank's entry as it was declared, so it can be
+    used anywhere the plain bank dictionary was. The effective attributes of every
+    bank are resolved once, when the table is built, and looked up by number
+    afterwards.
 
-def extract_bank_table(banks: dict[int, dict[str, Any]]) -> dict[int, dict[str, Any]]:
+    """
+
+    def __init__(self, banks: Mapping[int, Mapping[str, Any]]) -> None:
+        self.banks = dict(banks)
+        self.attributes = {
+            number: BankAttributes(
+                iostandard=entry.get("iostandard"),
+                performance=entry.get("performance"),
+                vcco=IOSTANDARD_VCCO.get(entry.get("iostandard", "")),
+            )
+            for number, entry in self.banks.items()
+        }
+
+    def __getitem__(self, number: int) -> Mapping[str, Any]:
+        return self.banks[number]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.banks)
+
+    def __len__(self) -> int:
+        return len(self.banks)
+
+    def __repr__(self) -> str:
+        return f"BankTable({self.banks!r})"
+
+    def get_attributes(self, number: int, name: str | None = None) -> BankAttributes:
+        """Returns the effective attributes of a bank
+
+        Args:
+            number: The bank number
+            name: The signal that uses the bank, for error messages
+
+        Raises:
+            ValueError: If the bank is not in the table, listing the banks that are
+
+        """
+        attributes = self.attributes.get(number)
+        if attributes is None:
+            msg = get_missing_bank_message(number, self.banks, name)
+            raise ValueError(msg)
+        return attributes
+
+    def get_iostandard(self, number: int, name: str | None = None) -> str:
+        """Returns the iostandard of a bank, see `get_attributes`"""
+        iostandard = self.get_attributes(number, name).iostandard
+
+        # The bank 'iostandard' key is required by the schema
+        assert (
+            iostandard is not None
+        ), "Bank 'iostandard' is missing from bank table entry"
+        return iostandard
+
+    def get_performance(self, number: int, name: str | None = None) -> str | None:
+        """Returns the performance type of a bank, see `get_attributes`"""
+        return self.get_attributes(number, name).performance
+
+    def get_vcco(self, number: int, name: str | None = None) -> float | None:
+        """Returns the VCCO voltage implied by a bank's iostandard, if known"""
+        return self.get_attributes(number, name).vcco
+
+
+def extract_bank_table(banks: Mapping[int, Mapping[str, Any]]) -> BankTable:
     """
     Extract and normalize the bank table from raw YAML input.
 
-    This function simply returns the `banks` dictionary as-is, assuming
-    that all entries have already been schema-validated and are keyed by
-    integer bank numbers.
+    The `banks` entries are kept as they are, assuming that they have already been
+    schema-validated and are keyed by integer bank numbers, and the effective
+    attributes of each bank are resolved once.
 
     Args:
         banks: Dictionary of bank definitions from YAML. Keys must be integers.
 
     Returns:
-        A dictionary representing the internal bank table, where each key is a
-        bank number and each value is a dict of attributes like `iostandard` and `performance`.
+        A BankTable keyed by bank number, whose values are the dicts of attributes
+        like `iostandard` and `performance`.
     """
-    return banks
+    if isinstance(banks, BankTable):
+        return banks
+    return BankTable(banks)
+
 
+def get_bank_iostandard(
+    number: int, bank_table: Mapping[int, Mapping[str, Any]], name: str | None = None
+) -> str:
+    """Looks up the 'iostandard' property for a bank from the bank table
 
-def get_bank_iostandard(number: int, bank_table: dict[int, dict[str, Any]]) -> str:
-    """Looks up the 'iostandard' property for a bank from the bank table"""
+    A `BankTable` answers from its precomputed attributes. Any other mapping is
+    indexed directly rather than wrapped on every lookup.
 
-    if number not in bank_table:
-        msg = f"Bank table does not contain an entry for bank {number}"
+    Raises:
+        ValueError: If the bank is not in the table, listing the banks that are
+
+    """
+    if isinstance(bank_table, BankTable):
+        return bank_table.get_iostandard(number, name)
+
+    entry = bank_table.get(number)
+    if entry is None:
+        msg = get_missing_bank_message(number, bank_table, name)
         raise ValueError(msg)
+    return entry["iostandard"]
+
 
-    # The bank 'iostandard' key is required by the schema
-    assert (
-        "iostandard" in bank_table[number]
-    ), "Bank 'iostandard' is missing from bank table entry"
+def prepare_bank_table(board: dict[str, Any]) -> BankTable:
+    """Validates everything in a board except its signals and returns its bank table
 
-    iostandard = bank_table[number]["iostandard"]
-    return iostandard
+    Raises:
+        jsonschema.exceptions.ValidationError: If the top level of the board does not
+            conform to the schema
+        ValueError: If the bank table is invalid
 
+    """
+    # The signals themselves are validated one at a time by the caller, anything
+    # other than a list of them is left for the schema to reject
+    if isinstance(board.get("signals"), list):
+        board = {**board, "signals": []}
+    validate(board)
 
+    bank_table = extract_bank_table(board.get("banks", {}))
+    validate_bank_table(bank_table)
+    return bank_table
@@ -0,0 +1,208 @@
+"""
+Build several output targets concurrently from one set of tables
+
+`build_targets` validates and flattens a board once, or reads its tables from the
+cache, and freezes the signal table, pins and port names into tuples shared by
+every requested emitter, so port names are worked out once rather than once per
+emitter. Emitters only read those tuples, so they run side by side in a thread
+pool, each writing its own file atomically. The output of each emitter is exactly
+what it writes when run on its own. Run this module to build targets for a board
+file:
+
+    python -m io_gen.build board.yaml -o build -t xdc -t pins
+
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Mapping
+
+from io_gen.cache import load_tables
+from io_gen.emitters import (
+    Emitter,
+    NamedSignalPins,
+    SignalPins,
+    get_emitter,
+    write_output_file,
+)
+from io_gen.pin_table import PinTable
+from io_gen.pinout import load_pinout
+from io_gen.port_names import PortNamer, iter_named_signal_pins
+from io_gen.validate_pinout import validate_pinout
+from io_gen.validate_pins import validate_pin_table
+
+
+@dataclass(frozen=True)
+class TargetResult:
+    """One output file written by `build_targets` and how long it took"""
+
+    name: str
+    path: Path
+    seconds: float
+
+
+def freeze_signal_pins(
+    signal_table: Iterable[Mapping[str, Any]], pin_table: PinTable
+) -> tuple[SignalPins, ...]:
+    """Returns each signal table entry with a tuple of its pins, in table order"""
+    return tuple(
+        (signal, tuple(pin_table.get_pins_by_signal(signal["name"])))
+        for signal in signal_table
+    )
+
+
+def freeze_named_signal_pins(
+    signal_table: Iterable[Mapping[str, Any]],
+    pin_table: PinTable,
+    namer: PortNamer | None = None,
+) -> tuple[NamedSignalPins, ...]:
+    """Returns each signal table entry with a tuple of its pins and its port names
+
+    Ports are named by `namer`, or under the default convention if it is None.
+
+    Raises:
+        ValueError: If two signals would share a port name
+
+    """
+    signal_pins = freeze_signal_pins(signal_table, pin_table)
+    return tuple(iter_named_signal_pins(signal_pins, namer))
+
+
+def get_target_paths(
+    emitters: list[Emitter], out_dir: Path, stem: str
+) -> dict[str, Path]:
+    """Returns the output file of each emitter, named after the board file
+
+    Raises:
+        ValueError: If two emitters would write the same file
+
+    """
+    paths: dict[str, Path] = {}
+    for emitter in emitters:
+        path = Path(out_dir) / f"{stem}{emitter.suffix}"
+        for name, other in paths.items():
+            if other == path:
+                msg = f"Emitters '{name}' and '{emitter.name}' both write '{path}'"
+                raise ValueError(msg)
+        paths[emitter.name] = path
+    return paths
+
+
+def write_target(
+    emitter: Emitter, named_signal_pins: tuple[NamedSignalPins, ...], path: Path
+) -> TargetResult:
+    """Writes one emitter's output file and times it"""
+    start = time.perf_counter()
+    write_output_file(emitter, named_signal_pins, path)
+    return TargetResult(emitter.name, path, time.perf_counter() - start)
+
+
+def build_targets(
+    path: Path,
+    out_dir: Path,
+    targets: Iterable[str] = ("xdc",),
+    jobs: int | None = None,
+    cache_dir: Path | None = None,
+    check_pins: bool = False,
+    check_pinout: bool = False,
+    infer_banks: bool = False,
+    pinout_dir: Path | None = None,
+    namer: PortNamer | None = None,
+) -> list[TargetResult]:
+    """Writes the output of each named emitter for a board file
+
+    Args:
+        path: Path to a YAML or JSON board description
+        out_dir: Directory the output files are written to, as `<stem><suffix>`
+        targets: Names of registered emitters, see `io_gen.emitters.get_emitter`
+        jobs: Number of emitters to run at once, or None for one per target. With
+            1, the emitters run one after the other in the calling thread.
+        cache_dir: Directory that holds cached tables, see `io_gen.cache`
+        check_pins: Refuse to write anything if a package pin is claimed more
+            than once, see `io_gen.validate_pins`
+        check_pinout: Refuse to write anything if a pin does not match the
+            package pinout of the board's part, see `io_gen.validate_pinout`
+        infer_banks: Fill in the banks that signals leave out from the package
+            pinout of the board's part, see `io_gen.infer_banks`
+        pinout_dir: Directory that holds pinout files, see `io_gen.pinout`
+        namer: Names the ports of every target, or None for the default
+            convention, see `io_gen.port_names`
+
+    Returns:
+        One result per target, in the order the targets were given.
+
+    Raises:
+        jsonschema.exceptions.ValidationError: If the board does not conform to the
+            schema
+        ValueError: If a target is unknown, two targets would write the same file,
+            the signal or bank table is invalid, two signals would share a port
+            name, with `check_pins` a package pin is claimed more than once, or
+            with `check_pinout` a pin does not match the package pinout
+        FileNotFoundError: If `check_pinout` or `infer_banks` is set and the part
+            has no pinout
+
+    """
+    path = Path(path)
+    emitters = [get_emitter(name) for name in dict.fromkeys(targets)]
+    paths = get_target_paths(emitters, out_dir, path.stem)
+
+    tables, _ = load_tables(path, cache_dir, infer_banks, pinout_dir)
+    if check_pins:
+        validate_pin_table(tables["pin_table"])
+    if check_pinout:
+        with load_pinout(tables["part"], pinout_dir, cache_dir) as pinout:
+            validate_pinout(tables["signal_table"], tables["pin_table"], pinout)
+    named_signal_pins = freeze_named_signal_pins(
+        tables["signal_table"], tables["pin_table"], namer
+    )
+
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    if jobs == 1 or len(emitters) < 2:
+        return [
+            write_target(emitter, named_signal_pins, paths[emitter.name])
+            for emitter in emitters
+        ]
+
+    with ThreadPoolExecutor(max_workers=jobs or len(emitters)) as pool:
+        futures = [
+            pool.submit(write_target, emitter, named_signal_pins, paths[emitter.name])
+            for emitter in emitters
+        ]
+        return [future.result() for future in futures]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Build several output targets concurrently from one set of tables"
+    )
+    parser.add_argument("board", type=Path)
+    parser.add_argument("-o", "--out-dir", type=Path, default=Path("."))
+    parser.add_argument("-t", "--target", action="append", dest="targets")
+    parser.add_argument("-j", "--jobs", type=int)
+    parser.add_argument("--check-pins", action="store_true")
+    parser.add_argument("--check-pinout", action="store_true")
+    parser.add_argument("--infer-banks", action="store_true")
+    parser.add_argument("--pinout-dir", type=Path)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = build_targets(
+        args.board,
+        args.out_dir,
+        args.targets or ["xdc"],
+        jobs=args.jobs,
+        check_pins=args.check_pins,
+        check_pinout=args.check_pinout,
+        infer_banks=args.infer_banks,
+        pinout_dir=args.pinout_dir,
+    )
+    for result in results:
+        print(f"{result.name:12} {result.seconds * 1e3:8.2f} ms  {result.path}")
+    print(f"{'total':12} {(time.perf_counter() - start) * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
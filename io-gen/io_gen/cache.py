@@ -0,0 +1,300 @@
+"""
+Cache validated signal, bank and pin tables on disk
+
+Validation, signal table extraction and flattening depend only on the bytes of
+the board description, the schema and the io_gen code that processes them. The
+cache here stores the resulting tables as JSON under a key derived from all three
+(the code by a digest of the io_gen sources, not just the version number),
+so a warm run reads one file and goes straight to emission. Entries are written
+atomically, which lets CI jobs on the same host share a cache directory.
+
+With bank inference (see `io_gen.infer_banks`) the tables also depend on the
+package pinout, so those entries record the key of the pinout they were built
+from and are rebuilt when it changes.
+
+The cache lives in `$IO_GEN_CACHE_DIR` if it is set, otherwise in `io_gen` under
+`$XDG_CACHE_HOME` or `~/.cache`, see `io_gen.cache_dir`.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from functools import cache
+from pathlib import Path
+from typing import Any
+
+from io_gen import __version__
+from io_gen.bank_table import extract_bank_table
+from io_gen.cache_dir import get_cache_dir
+from io_gen.incremental import SignalMemo
+from io_gen.infer_banks import infer_board_banks
+from io_gen.loader import is_json_path, parse_board
+from io_gen.pin_table import PinTable, extract_pin_table
+from io_gen.pinout import find_pinout_file, get_pinout_key, load_pinout
+from io_gen.records import make_pin_entry
+from io_gen.schema_bundle import hash_schema_sources
+from io_gen.signal_table import extract_signal_table, restore_signal_entry
+from io_gen.utils import thaw
+from io_gen.validate_banks import validate_bank_table
+from io_gen.validate_signals import validate_signal_table
+from io_gen.validator import validate
+
+# Bumped whenever the layout of a cache entry changes
+CACHE_FORMAT = 2
+
+# Directory of the io_gen sources, see `hash_code_sources`
+CODE_DIR = Path(__file__).parent
+
+
+@cache
+def hash_code_sources() -> str:
+    """Returns a SHA-256 digest over the names and contents of the io_gen sources
+
+    The sources cannot change under a running process, so they are hashed once.
+
+    """
+    digest = hashlib.sha256()
+    for path in sorted(CODE_DIR.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def get_cache_key(
+    source: bytes, json_input: bool = False, infer_banks: bool = False
+) -> str:
+    """Returns the cache key for the raw bytes of a board description
+
+    The key covers the input bytes, how they are parsed, the schema files and the
+    io_gen version and sources, so editing any of them invalidates every entry
+    built from them. Entries built with bank inference are kept apart from those
+    built without.
+
+    """
+    parts = [
+        f"io_gen {__version__} format {CACHE_FORMAT}",
+        "json" if json_input else "yaml",
+        hash_schema_sources(),
+        hash_code_sources(),
+    ]
+    if infer_banks:
+        parts.append("infer banks")
+
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode())
+        digest.update(b"\0")
+    digest.update(source)
+
+    return digest.hexdigest()
+
+
+def build_tables(board: dict[str, Any]) -> dict[str, Any]:
+    """Validates a board and returns its part and its signal, bank and pin tables
+
+    Raises:
+        jsonschema.exceptions.ValidationError: If the board does not conform to the
+            schema
+        ValueError: If the signal or bank table is invalid
+
+    """
+    validate(board)
+
+    signal_table = extract_signal_table(board["signals"])
+    validate_signal_table(signal_table)
+
+    bank_table = extract_bank_table(board.get("banks", {}))
+    validate_bank_table(bank_table)
+
+    return {
+        "part": board["part"],
+        "signal_table": signal_table,
+        "bank_table": bank_table,
+        "pin_table": extract_pin_table(signal_table, bank_table),
+    }
+
+
+def dump_tables(tables: dict[str, Any]) -> dict[str, Any]:
+    """Returns the JSON form of a set of tables, see `restore_tables`"""
+    pin_table = tables["pin_table"]
+    data = {
+        "part": tables["part"],
+        "signal_table": thaw(tables["signal_table"]),
+        "bank_table": dict(tables["bank_table"]),
+        "pin_table": [
+            thaw(pin_table.get_pins_by_signal(signal["name"]))
+            for signal in tables["signal_table"]
+        ],
+    }
+    if "pinout" in tables:
+        data["pinout"] = tables["pinout"]
+    return data
+
+
+def restore_tables(data: dict[str, Any]) -> dict[str, Any]:
+    """Rebuilds the tables from their JSON form
+
+    JSON loses the signal kinds, the integer bank numbers, the read-only pin
+    definitions and the entry records, so all of them are restored here. The pin
+    table is re-indexed from the stored pins rather than flattened again.
+
+    """
+    signal_table = [restore_signal_entry(signal) for signal in data["signal_table"]]
+
+    bank_table = extract_bank_table(
+        {int(bank): entry for bank, entry in data["bank_table"].items()}
+    )
+
+    pin_table = PinTable()
+    for signal, pin_entries in zip(signal_table, data["pin_table"], strict=True):
+        pin_table.add_signal(
+            signal, [make_pin_entry(signal, entry) for entry in pin_entries]
+        )
+
+    tables = {
+        "part": data["part"],
+        "signal_table": signal_table,
+        "bank_table": bank_table,
+        "pin_table": pin_table,
+    }
+    if "pinout" in data:
+        tables["pinout"] = data["pinout"]
+    return tables
+
+
+def read_cache_entry(path: Path) -> dict[str, Any] | None:
+    """Returns the tables stored in a cache entry, or None if it is unusable"""
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            return restore_tables(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write_cache_file(path: Path, data: Any) -> None:
+    """Atomically writes JSON data to a file in the cache"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def get_memo_path(path: Path, cache_dir: Path) -> Path:
+    """Returns where the signal memo for a board file is kept
+
+    Memos are kept per board file, since the indexes in a memo describe the signals
+    of one board.
+
+    """
+    digest = hashlib.sha256(str(Path(path).resolve()).encode()).hexdigest()
+    return Path(cache_dir) / "memo" / f"{digest}.json"
+
+
+def get_memo_version() -> str:
+    """Returns the version stamp that a memo must carry to be reused"""
+    return "/".join(
+        (__version__, str(CACHE_FORMAT), hash_schema_sources(), hash_code_sources())
+    )
+
+
+def read_memo(path: Path) -> SignalMemo:
+    """Returns the signal memo stored at `path`, or an empty one if it is unusable"""
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["version"] == get_memo_version():
+            return SignalMemo.from_json(data["memo"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    return SignalMemo()
+
+
+def write_memo(path: Path, memo: SignalMemo) -> None:
+    """Atomically writes a signal memo, see `read_memo`"""
+    write_cache_file(path, {"version": get_memo_version(), "memo": memo.to_json()})
+
+
+def get_part_pinout_key(part: str, pinout_dir: Path | None = None) -> str:
+    """Returns the key of the current pinout file for a part, see `load_tables`"""
+    return get_pinout_key(find_pinout_file(part, pinout_dir).read_bytes())
+
+
+def load_tables(
+    path: Path,
+    cache_dir: Path | None = None,
+    infer_banks: bool = False,
+    pinout_dir: Path | None = None,
+) -> tuple[dict[str, Any], bool]:
+    """Returns the validated tables for a board file, using the cache if possible
+
+    Args:
+        path: Path to a YAML or JSON board description
+        cache_dir: Directory that holds cached tables, see `get_cache_dir`
+        infer_banks: Fill in missing banks from the package pinout of the board's
+            part before validating it, see `io_gen.infer_banks`
+        pinout_dir: Directory that holds pinout files, see `io_gen.pinout`
+
+    Returns:
+        A dict with the 'part', 'signal_table', 'bank_table' and 'pin_table' of the
+        board, and True if they were read from the cache rather than built. With
+        `infer_banks` the dict also holds the key of the 'pinout' it was built from.
+
+    Raises:
+        jsonschema.exceptions.ValidationError: If the board does not conform to the
+            schema
+        ValueError: If the signal or bank table is invalid
+        FileNotFoundError: If `infer_banks` is set and the part has no pinout
+
+    """
+    path = Path(path)
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+
+    source = path.read_bytes()
+    key = get_cache_key(source, is_json_path(path), infer_banks)
+    entry_path = Path(cache_dir) / f"{key}.json"
+
+    tables = read_cache_entry(entry_path)
+    if tables is not None and (
+        not infer_banks
+        or tables.get("pinout") == get_part_pinout_key(tables["part"], pinout_dir)
+    ):
+        return tables, True
+
+    # Signals that have not changed since the last build of this file are reused
+    memo_path = get_memo_path(path, cache_dir)
+    memo = read_memo(memo_path)
+
+    board, _ = parse_board(source.decode("utf-8"), path)
+
+    # A board without a part is left for validation to reject
+    part = board.get("part") if isinstance(board, dict) else None
+    pinout_key = None
+    if infer_banks and isinstance(part, str):
+        pinout_key = get_part_pinout_key(part, pinout_dir)
+        with load_pinout(part, pinout_dir, cache_dir) as pinout:
+            board = infer_board_banks(board, pinout)
+
+    tables = memo.build_tables(board)
+    if pinout_key is not None:
+        tables["pinout"] = pinout_key
+
+    # A read-only or full cache only costs the next run its warm start
+    try:
+        write_cache_file(entry_path, dump_tables(tables))
+        write_memo(memo_path, memo)
+    except OSError:
+        pass
+
+    return tables, False
@@ -0,0 +1,26 @@
+"""
+Locate the directory that io_gen caches derived data in
+
+Cached tables (see `io_gen.cache`) and indexed package pinouts (see
+`io_gen.pinout`) share one directory. It lives here, apart from both, because
+`io_gen.cache` loads pinouts to infer banks.
+
+The directory is `$IO_GEN_CACHE_DIR` if it is set, otherwise `io_gen` under
+`$XDG_CACHE_HOME` or `~/.cache`.
+"""
+
+import os
+from pathlib import Path
+
+# Environment variable that overrides the cache location
+CACHE_DIR_ENV = "IO_GEN_CACHE_DIR"
+
+
+def get_cache_dir() -> Path:
+    """Returns the directory that holds cached tables and pinout indexes"""
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if cache_dir:
+        return Path(cache_dir)
+
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "io_gen"
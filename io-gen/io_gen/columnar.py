@@ -0,0 +1,291 @@
+"""
+Columnar pin table backed by NumPy arrays
+
+For parts with thousands of IOs the pin table can also be held as columns: one
+integer array per field, with pin names, signal names and the enumerated string
+fields interned into string tables. Checks that span the whole table, such as
+width coverage, duplicate package pins and per-bank counts, then run as vectorized
+array operations instead of Python loops. The table saves to and loads from a
+`.npz` file so downstream tools can read it without running the pipeline.
+
+NumPy is an optional dependency and is only needed by this module.
+"""
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+
+from io_gen.pin_table import PinTable
+from io_gen.records import DiffPinEntry
+from io_gen.validate_pins import PinConflict, PinUse, collect_pin_conflicts
+
+if TYPE_CHECKING:
+    import numpy as np
+else:
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover - exercised only without numpy
+        np = None
+
+# Marks a missing bank or the absent N side of a single-ended pin
+NONE = -1
+
+# Integer columns, one entry per pin or pin pair
+PIN_COLUMNS = ("signal_id", "index", "bank", "pin", "pin_n", "iostandard")
+
+# Integer columns, one entry per signal
+SIGNAL_COLUMNS = ("width", "diff_pair", "buffer", "direction")
+
+# String tables that the integer codes index into
+STRING_TABLES = ("signal_names", "pin_names", "iostandards", "buffers", "directions")
+
+
+def require_numpy() -> None:
+    """Raises ImportError if NumPy is not installed"""
+    if np is None:
+        msg = "The columnar pin table requires numpy (pip install numpy)"
+        raise ImportError(msg)
+
+
+def get_npz_path(path: Path) -> Path:
+    """Returns `path` with a `.npz` suffix added unless it already has one
+
+    NumPy adds the suffix when saving, so `save` and `load` both name the file
+    this way and a table loads from the same path it was saved to.
+
+    """
+    path = Path(path)
+    if path.suffix == ".npz":
+        return path
+    return path.with_name(f"{path.name}.npz")
+
+
+class Interner:
+    """Assigns consecutive integer codes to strings in order of first appearance"""
+
+    def __init__(self, values: Iterable[str] = ()) -> None:
+        self.codes: dict[str, int] = {}
+        self.values: list[str] = []
+        for value in values:
+            self.code(value)
+
+    def code(self, value: str) -> int:
+        """Returns the code for a string, assigning the next code if it is new"""
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(value)
+        return code
+
+
+class ColumnarPinTable:
+    """Pin table stored as NumPy columns with interned strings
+
+    Pin columns have one row per pin or differential pair, in pin table order:
+    `signal_id`, `index` (bit index), `bank` (or -1), `pin` (the package pin, or
+    the P side of a pair), `pin_n` (the N side of a pair, or -1) and `iostandard`.
+    Signal columns have one row per signal: `width`, `diff_pair`, `buffer` and
+    `direction`. Every string-valued column holds codes into the string table of
+    the same name, e.g. `pin` into `pin_names`.
+
+    """
+
+    def __init__(self, columns: dict[str, Any], strings: dict[str, list[str]]) -> None:
+        require_numpy()
+        self.columns = columns
+        self.strings = strings
+
+    def __len__(self) -> int:
+        return len(self.columns["signal_id"])
+
+    @classmethod
+    def from_pin_table(
+        cls, signal_table: Iterable[Mapping[str, Any]], pin_table: PinTable
+    ) -> "ColumnarPinTable":
+        """Builds the columnar form of a pin table and its signal table"""
+        require_numpy()
+
+        signal_names = Interner()
+        pin_names = Interner()
+        iostandards = Interner()
+        buffers = Interner()
+        directions = Interner()
+
+        signal_rows = []
+        pin_rows = []
+        for signal in signal_table:
+            name = signal["name"]
+            signal_id = signal_names.code(name)
+            signal_rows.append(
+                (
+                    signal["width"],
+                    signal["diff_pair"],
+                    buffers.code(signal["buffer"]),
+                    directions.code(signal["direction"]),
+                )
+            )
+
+            for entry in pin_table.get_pins_by_signal(name):
+                bank = pin_table.get_bank(name, entry.index)
+                if isinstance(entry, DiffPinEntry):
+                    pin = pin_names.code(entry.p)
+                    pin_n = pin_names.code(entry.n)
+                else:
+                    pin = pin_names.code(entry.pin)
+                    pin_n = NONE
+                pin_rows.append(
+                    (
+                        signal_id,
+                        entry.index,
+                        NONE if bank is None else bank,
+                        pin,
+                        pin_n,
+                        iostandards.code(entry.iostandard),
+                    )
+                )
+
+        pin_array = np.array(pin_rows, dtype=np.int32).reshape(-1, len(PIN_COLUMNS))
+        signal_array = np.array(signal_rows, dtype=np.int32).reshape(
+            -1, len(SIGNAL_COLUMNS)
+        )
+
+        columns = {name: pin_array[:, i].copy() for i, name in enumerate(PIN_COLUMNS)}
+        for i, name in enumerate(SIGNAL_COLUMNS):
+            columns[name] = signal_array[:, i].copy()
+        columns["diff_pair"] = columns["diff_pair"].astype(bool)
+
+        strings = {
+            "signal_names": signal_names.values,
+            "pin_names": pin_names.values,
+            "iostandards": iostandards.values,
+            "buffers": buffers.values,
+            "directions": directions.values,
+        }
+        return cls(columns, strings)
+
+    def check_widths(self) -> None:
+        """Checks that every signal has exactly the bit indices 0 to width - 1
+
+        Raises:
+            ValueError: If any signal has a missing, repeated or out of range index,
+                naming every such signal
+
+        """
+        signal_id = self.columns["signal_id"]
+        index = self.columns["index"]
+        width = self.columns["width"]
+
+        # Each index must be in range and appear once, so sorting by signal and
+        # then index leaves no two equal neighbours, and the counts match widths
+        bad = np.zeros(len(width), dtype=bool)
+        out_of_range = (index < 0) | (index >= width[signal_id])
+        bad[signal_id[out_of_range]] = True
+
+        order = np.lexsort((index, signal_id))
+        sorted_ids = signal_id[order]
+        sorted_index = index[order]
+        repeated = (sorted_ids[1:] == sorted_ids[:-1]) & (
+            sorted_index[1:] == sorted_index[:-1]
+        )
+        bad[sorted_ids[1:][repeated]] = True
+
+        counts = np.bincount(signal_id, minlength=len(width))
+        bad |= counts != width
+
+        if bad.any():
+            names = [self.strings["signal_names"][i] for i in np.flatnonzero(bad)]
+            msg = f"Signals have index or width mismatches: {', '.join(names)}"
+            raise ValueError(msg)
+
+    def find_duplicate_pins(self) -> list[PinConflict]:
+        """Returns every package pin claimed more than once, in pin table order
+
+        The result is the same as `io_gen.validate_pins.find_pin_conflicts` on the
+        pin table the columns were built from. The repeated pins are found with one
+        `np.unique` over both sides of every pair, and only the rows that use one of
+        them are read back to name their claims.
+
+        """
+        columns = self.columns
+        pin = columns["pin"]
+        pin_n = columns["pin_n"]
+        is_pair = pin_n != NONE
+
+        codes, counts = np.unique(
+            np.concatenate((pin, pin_n[is_pair])), return_counts=True
+        )
+        repeated = codes[counts > 1]
+        if not len(repeated):
+            return []
+
+        signal_names = self.strings["signal_names"]
+        pin_names = self.strings["pin_names"]
+        repeated_codes = set(repeated.tolist())
+        rows = np.flatnonzero(np.isin(pin, repeated) | np.isin(pin_n, repeated))
+
+        claims = []
+        for row in rows.tolist():
+            name = signal_names[columns["signal_id"][row]]
+            index = int(columns["index"][row])
+            if is_pair[row]:
+                sides = (("p", int(pin[row])), ("n", int(pin_n[row])))
+            else:
+                sides = (("pin", int(pin[row])),)
+            claims.extend(
+                (pin_names[code], PinUse(name, index, side))
+                for side, code in sides
+                if code in repeated_codes
+            )
+        return collect_pin_conflicts(claims)
+
+    def count_pins_by_bank(self) -> dict[int, int]:
+        """Returns the number of pins or pin pairs declared in each bank"""
+        bank = self.columns["bank"]
+        banks, counts = np.unique(bank[bank != NONE], return_counts=True)
+        return {int(b): int(c) for b, c in zip(banks, counts)}
+
+    def get_bank_iostandards(self) -> dict[int, list[str]]:
+        """Returns the distinct iostandards used in each bank, sorted by name"""
+        bank = self.columns["bank"]
+        declared = bank != NONE
+
+        # Encode each (bank, iostandard) pair as one integer to deduplicate them
+        count = len(self.strings["iostandards"])
+        pairs = np.unique(
+            bank[declared].astype(np.int64) * count
+            + self.columns["iostandard"][declared]
+        )
+
+        iostandards: dict[int, list[str]] = {}
+        for pair in pairs.tolist():
+            b, code = divmod(pair, count)
+            iostandards.setdefault(b, []).append(self.strings["iostandards"][code])
+        return {b: sorted(names) for b, names in iostandards.items()}
+
+    def save(self, path: Path) -> None:
+        """Writes the table to a `.npz` file, see `load` and `get_npz_path`"""
+        arrays = dict(self.columns)
+        for name in STRING_TABLES:
+            arrays[name] = np.array(self.strings[name], dtype=np.str_)
+        np.savez_compressed(get_npz_path(path), **arrays)
+
+    @classmethod
+    def load(cls, path: Path) -> "ColumnarPinTable":
+        """Reads a table written by `save` to the same path
+
+        Raises:
+            ValueError: If the file is missing a column or string table
+
+        """
+        require_numpy()
+        path = get_npz_path(path)
+        with np.load(path, allow_pickle=False) as data:
+            names = PIN_COLUMNS + SIGNAL_COLUMNS + STRING_TABLES
+            missing = set(names) - set(data.files)
+            if missing:
+                msg = f"Columnar pin table '{path}' is missing {sorted(missing)}"
+                raise ValueError(msg)
+            columns = {name: data[name] for name in PIN_COLUMNS + SIGNAL_COLUMNS}
+            strings = {name: data[name].tolist() for name in STRING_TABLES}
+
+        return cls(columns, strings)
@@ -0,0 +1,569 @@
+"""
+Verilog and VHDL top-level wrappers with explicit IO buffers
+
+The wrapper has the package-side ports of every signal, named as in the XDC
+constraints (`foo_pad`, or `foo_p` and `foo_n` for a differential pair), and the
+matching core-side ports: `foo` for an input or output, and `foo_i`, `foo_o` and
+`foo_t` for an inout. All of them come from `io_gen.port_names`. Each pin is
+connected through the Xilinx primitive for its signal's buffer type, or with a
+plain assignment when the buffer is inferred.
+
+The port list has to come before the buffer instances, so while the ports are
+written out the instances are spooled to a temporary file. That file is copied
+into the output once the port list is complete. Memory use does not grow with
+the size of the board.
+
+Instance names and generate labels share the namespace of the module with its
+ports. Each one is recorded in a `PortNamer` index of the wrapper together with
+the package and core ports, so a name that is used twice raises a ValueError, as
+a port collision does. The VHDL wrapper compares these names without regard to
+case, as VHDL does, and the Verilog wrapper compares them exactly.
+"""
+
+import tempfile
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+from io_gen.emitters import (
+    Emitter,
+    Formatters,
+    NamedSignalPins,
+    SignalPins,
+    register_emitter,
+)
+from io_gen.port_names import (
+    DEFAULT_CONVENTION,
+    PortNamer,
+    SignalPorts,
+    iter_named_signal_pins,
+)
+from io_gen.records import PinRecord
+
+# Name of the generated module or entity
+HDL_TOP_NAME = "io_top"
+
+# Index of the generate loops, which every loop in the module shares. It is
+# recorded with the port names once a loop is emitted, so a port or instance of
+# the same name raises a ValueError.
+HDL_GENVAR = "idx"
+
+# Direction a buffer type implies for its signal
+BUFFER_DIRECTIONS = {
+    "ibuf": "in",
+    "ibufds": "in",
+    "obuf": "out",
+    "obufds": "out",
+    "iobuf": "inout",
+}
+
+# Primitive for each buffer type, by whether the signal is a differential pair
+BUFFER_PRIMITIVES = {
+    ("ibuf", False): "IBUF",
+    ("ibufds", True): "IBUFDS",
+    ("obuf", False): "OBUF",
+    ("obufds", True): "OBUFDS",
+    ("iobuf", False): "IOBUF",
+    ("iobuf", True): "IOBUFDS",
+}
+
+# Primitive ports and the net each one connects to
+PRIMITIVE_PORTS = {
+    "IBUF": (("I", "pad"), ("O", "core")),
+    "IBUFDS": (("I", "p"), ("IB", "n"), ("O", "core")),
+    "OBUF": (("I", "core"), ("O", "pad")),
+    "OBUFDS": (("I", "core"), ("O", "p"), ("OB", "n")),
+    "IOBUF": (("I", "core_i"), ("O", "core_o"), ("T", "core_t"), ("IO", "pad")),
+    "IOBUFDS": (
+        ("I", "core_i"),
+        ("O", "core_o"),
+        ("T", "core_t"),
+        ("IO", "p"),
+        ("IOB", "n"),
+    ),
+}
+
+# Core-side ports of a signal and their direction, by signal direction
+CORE_PORTS = {
+    "in": (("core", "out"),),
+    "out": (("core", "in"),),
+    "inout": (("core_i", "in"), ("core_o", "out"), ("core_t", "in")),
+}
+
+VERILOG_TEMPLATES = {
+    "header": (
+        "// Top-level IO wrapper generated by io_gen",
+        "",
+        "module {module} (",
+    ),
+    "comment": ("    // {comment}",),
+    "port": ("    {direction} wire{range} {port}",),
+    "ports_end": (");", ""),
+    "instance": (
+        "{indent}{primitive} #(",
+        "{parameters}",
+        "{indent}) {instance} (",
+        "{connections}",
+        "{indent});",
+        "",
+    ),
+    "parameter": ("{indent}    .{name}({value})",),
+    "connection": ("{indent}    .{port}({net})",),
+    "genvar": ("    genvar {genvar};", ""),
+    # generate for (i = 0; i <= 7; i = i + 1) begin : g_led
+    "loop_begin": (
+        "    generate",
+        "        for ({genvar} = {first}; {genvar} <= {last}; "
+        "{genvar} = {genvar} + 1) begin : {label}",
+    ),
+    "loop_end": ("        end", "    endgenerate", ""),
+    "assign_in": ("    assign {core} = {pad};",),
+    "assign_out": ("    assign {pad} = {core};",),
+    "assign_inout": (
+        "    assign {pad} = {core_t} ? 1'bz : {core_i};",
+        "    assign {core_o} = {pad};",
+    ),
+    # Separates the assignments of one signal from the next
+    "signal_end": ("",),
+    "footer": ("endmodule",),
+}
+
+VHDL_TEMPLATES = {
+    "header": (
+        "-- Top-level IO wrapper generated by io_gen",
+        "",
+        "library ieee;",
+        "use ieee.std_logic_1164.all;",
+        "",
+        "library unisim;",
+        "use unisim.vcomponents.all;",
+        "",
+        "entity {module} is",
+        "    port (",
+    ),
+    "comment": ("        -- {comment}",),
+    "port": ("        {port} : {direction} {type}",),
+    "ports_end": (
+        "    );",
+        "end entity {module};",
+        "",
+        "architecture structural of {module} is",
+        "begin",
+        "",
+    ),
+    "instance": (
+        "{indent}{instance} : {primitive}",
+        "{indent}    generic map (",
+        "{parameters}",
+        "{indent}    )",
+        "{indent}    port map (",
+        "{connections}",
+        "{indent}    );",
+        "",
+    ),
+    "parameter": ("{indent}        {name} => {value}",),
+    "connection": ("{indent}        {port} => {net}",),
+    # Loop parameters are declared by the loop itself
+    "genvar": (),
+    "loop_begin": ("    {label} : for {genvar} in {first} to {last} generate",),
+    "loop_end": ("    end generate {label};", ""),
+    "assign_in": ("    {core} <= {pad};",),
+    "assign_out": ("    {pad} <= {core};",),
+    "assign_inout": (
+        "    {pad} <= {core_i} when {core_t} = '0' else 'Z';",
+        "    {core_o} <= {pad};",
+    ),
+    "signal_end": ("",),
+    "footer": ("end architecture structural;",),
+}
+
+VERILOG_DIRECTIONS = {"in": "input", "out": "output", "inout": "inout"}
+
+
+def check_hdl_buffer(signal: Mapping[str, Any]) -> None:
+    """Checks that a signal's buffer type suits its direction and pin type
+
+    Raises:
+        ValueError: If the buffer drives the wrong direction, or does not match
+            whether the signal is a differential pair
+
+    """
+    name = signal["name"]
+    buffer = signal["buffer"]
+    direction = signal["direction"]
+
+    if buffer == "infer":
+        if signal["diff_pair"]:
+            msg = f"Signal '{name}' is a differential pair and cannot infer a buffer"
+            raise ValueError(msg)
+        return
+
+    if BUFFER_DIRECTIONS[buffer] != direction:
+        msg = f"Signal '{name}' uses buffer '{buffer}' for direction '{direction}'"
+        raise ValueError(msg)
+    if (buffer, signal["diff_pair"]) not in BUFFER_PRIMITIVES:
+        pin_type = "differential" if signal["diff_pair"] else "single-ended"
+        msg = f"Signal '{name}' uses buffer '{buffer}' for {pin_type} pins"
+        raise ValueError(msg)
+
+
+def get_hdl_nets(ports: SignalPorts) -> dict[str, str]:
+    """Returns the base name of each net of a signal, by role"""
+    return {**ports.package, **ports.core}
+
+
+def get_hdl_ports(
+    signal: Mapping[str, Any], ports: SignalPorts
+) -> list[tuple[str, str]]:
+    """Returns the wrapper ports of a signal and their directions, in order"""
+    nets = get_hdl_nets(ports)
+    direction = signal["direction"]
+
+    pad_roles = ("p", "n") if signal["diff_pair"] else ("pad",)
+    hdl_ports = [(nets[role], direction) for role in pad_roles]
+    hdl_ports.extend(
+        (nets[role], core_direction) for role, core_direction in CORE_PORTS[direction]
+    )
+    return hdl_ports
+
+
+def format_verilog_value(value: Any) -> str:
+    """Returns a parameter value as a Verilog expression"""
+    if isinstance(value, bool):
+        return '"TRUE"' if value else '"FALSE"'
+    if isinstance(value, str):
+        return f'"{value}"'
+    return str(value)
+
+
+def format_vhdl_value(value: Any) -> str:
+    """Returns a generic value as a VHDL expression"""
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, str):
+        return f'"{value}"'
+    return str(value)
+
+
+def format_verilog_port(
+    formatters: Formatters, port: str, direction: str, width: int | None
+) -> str:
+    """Returns one Verilog port declaration"""
+    return formatters["port"](
+        direction=VERILOG_DIRECTIONS[direction],
+        range="" if width is None else f" [{width - 1}:0]",
+        port=port,
+    )
+
+
+def format_vhdl_port(
+    formatters: Formatters, port: str, direction: str, width: int | None
+) -> str:
+    """Returns one VHDL port declaration"""
+    if width is None:
+        port_type = "std_logic"
+    else:
+        port_type = f"std_logic_vector({width - 1} downto 0)"
+    return formatters["port"](direction=direction, type=port_type, port=port)
+
+
+def select_verilog_bit(net: str, index: int | str) -> str:
+    """Returns the Verilog bit select of a vector net"""
+    return f"{net}[{index}]"
+
+
+def select_vhdl_bit(net: str, index: int | str) -> str:
+    """Returns the VHDL index of a vector net"""
+    return f"{net}({index})"
+
+
+@dataclass(frozen=True)
+class HdlSyntax:
+    """How Verilog and VHDL differ beyond their templates
+
+    `fold_case` is set for a language whose names differ only in case collide.
+
+    """
+
+    separator: str
+    loop_indent: str
+    format_port: Callable[[Formatters, str, str, int | None], str]
+    format_value: Callable[[Any], str]
+    select_bit: Callable[[str, int | str], str]
+    fold_case: bool
+
+
+def iter_hdl_body(
+    formatters: Formatters,
+    signal: Mapping[str, Any],
+    pins: Sequence[PinRecord],
+    ports: SignalPorts,
+    syntax: "HdlSyntax",
+    names: PortNamer,
+    loops: bool = True,
+) -> Iterator[str]:
+    """Yields the buffer instances or assignments for the pins of one signal
+
+    With `loops` set, the bits of a bus are instantiated by a generate loop over
+    each run from `get_hdl_loop_runs`, and only a run of one bit gets an instance
+    of its own. Otherwise every bit gets its own instance. Each instance name and
+    loop label is added to `names`, and so is `HDL_GENVAR` if a loop is emitted.
+
+    Raises:
+        ValueError: If an instance name, loop label or the loop index is already
+            used
+
+    """
+    select_bit = syntax.select_bit
+    nets = get_hdl_nets(ports)
+    bus = signal["bus"]
+
+    buffer = signal["buffer"]
+    if buffer == "infer":
+        assign = formatters[f"assign_{signal['direction']}"]
+        for pin in pins:
+            if bus:
+                pin_nets = {
+                    role: select_bit(net, pin.index) for role, net in nets.items()
+                }
+            else:
+                pin_nets = nets
+            yield assign(**pin_nets)
+        yield formatters["signal_end"]()
+        return
+
+    name = signal["name"]
+    primitive = BUFFER_PRIMITIVES[(buffer, signal["diff_pair"])]
+    instance = signal["instance"] or f"{name}_{buffer}"
+
+    if not bus:
+        names.add_owner(instance, name, "instance")
+        yield format_hdl_instance(
+            formatters, syntax, signal, primitive, instance, pins[0], nets, ""
+        )
+        return
+
+    runs = get_hdl_loop_runs(pins) if loops else [[pin] for pin in pins]
+    genvar = HDL_GENVAR
+    for run in runs:
+        first = run[0].index
+        if len(run) == 1:
+            bit_instance = f"{instance}_{first}"
+            names.add_owner(bit_instance, name, "instance")
+            pin_nets = {role: select_bit(net, first) for role, net in nets.items()}
+            yield format_hdl_instance(
+                formatters,
+                syntax,
+                signal,
+                primitive,
+                bit_instance,
+                run[0],
+                pin_nets,
+                "",
+            )
+            continue
+
+        label = f"g_{instance}" if len(run) == len(pins) else f"g_{instance}_{first}"
+        names.add_owner(label, name, "label")
+        names.add_owner(instance, name, "instance")
+        names.add_owner(genvar, genvar, "genvar")
+        last = run[-1].index
+        pin_nets = {role: select_bit(net, genvar) for role, net in nets.items()}
+
+        yield formatters["loop_begin"](
+            genvar=genvar, first=first, last=last, label=label
+        )
+        yield format_hdl_instance(
+            formatters,
+            syntax,
+            signal,
+            primitive,
+            instance,
+            run[0],
+            pin_nets,
+            syntax.loop_indent,
+        )[:-1]
+        yield formatters["loop_end"](label=label)
+
+
+def get_hdl_loop_runs(pins: Sequence[PinRecord]) -> list[list[PinRecord]]:
+    """Splits the pins of a bus into runs that one generate loop can instantiate
+
+    A run is a stretch of consecutive indices with the same iostandard. Buffer type
+    and parameters are shared by every pin of a signal, so a bus whose bits all use
+    one iostandard is a single run. A multibank bus whose fragments use different
+    iostandards gets a run per fragment, while adjacent fragments that agree are
+    merged.
+
+    """
+    runs: list[list[PinRecord]] = []
+    for pin in pins:
+        if (
+            runs
+            and runs[-1][-1].index + 1 == pin.index
+            and runs[-1][-1].iostandard == pin.iostandard
+        ):
+            runs[-1].append(pin)
+        else:
+            runs.append([pin])
+    return runs
+
+
+def format_hdl_instance(
+    formatters: Formatters,
+    syntax: "HdlSyntax",
+    signal: Mapping[str, Any],
+    primitive: str,
+    instance: str,
+    pin: PinRecord,
+    nets: dict[str, str],
+    indent: str,
+) -> str:
+    """Returns one buffer instance connecting `nets`, with the parameters of `pin`"""
+    indent = f"    {indent}"
+    parameter = formatters["parameter"]
+    connection = formatters["connection"]
+    parameters = {"IOSTANDARD": pin.iostandard, **signal["parameters"]}
+
+    return formatters["instance"](
+        indent=indent,
+        primitive=primitive,
+        instance=instance,
+        parameters=",\n".join(
+            parameter(indent=indent, name=name, value=syntax.format_value(value))[:-1]
+            for name, value in parameters.items()
+        ),
+        connections=",\n".join(
+            connection(indent=indent, port=port, net=nets[role])[:-1]
+            for port, role in PRIMITIVE_PORTS[primitive]
+        ),
+    )
+
+
+def iter_hdl(
+    formatters: Formatters,
+    named_signal_pins: Iterable[NamedSignalPins],
+    module: str,
+    syntax: "HdlSyntax",
+    loops: bool = True,
+) -> Iterator[str]:
+    """Yields a wrapper module for every signal and its pins, see the module docs
+
+    See `iter_hdl_body` for `loops`.
+
+    Raises:
+        ValueError: If a port, instance name or loop label is used twice
+
+    """
+    names = PortNamer(replace(DEFAULT_CONVENTION, fold_case=syntax.fold_case))
+    yield formatters["header"](module=module)
+
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as body:
+        # Each port declaration is held back until the next one is known, since
+        # only the last one goes without a separator
+        pending = None
+        for signal, pins, ports in named_signal_pins:
+            check_hdl_buffer(signal)
+
+            comment = signal.get("comment", {}).get("hdl")
+            if comment:
+                if pending is not None:
+                    yield f"{pending[:-1]}{syntax.separator}\n"
+                    pending = None
+                yield formatters["comment"](comment=comment)
+
+            for role, port in get_hdl_nets(ports).items():
+                names.add_owner(port, signal["name"], role)
+
+            width = signal["width"] if signal["bus"] else None
+            for port, direction in get_hdl_ports(signal, ports):
+                if pending is not None:
+                    yield f"{pending[:-1]}{syntax.separator}\n"
+                pending = syntax.format_port(formatters, port, direction, width)
+
+            body.writelines(
+                iter_hdl_body(formatters, signal, pins, ports, syntax, names, loops)
+            )
+
+        if pending is not None:
+            yield pending
+        yield formatters["ports_end"](module=module)
+        # The loop index is only recorded once a loop uses it
+        if names.get_owner(HDL_GENVAR) == (HDL_GENVAR, "genvar"):
+            yield formatters["genvar"](genvar=HDL_GENVAR)
+
+        body.seek(0)
+        yield from body
+
+    yield formatters["footer"](module=module)
+
+
+def iter_verilog(
+    signal_pins: Iterable[SignalPins],
+    module: str = HDL_TOP_NAME,
+    loops: bool = True,
+    namer: PortNamer | None = None,
+) -> Iterator[str]:
+    """Lazily yields a Verilog wrapper module as newline terminated text
+
+    Ports are named by `namer`, or under the default convention if it is None.
+
+    """
+    named_signal_pins = iter_named_signal_pins(signal_pins, namer)
+    return iter_hdl(
+        VERILOG.formatters, named_signal_pins, module, VERILOG_SYNTAX, loops
+    )
+
+
+def iter_vhdl(
+    signal_pins: Iterable[SignalPins],
+    module: str = HDL_TOP_NAME,
+    loops: bool = True,
+    namer: PortNamer | None = None,
+) -> Iterator[str]:
+    """Lazily yields a VHDL wrapper entity as newline terminated text
+
+    See `iter_verilog` for `namer`.
+
+    """
+    named_signal_pins = iter_named_signal_pins(signal_pins, namer)
+    return iter_hdl(VHDL.formatters, named_signal_pins, module, VHDL_SYNTAX, loops)
+
+
+VERILOG_SYNTAX = HdlSyntax(
+    separator=",",
+    loop_indent="        ",
+    format_port=format_verilog_port,
+    format_value=format_verilog_value,
+    select_bit=select_verilog_bit,
+    fold_case=False,
+)
+
+VHDL_SYNTAX = HdlSyntax(
+    separator=";",
+    loop_indent="    ",
+    format_port=format_vhdl_port,
+    format_value=format_vhdl_value,
+    select_bit=select_vhdl_bit,
+    fold_case=True,
+)
+
+
+def emit_verilog(
+    formatters: Formatters, named_signal_pins: Iterable[NamedSignalPins]
+) -> Iterator[str]:
+    """Yields the Verilog wrapper, see `io_gen.emitters.Emitter`"""
+    return iter_hdl(formatters, named_signal_pins, HDL_TOP_NAME, VERILOG_SYNTAX)
+
+
+def emit_vhdl(
+    formatters: Formatters, named_signal_pins: Iterable[NamedSignalPins]
+) -> Iterator[str]:
+    """Yields the VHDL wrapper, see `io_gen.emitters.Emitter`"""
+    return iter_hdl(formatters, named_signal_pins, HDL_TOP_NAME, VHDL_SYNTAX)
+
+
+VERILOG = register_emitter(
+    Emitter("verilog", ".v", VERILOG_TEMPLATES, None, emit_verilog)
+)
+
+VHDL = register_emitter(Emitter("vhdl", ".vhd", VHDL_TEMPLATES, None, emit_vhdl))
@@ -0,0 +1,58 @@
+"""
+Pin report listing every top-level port with its package pin
+
+The report is a CSV file with one row per port, in signal table order, naming the
+signal, bit index, port, package pin and iostandard. Both sides of a differential
+pair get a row of their own. Port names come from `io_gen.port_names`, so they are
+the ones used in the XDC constraints.
+"""
+
+from typing import Any, Iterator, Mapping, Sequence
+
+from io_gen.emitters import Emitter, Formatters, register_emitter
+from io_gen.port_names import SignalPorts
+from io_gen.records import DiffPinEntry, PinRecord
+
+REPORT_TEMPLATES = {
+    "header": ("signal,index,port,pin,iostandard",),
+    "row": ("{name},{index},{port},{pin},{iostandard}",),
+    "diff_rows": (
+        "{name},{index},{port_p},{p},{iostandard}",
+        "{name},{index},{port_n},{n},{iostandard}",
+    ),
+}
+
+
+def render_report(
+    formatters: Formatters,
+    signal: Mapping[str, Any],
+    pins: Sequence[PinRecord],
+    ports: SignalPorts,
+) -> Iterator[str]:
+    """Yields the report rows for one signal, see `io_gen.emitters.Emitter`"""
+    name = signal["name"]
+    diff_rows = formatters["diff_rows"]
+    row = formatters["row"]
+    for pin, port in zip(pins, ports.bits):
+        if isinstance(pin, DiffPinEntry):
+            port_p, port_n = port
+            yield diff_rows(
+                name=name,
+                index=pin.index,
+                port_p=port_p,
+                port_n=port_n,
+                p=pin.p,
+                n=pin.n,
+                iostandard=pin.iostandard,
+            )
+        else:
+            yield row(
+                name=name,
+                index=pin.index,
+                port=port,
+                pin=pin.pin,
+                iostandard=pin.iostandard,
+            )
+
+
+REPORT = register_emitter(Emitter("pins", ".csv", REPORT_TEMPLATES, render_report))
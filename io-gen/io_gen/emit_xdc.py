@@ -1,116 +1,263 @@
-from typing import Any
+from typing import Any, Iterable, Iterator, Mapping, Sequence, TextIO, cast
 
-from io_gen.pin_table import get_pins_by_signal
+from io_gen.emitters import (
+    Emitter,
+    Formatters,
+    iter_output,
+    register_emitter,
+    split_lines,
+)
+from io_gen.pin_table import PinTable
+from io_gen.port_names import (
+    DEFAULT_CONVENTION,
+    NamingConvention,
+    PortNamer,
+    SignalPorts,
+    iter_named_signal_pins,
+)
+from io_gen.records import (
+    DiffPinEntry,
+    PinEntry,
+    PinRecord,
+    as_pin_entries,
+    as_pin_entry,
+)
+
+XDC_TEMPLATES = {
+    "comment": ("# {comment}",),
+    # set_property PACKAGE_PIN A1 [get_ports {steak_sauce_pad}]
+    # set_property IOSTANDARD LVCMOS33 [get_ports {steak_sauce_pad}]
+    "single": (
+        "set_property PACKAGE_PIN {pin} [get_ports {{{port}}}]",
+        "set_property IOSTANDARD {iostandard} [get_ports {{{port}}}]",
+    ),
+    # set_property PACKAGE_PIN A1 [get_ports {steak_sauce_p}]
+    # set_property IOSTANDARD LVDS_25 [get_ports {steak_sauce_p}]
+    # set_property PACKAGE_PIN A2 [get_ports {steak_sauce_n}]
+    # set_property IOSTANDARD LVDS_25 [get_ports {steak_sauce_n}]
+    "diff": (
+        "set_property PACKAGE_PIN {p} [get_ports {{{port_p}}}]",
+        "set_property IOSTANDARD {iostandard} [get_ports {{{port_p}}}]",
+        "set_property PACKAGE_PIN {n} [get_ports {{{port_n}}}]",
+        "set_property IOSTANDARD {iostandard} [get_ports {{{port_n}}}]",
+    ),
+    # Finish the signal text with an empty line
+    "end": ("",),
+}
+
+XDC_COMPACT_TEMPLATES = {
+    "comment": XDC_TEMPLATES["comment"],
+    # set_property -dict {PACKAGE_PIN A1 IOSTANDARD LVCMOS33} [get_ports {a_pad}]
+    "port": (
+        "set_property -dict {{PACKAGE_PIN {pin} IOSTANDARD {iostandard}}} "
+        "[get_ports {{{port}}}]",
+    ),
+    "end": XDC_TEMPLATES["end"],
+}
 
 
 def emit_xdc(
-    signal_table: list[dict[str, Any]], pin_table: list[dict[str, Any]]
+    signal_table: Iterable[Mapping[str, Any]],
+    pin_table: PinTable,
+    compact: bool = False,
+    namer: PortNamer | None = None,
 ) -> list[str]:
-    """Constructs XDC constraints from signal table and flattend pin table"""
+    """Constructs XDC constraints from signal table and flattend pin table
+
+    With `compact` set, the constraints are written in the shorter form produced by
+    `emit_xdc_compact`. See `iter_xdc` for `namer`.
 
-    output_xdc = []
+    """
 
     # Iterate over the signal table by signal name
-    for signal in signal_table:
-        sig_name = signal["name"]
-        pins = get_pins_by_signal(sig_name, pin_table)
+    signal_pins = (
+        (signal, pin_table.get_pins_by_signal(signal["name"]))
+        for signal in signal_table
+    )
+    return list(iter_xdc(signal_pins, compact, namer))
 
-        # Start the signal with the XDC comment
-        xdc_comment = get_xdc_comment(signal)
-        if xdc_comment:
-            output_xdc.append(xdc_comment)
 
-        if signal["diff_pair"]:
-            output_xdc.extend(emit_xdc_diff(pins))
-        else:
-            output_xdc.extend(emit_xdc_single(pins))
+def iter_xdc(
+    signal_pins: Iterable[tuple[Mapping[str, Any], Iterable[Mapping[str, Any]]]],
+    compact: bool = False,
+    namer: PortNamer | None = None,
+) -> Iterator[str]:
+    """Lazily yields XDC lines for each signal and its pins in index order
 
-        # Finish the signal text with an empty line
-        output_xdc.append("")
+    Pins may be pin records or plain dicts, see `io_gen.records.as_pin_entry`.
+    Ports are named by `namer`, or under the default
+    `io_gen.port_names.NamingConvention` if it is None.
 
-    return output_xdc
+    Raises:
+        ValueError: If two signals would share a port name
 
+    """
+    named_signal_pins = iter_named_signal_pins(signal_pins, namer)
+    return split_lines(iter_output(get_xdc_emitter(compact), named_signal_pins))
 
-def emit_xdc_single(pins: list[dict[str, Any]]) -> list[str]:
-    """Returns a list of pin constraints for singled ended signals"""
-    xdc_lines = []
-    for pin in sorted(pins, key=lambda entry: entry["index"]):
-        # set_property PACKAGE_PIN A1 [get_ports {steak_sauce_pad}]
-        port_name = get_xdc_single_port_name(pin)
-        pkg_pin_str = (
-            f"set_property PACKAGE_PIN {pin['pin']} [get_ports {{{port_name}}}]"
-        )
-        xdc_lines.append(pkg_pin_str)
 
-        # set_property IOSTANDARD LVCMOS33 [get_ports {steak_sauce_pad}]
-        iostandard = get_xdc_iostandard(pin)
-        iostandard_str = (
-            f"set_property IOSTANDARD {iostandard} [get_ports {{{port_name}}}]"
-        )
-        xdc_lines.append(iostandard_str)
-
-    return xdc_lines
-
-
-def emit_xdc_diff(pins: list[dict[str, Any]]) -> list[str]:
-    """Returns a list of pin constraints for diff signals"""
-    xdc_lines = []
-    for pin in sorted(pins, key=lambda entry: entry["index"]):
-        # set_property PACKAGE_PINS A1 [get_port {steak_sauce_p}]
-        # set_property PACKAGE_PINS A2 [get_port {steak_sauce_n}]
-        port_p, port_n = get_xdc_port_names_diff(pin)
-        pkg_pin_p_str = f"set_property PACKAGE_PIN {pin['p']} [get_ports {{{port_p}}}]"
-        pkg_pin_n_str = f"set_property PACKAGE_PIN {pin['n']} [get_ports {{{port_n}}}]"
-
-        # set_property IOSTANDARD LVCMOS33 [get_ports {steak_sauce_p}]
-        # set_property IOSTANDARD LVCMOS33 [get_ports {steak_sauce_n}]
-        iostandard = get_xdc_iostandard(pin)
-        iostandard_str_p = (
-            f"set_property IOSTANDARD {iostandard} [get_ports {{{port_p}}}]"
-        )
-        iostandard_str_n = (
-            f"set_property IOSTANDARD {iostandard} [get_ports {{{port_n}}}]"
-        )
+def iter_xdc_signal(
+    signal: Mapping[str, Any],
+    pins: Iterable[Mapping[str, Any]],
+    compact: bool = False,
+) -> Iterator[str]:
+    """Yields the XDC lines for one signal"""
+    return iter_xdc([(signal, pins)], compact)
+
+
+def write_xdc(lines: Iterable[str], stream: TextIO) -> None:
+    """Writes XDC lines to a text stream, one per line, as they are produced"""
+    stream.writelines(f"{line}\n" for line in lines)
+
 
-        xdc_lines.append(pkg_pin_p_str)
-        xdc_lines.append(iostandard_str_p)
-        xdc_lines.append(pkg_pin_n_str)
-        xdc_lines.append(iostandard_str_n)
+def get_xdc_emitter(compact: bool = False) -> Emitter:
+    """Returns the registered XDC emitter, or its compact form"""
+    return XDC_COMPACT if compact else XDC
 
-    return xdc_lines
 
+def render_xdc(
+    formatters: Formatters,
+    signal: Mapping[str, Any],
+    pins: Sequence[PinRecord],
+    ports: SignalPorts,
+) -> Iterator[str]:
+    """Yields the XDC text for one signal, see `io_gen.emitters.Emitter`"""
 
-def get_xdc_comment(signal: dict[str, Any]) -> str | None:
-    """Return XDC comment string if present, else None."""
+    # Start the signal with the XDC comment
     comment = signal.get("comment", {}).get("xdc")
-    return f"# {comment}" if comment else None
+    if comment:
+        yield formatters["comment"](comment=comment)
 
+    if signal["diff_pair"]:
+        yield from iter_xdc_diff(formatters, cast(Sequence[DiffPinEntry], pins), ports)
+    else:
+        yield from iter_xdc_single(formatters, cast(Sequence[PinEntry], pins), ports)
+
+    yield formatters["end"]()
+
+
+def render_xdc_compact(
+    formatters: Formatters,
+    signal: Mapping[str, Any],
+    pins: Sequence[PinRecord],
+    ports: SignalPorts,
+) -> Iterator[str]:
+    """Yields the compact XDC text for one signal, see `emit_xdc_compact`"""
+    comment = signal.get("comment", {}).get("xdc")
+    if comment:
+        yield formatters["comment"](comment=comment)
 
-# Port name formatting is handled by a dedicated helper function.
-# This cleanly encapsulates the logic for whether to emit `foo` or `foo[0]`,
-# based on the `bus` flag. It avoids cluttering the emitter with conditionals,
-# and handles degenerate 1-bit buses in a centralized, consistent way.
+    yield from iter_xdc_compact(formatters, signal, pins, ports)
 
+    yield formatters["end"]()
+
+
+def iter_xdc_single(
+    formatters: Formatters, pins: Sequence[PinEntry], ports: SignalPorts
+) -> Iterator[str]:
+    """Yields the constraint text for single ended pins in index order"""
+    single = formatters["single"]
+    for pin, port in zip(pins, ports.bits):
+        yield single(pin=pin.pin, port=port, iostandard=pin.iostandard)
+
+
+def iter_xdc_diff(
+    formatters: Formatters, pins: Sequence[DiffPinEntry], ports: SignalPorts
+) -> Iterator[str]:
+    """Yields the constraint text for diff pins already in index order"""
+    diff = formatters["diff"]
+    for pin, (port_p, port_n) in zip(pins, ports.bits):
+        yield diff(
+            p=pin.p,
+            n=pin.n,
+            port_p=port_p,
+            port_n=port_n,
+            iostandard=pin.iostandard,
+        )
 
-def get_xdc_single_port_name(pin: dict[str, Any]) -> str:
+
+def iter_xdc_compact(
+    formatters: Formatters,
+    signal: Mapping[str, Any],
+    pins: Sequence[PinRecord],
+    ports: SignalPorts,
+) -> Iterator[str]:
+    """Yields the compact constraint text for the pins of one signal"""
+    port_format = formatters["port"]
+    for pin, port in zip(pins, ports.bits):
+        if isinstance(pin, DiffPinEntry):
+            port_p, port_n = port
+            yield port_format(pin=pin.p, iostandard=pin.iostandard, port=port_p)
+            yield port_format(pin=pin.n, iostandard=pin.iostandard, port=port_n)
+        else:
+            yield port_format(pin=pin.pin, iostandard=pin.iostandard, port=port)
+
+
+def emit_xdc_single(pins: Sequence[Mapping[str, Any]]) -> list[str]:
+    """Returns a list of pin constraints for single ended pins in index order"""
+    # Pin entries carry the name and bus flag of their signal
+    if not pins:
+        return []
+    records = cast(Sequence[PinEntry], as_pin_entries(pins))
+    ports = PortNamer().name_signal(records[0], records)
+    return list(split_lines(iter_xdc_single(XDC.formatters, records, ports)))
+
+
+def emit_xdc_diff(pins: Sequence[Mapping[str, Any]]) -> list[str]:
+    """Returns a list of pin constraints for diff pins already in index order"""
+    if not pins:
+        return []
+    records = cast(Sequence[DiffPinEntry], as_pin_entries(pins))
+    ports = PortNamer().name_signal(records[0], records)
+    return list(split_lines(iter_xdc_diff(XDC.formatters, records, ports)))
+
+
+def emit_xdc_compact(
+    signal: Mapping[str, Any], pins: Iterable[Mapping[str, Any]]
+) -> list[str]:
+    """Returns the constraints for one signal in compact form
+
+    Every port, and each bit of a bus, gets both of its properties from a single
+    `set_property -dict` line, so a port costs one `get_ports` query instead of
+    two. Grouping ports that share an IOSTANDARD into one list would not save any
+    more, since each port still needs a PACKAGE_PIN of its own.
+
+    """
+    records = as_pin_entries(pins)
+    ports = PortNamer().name_signal(signal, records)
+    return list(
+        split_lines(iter_xdc_compact(XDC_COMPACT.formatters, signal, records, ports))
+    )
+
+
+# Port names come from `io_gen.port_names`, which every emitter shares. The
+# helpers below name a single pin through a `PortNamer`, for callers that have a
+# pin entry rather than a whole signal.
+
+
+def get_xdc_single_port_name(
+    pin: Mapping[str, Any], convention: NamingConvention = DEFAULT_CONVENTION
+) -> str:
     """Return the port name for a single-ended pin"""
-    base = f"{pin['name']}_pad"
-    if pin["bus"]:
-        return f"{base}[{pin['index']}]"
-    else:
-        return f"{base}"
+    record = as_pin_entry(pin)
+    return PortNamer(convention).name_signal(record, [record]).bits[0]
 
 
-def get_xdc_port_names_diff(pin: dict[str, Any]) -> tuple[str, str]:
+def get_xdc_port_names_diff(
+    pin: Mapping[str, Any], convention: NamingConvention = DEFAULT_CONVENTION
+) -> tuple[str, str]:
     """Return the port names for a differential pair"""
-    base_p = f"{pin['name']}_p"
-    base_n = f"{pin['name']}_n"
-    if pin["bus"]:
-        return f"{base_p}[{pin['index']}]", f"{base_n}[{pin['index']}]"
-    else:
-        return base_p, base_n
+    record = as_pin_entry(pin)
+    return PortNamer(convention).name_signal(record, [record]).bits[0]
 
 
-def get_xdc_iostandard(pin: dict[str, Any]) -> str:
+def get_xdc_iostandard(pin: Mapping[str, Any]) -> str:
     """Return the IOSTANDARD property for the pin or pin pair"""
     return pin["iostandard"]
+
+
+XDC = register_emitter(Emitter("xdc", ".xdc", XDC_TEMPLATES, render_xdc))
+
+XDC_COMPACT = register_emitter(
+    Emitter("xdc-compact", ".xdc", XDC_COMPACT_TEMPLATES, render_xdc_compact)
+)
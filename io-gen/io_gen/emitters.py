@@ -0,0 +1,200 @@
+"""
+Registry of output emitters built from precompiled line templates
+
+Each output format is an `Emitter`: a name, the suffix of the files it writes, the
+line templates it formats and a `render` function that picks the templates for
+one signal and its pins. The templates use `str.format` syntax and are declared
+once per emitter. When the emitter is created, each group of templates is compiled
+into one f-string function that formats the whole group in a single call. Output
+is produced in one pass over the signal and pin tables and written to a stream
+with `writelines`.
+
+The built-in emitters register themselves when their modules are imported, which
+`get_emitter` does on first use.
+"""
+
+import importlib
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from string import Formatter
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence, TextIO
+
+from io_gen.port_names import SignalPorts
+from io_gen.records import PinRecord
+
+# Modules that register the built-in emitters
+BUILTIN_EMITTER_MODULES = (
+    "io_gen.emit_xdc",
+    "io_gen.emit_report",
+    "io_gen.emit_hdl",
+)
+
+# Size of the write buffer used when writing output to a file
+WRITE_BUFFER_SIZE = 1 << 16
+
+# Every registered emitter, by name
+EMITTERS: dict[str, "Emitter"] = {}
+
+SignalPins = tuple[Mapping[str, Any], Sequence[PinRecord]]
+NamedSignalPins = tuple[Mapping[str, Any], Sequence[PinRecord], SignalPorts]
+Formatters = dict[str, Callable[..., str]]
+
+
+def compile_template(lines: Iterable[str]) -> Callable[..., str]:
+    """Compiles line templates into a function that formats all of them at once
+
+    The function takes the template fields as keyword arguments, ignoring any it
+    does not use, and returns the formatted lines each followed by a newline.
+
+    Raises:
+        ValueError: If a field is not a plain name or has a nested replacement field
+
+    """
+    source = "".join(f"{line}\n" for line in lines)
+
+    fields = []
+    for _, name, spec, _ in Formatter().parse(source):
+        if name is None:
+            continue
+        if not name.isidentifier() or (spec and "{" in spec):
+            msg = f"Template field '{name}' must be a plain name: {source!r}"
+            raise ValueError(msg)
+        if name not in fields:
+            fields.append(name)
+
+    # Template and f-string syntax agree for plain fields, so the template can be
+    # used as the body of an f-string as it is
+    params = "".join(f"{name}, " for name in fields)
+    code = f"lambda {'*, ' if fields else ''}{params}**_: f{source!r}"
+    return eval(compile(code, "<template>", "eval"), {})
+
+
+@dataclass(frozen=True)
+class Emitter:
+    """One output format
+
+    Most emitters give a `render` function and write each signal's output in
+    turn. An output that is not one block per signal, such as an HDL module whose
+    port list precedes its buffer instances, gives an `emit` function instead,
+    which is handed the whole stream of signals and pins.
+
+    Emitters take each signal with its pins and its port names, as produced by
+    `io_gen.port_names.iter_named_signal_pins`, and never build port names of
+    their own.
+
+    Attributes:
+        name: Name the emitter is registered under
+        suffix: Suffix of the files it writes, e.g. '.xdc'
+        templates: Groups of line templates, by name. A 'header' group, if there
+            is one, is written once before the first signal.
+        render: Returns the output for one signal and its pins, as newline
+            terminated text, given the compiled `formatters`, the signal table
+            entry, its pin table entries in index order and its port names
+        emit: Returns the whole output as newline terminated text, given the
+            compiled `formatters` and every signal with its pins and port names
+        formatters: One compiled function per template group, see
+            `compile_template`
+
+    """
+
+    name: str
+    suffix: str
+    templates: Mapping[str, tuple[str, ...]]
+    render: Callable[..., Iterable[str]] | None
+    emit: Callable[[Formatters, Iterable[NamedSignalPins]], Iterable[str]] | None = None
+    formatters: Formatters = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if (self.render is None) == (self.emit is None):
+            msg = f"Emitter '{self.name}' needs exactly one of render and emit"
+            raise ValueError(msg)
+
+        formatters = {
+            name: compile_template(lines) for name, lines in self.templates.items()
+        }
+        object.__setattr__(self, "formatters", formatters)
+
+
+def register_emitter(emitter: Emitter) -> Emitter:
+    """Adds an emitter to the registry and returns it
+
+    Raises:
+        ValueError: If another emitter is already registered under the same name
+
+    """
+    if emitter.name in EMITTERS:
+        msg = f"Emitter '{emitter.name}' is already registered"
+        raise ValueError(msg)
+    EMITTERS[emitter.name] = emitter
+    return emitter
+
+
+def get_emitter(name: str) -> Emitter:
+    """Returns the emitter registered under `name`
+
+    Raises:
+        ValueError: If no emitter is registered under that name
+
+    """
+    for module in BUILTIN_EMITTER_MODULES:
+        importlib.import_module(module)
+
+    emitter = EMITTERS.get(name)
+    if emitter is None:
+        msg = f"Unknown emitter '{name}' (available: {', '.join(sorted(EMITTERS))})"
+        raise ValueError(msg)
+    return emitter
+
+
+def iter_output(
+    emitter: Emitter, named_signal_pins: Iterable[NamedSignalPins]
+) -> Iterator[str]:
+    """Lazily yields the newline terminated output for each signal and its pins"""
+    formatters = emitter.formatters
+    if emitter.emit is not None:
+        yield from emitter.emit(formatters, named_signal_pins)
+        return
+
+    # Every emitter has exactly one of render and emit
+    render = emitter.render
+    assert render is not None
+    if "header" in formatters:
+        yield formatters["header"]()
+    for signal, pins, ports in named_signal_pins:
+        yield from render(formatters, signal, pins, ports)
+
+
+def write_output(
+    emitter: Emitter, named_signal_pins: Iterable[NamedSignalPins], stream: TextIO
+) -> None:
+    """Writes the output for each signal and its pins to a text stream"""
+    stream.writelines(iter_output(emitter, named_signal_pins))
+
+
+def write_output_file(
+    emitter: Emitter, named_signal_pins: Iterable[NamedSignalPins], path: Path
+) -> None:
+    """Writes the output for each signal and its pins to a file through a buffer
+
+    Output goes to a temporary file next to `path` that replaces it only once every
+    signal has been written, so an error part way through never leaves a truncated
+    file behind.
+
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            write_output(emitter, named_signal_pins, f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def split_lines(chunks: Iterable[str]) -> Iterator[str]:
+    """Yields the lines of newline terminated text, without their newlines"""
+    for chunk in chunks:
+        yield from chunk.split("\n")[:-1]
@@ -1,19 +1,18 @@
-from typing import Any
+from typing import Any, Mapping, Sequence
 
 from io_gen.bank_table import get_bank_iostandard
+from io_gen.records import DiffPinEntry, PinEntry, PinRecord
+from io_gen.utils import check_index_coverage, get_index_runs
 
 
 def flatten_scalar_pins(
-    signal: dict[str, Any], bank_table: dict[int, dict[str, Any]]
-) -> list[dict[str, Any]]:
+    signal: Mapping[str, Any], bank_table: Mapping[int, Mapping[str, Any]]
+) -> list[PinEntry]:
     """Flattens a signal into a list of pins"""
     assert "pins" in signal, f"Signal '{signal['name']}' is not a single-ended signal"
 
-    entry = get_pin_table_entry(signal)
-    entry["index"] = 0
-    entry["pin"] = signal["pins"]
-    entry["iostandard"] = resolve_iostandard(signal, bank_table)
-    pin_table_entries = [entry]
+    iostandard = resolve_iostandard(signal, bank_table)
+    pin_table_entries = [PinEntry(signal, 0, signal["pins"], iostandard)]
 
     check_flattened_width(signal, pin_table_entries)
 
@@ -21,35 +20,30 @@ def flatten_scalar_pins(
 
 
 def flatten_array_pins(
-    signal: dict[str, Any], bank_table: dict[int, dict[str, Any]]
-) -> list[dict[str, Any]]:
+    signal: Mapping[str, Any], bank_table: Mapping[int, Mapping[str, Any]]
+) -> list[PinEntry]:
     """Flattens a signal into a list of pins"""
     assert "pins" in signal, f"Signal '{signal['name']}' is not an array of pins"
 
+    # Every pin of the signal shares the same resolved iostandard
+    iostandard = resolve_iostandard(signal, bank_table)
     pin_table_entries = []
     for index, pin in enumerate(signal["pins"]):
-        entry = get_pin_table_entry(signal)
-        entry["index"] = index
-        entry["pin"] = pin
-        entry["iostandard"] = resolve_iostandard(signal, bank_table)
-        pin_table_entries.append(entry)
+        pin_table_entries.append(PinEntry(signal, index, pin, iostandard))
     check_flattened_width(signal, pin_table_entries)
 
     return pin_table_entries
 
 
 def flatten_scalar_pinset(
-    signal: dict[str, Any], bank_table: dict[int, dict[str, Any]]
-) -> list[dict[str, Any]]:
+    signal: Mapping[str, Any], bank_table: Mapping[int, Mapping[str, Any]]
+) -> list[DiffPinEntry]:
     """Flattens a signal into a list of pin pairs"""
     assert signal["diff_pair"], f"Signal '{signal['name']}' is not a differential pair"
 
-    entry = get_pin_table_entry(signal)
-    entry["index"] = 0
-    entry["p"] = signal["pinset"]["p"]
-    entry["n"] = signal["pinset"]["n"]
-    entry["iostandard"] = resolve_iostandard(signal, bank_table)
-    pin_table_entries = [entry]
+    pinset = signal["pinset"]
+    iostandard = resolve_iostandard(signal, bank_table)
+    pin_table_entries = [DiffPinEntry(signal, 0, pinset["p"], pinset["n"], iostandard)]
 
     check_flattened_width(signal, pin_table_entries)
 
@@ -57,21 +51,18 @@ def flatten_scalar_pinset(
 
 
 def flatten_array_pinset(
-    signal: dict[str, Any], bank_table: dict[int, dict[str, Any]]
-) -> list[dict[str, Any]]:
+    signal: Mapping[str, Any], bank_table: Mapping[int, Mapping[str, Any]]
+) -> list[DiffPinEntry]:
     """Flattens a signal into a list of pin pairs"""
     assert signal["diff_pair"], f"Signal '{signal['name']}' is not a differential pair"
 
+    # Every pair of the signal shares the same resolved iostandard
+    iostandard = resolve_iostandard(signal, bank_table)
     pin_table_entries = []
     for index, (pin_p, pin_n) in enumerate(
         zip(signal["pinset"]["p"], signal["pinset"]["n"])
     ):
-        entry = get_pin_table_entry(signal)
-        entry["index"] = index
-        entry["p"] = pin_p
-        entry["n"] = pin_n
-        entry["iostandard"] = resolve_iostandard(signal, bank_table)
-        pin_table_entries.append(entry)
+        pin_table_entries.append(DiffPinEntry(signal, index, pin_p, pin_n, iostandard))
 
     check_flattened_width(signal, pin_table_entries)
 
@@ -79,8 +70,8 @@ def flatten_array_pinset(
 
 
 def flatten_multibank_pins(
-    signal: dict[str, Any], bank_table: dict[int, dict[str, Any]]
-) -> list[dict[str, Any]]:
+    signal: Mapping[str, Any], bank_table: Mapping[int, Mapping[str, Any]]
+) -> list[PinEntry]:
     name = signal["name"]
 
     assert "multibank" in signal, f"Signal '{name}' is not a multibank signal"
@@ -96,7 +87,7 @@ def flatten_multibank_pins(
         # otherwise, we use whatever the fragment provides (and every fragment has
         # to provide a bank)
         if signal_iostandard is None:
-            iostandard = resolve_iostandard_multibank(fragment, bank_table)
+            iostandard = resolve_iostandard_multibank(fragment, bank_table, name)
         else:
             iostandard = signal_iostandard
 
@@ -105,11 +96,7 @@ def flatten_multibank_pins(
 
         # Handle single pins first
         if isinstance(pins, str):
-            entry = get_pin_table_entry(signal)
-            entry["pin"] = pins
-            entry["index"] = offset
-            entry["iostandard"] = iostandard
-            pin_table_entries.append(entry)
+            pin_table_entries.append(PinEntry(signal, offset, pins, iostandard))
 
         # Now handle pin arrays
         else:
@@ -117,11 +104,7 @@ def flatten_multibank_pins(
                 # The validation step will guarantee that both p and n elements are the same
                 # type, but we still need to validate that the lengths are the same and account
                 # for different types (list vs. strings)
-                entry = get_pin_table_entry(signal)
-                entry["pin"] = pin
-                entry["index"] = index
-                entry["iostandard"] = iostandard
-                pin_table_entries.append(entry)
+                pin_table_entries.append(PinEntry(signal, index, pin, iostandard))
 
     check_flattened_width(signal, pin_table_entries)
 
@@ -129,8 +112,8 @@ def flatten_multibank_pins(
 
 
 def flatten_multibank_pinset(
-    signal: dict[str, Any], bank_table: dict[int, dict[str, Any]]
-) -> list[dict[str, Any]]:
+    signal: Mapping[str, Any], bank_table: Mapping[int, Mapping[str, Any]]
+) -> list[DiffPinEntry]:
     name = signal["name"]
 
     assert "multibank" in signal, f"Signal '{name}' is not a multibank signal"
@@ -146,7 +129,7 @@ def flatten_multibank_pinset(
         # otherwise, we use whatever the fragment provides (and every fragment has
         # to provide a bank)
         if signal_iostandard is None:
-            iostandard = resolve_iostandard_multibank(fragment, bank_table)
+            iostandard = resolve_iostandard_multibank(fragment, bank_table, name)
         else:
             iostandard = signal_iostandard
 
@@ -155,21 +138,13 @@ def flatten_multibank_pinset(
 
         # Handle single pin pairs first
         if isinstance(pinset["p"], str) and isinstance(pinset["n"], str):
-            entry = get_pin_table_entry(signal)
-            entry["p"] = pinset["p"]
-            entry["n"] = pinset["n"]
-            entry["index"] = offset
-            entry["iostandard"] = iostandard
+            entry = DiffPinEntry(signal, offset, pinset["p"], pinset["n"], iostandard)
             pin_table_entries.append(entry)
         else:
             for index, (p_pin, n_pin) in enumerate(
                 zip(pinset["p"], pinset["n"]), offset
             ):
-                entry = get_pin_table_entry(signal)
-                entry["p"] = p_pin
-                entry["n"] = n_pin
-                entry["index"] = index
-                entry["iostandard"] = iostandard
+                entry = DiffPinEntry(signal, index, p_pin, n_pin, iostandard)
                 pin_table_entries.append(entry)
 
     check_flattened_width(signal, pin_table_entries)
@@ -178,36 +153,37 @@ def flatten_multibank_pinset(
 
 
 def resolve_iostandard(
-    signal: dict[str, Any], bank_table: dict[int, dict[str, Any]]
+    signal: Mapping[str, Any], bank_table: Mapping[int, Mapping[str, Any]]
 ) -> str:
-    """Resolves the iostandard for a signal via inheritance or direct specification"""
-    name = signal["name"]
+    """Resolves the iostandard for a signal via inheritance or direct specification
+
+    Raises:
+        ValueError: If the signal inherits from a bank that is not in the bank table
 
-    # Try to set iostandard explicitly
+    """
+    # Try to set iostandard explicitly, otherwise get it from the bank table
     iostandard = signal.get("iostandard")
     if iostandard is None:
-        # Try to get it from the bank table - this should be there if we're validated
-        bank: int = signal["bank"]
-        iostandard = get_bank_iostandard(bank, bank_table)
-        if iostandard is None:
-            msg = f"Cannot set 'iostandard' for signal '{name}'"
-            raise ValueError(msg)
-        else:
-            return iostandard
-    else:
-        return iostandard
+        iostandard = get_bank_iostandard(signal["bank"], bank_table, signal["name"])
+    return iostandard
 
 
 def resolve_iostandard_multibank(
-    fragment: dict[str, Any], bank_table: dict[int, dict[str, Any]]
+    fragment: dict[str, Any],
+    bank_table: Mapping[int, Mapping[str, Any]],
+    name: str | None = None,
 ) -> str:
-    """Resolves the iostandard for a bank fragment via inheritance or direct specification"""
+    """Resolves a bank fragment's iostandard via inheritance or direct specification
+
+    Raises:
+        ValueError: If the fragment inherits from a bank that is not in the bank table
+
+    """
 
     # Is it defined explicitly?
     if "iostandard" not in fragment:
         # No, so try to inherit from the bank
-        bank = fragment["bank"]
-        iostandard = get_bank_iostandard(bank, bank_table)
+        iostandard = get_bank_iostandard(fragment["bank"], bank_table, name)
     # This fragment specifies its iostandard explicitly
     else:
         iostandard = fragment["iostandard"]
@@ -216,39 +192,13 @@ def resolve_iostandard_multibank(
 
 
 def check_flattened_width(
-    signal: dict[str, Any], pin_entries: list[dict[str, Any]]
+    signal: Mapping[str, Any], pin_entries: Sequence[PinRecord]
 ) -> None:
-    """Checks that flattened pin entries have the appropriate width and range"""
-
-    actual_indices = sorted(entry["index"] for entry in pin_entries)
-    expected_indices = list(range(0, signal["width"]))
-
-    if actual_indices != expected_indices:
-        msg = (
-            f"Signal '{signal['name']}' has index or width mismatch: "
-            f"expected {expected_indices}, but got {actual_indices}"
-        )
-        raise ValueError(msg)
-
-
-def get_pin_table_entry(signal: dict[str, Any]) -> dict[str, Any]:
-    """Returns a minimal pin table entry with name, direction, buffer, and iostandard
-
-    Args:
-        signal - Entry from the signal table to use as a starting point for a pin table entry
-        bank_table - Bank table
+    """Checks that flattened pin entries have the appropriate width and range
 
-    Returns:
-        dict
+    Pins arrive in runs of consecutive indices (one run per fragment for multibank
+    signals), so only the runs are checked rather than every index.
 
     """
-    # Every entry in the pin table will get these values directly fro the signal its a part of
-    entry = {
-        "name": signal["name"],
-        "direction": signal["direction"],
-        "buffer": signal["buffer"],
-        "diff_pair": signal["diff_pair"],
-        "bus": signal["bus"],
-    }
-
-    return entry
+    runs = get_index_runs(entry.index for entry in pin_entries)
+    check_index_coverage(signal["name"], runs, signal["width"])
@@ -0,0 +1,252 @@
+"""
+Rebuild signal and pin tables incrementally between runs
+
+Schema validation, `form_signal_entry`, `validate_signal_entry` and flattening all
+work on one signal at a time, and their results depend only on that signal and
+on the banks it names. A `SignalMemo` stores those results under a canonical hash
+of exactly that input, so after an edit only new or changed signals are processed
+again.
+
+The checks that span signals are kept as indexes that are updated as signals come
+and go, rather than rebuilt from the whole table: the number of definitions of
+each signal name, and the pin entries that claim each package pin. The pin index
+is read by `io_gen.validate_pins`, so the memo reports the same conflicts as the
+check on a whole pin table.
+"""
+
+import hashlib
+import json
+import uuid
+from collections import Counter
+from typing import Any, Mapping
+
+from io_gen.bank_table import prepare_bank_table
+from io_gen.pin_table import PinTable, flatten_signal
+from io_gen.records import PinRecord, make_pin_entry
+from io_gen.signal_table import form_signal_entry, restore_signal_entry
+from io_gen.utils import thaw
+from io_gen.validate_pins import PinConflict, get_pin_conflicts, iter_package_pins
+from io_gen.validate_signals import validate_signal_entry
+from io_gen.validator import validate_signal
+
+
+def get_referenced_banks(signal: Any) -> list[Any]:
+    """Returns the bank numbers named by a raw signal definition, in order"""
+    if not isinstance(signal, dict):
+        return []
+
+    banks = [signal["bank"]] if "bank" in signal else []
+    multibank = signal.get("multibank")
+    if isinstance(multibank, list):
+        banks.extend(
+            fragment["bank"]
+            for fragment in multibank
+            if isinstance(fragment, dict) and "bank" in fragment
+        )
+
+    return banks
+
+
+def hash_signal(signal: Any, bank_table: Mapping[int, Mapping[str, Any]]) -> str | None:
+    """Returns a canonical hash of a signal and the bank entries it depends on
+
+    The hash ignores key order and YAML formatting, so only a change in content
+    makes a signal look new. Returns None for input that cannot be put in canonical
+    form, which is never valid and so is never memoized.
+
+    """
+    banks = [[bank, bank_table.get(bank)] for bank in get_referenced_banks(signal)]
+    try:
+        canonical = json.dumps(
+            [signal, banks], sort_keys=True, separators=(",", ":"), allow_nan=False
+        )
+    except (TypeError, ValueError):
+        return None
+
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class SignalMemo:
+    """Memoized per-signal results and the cross-signal indexes built from them
+
+    Each record holds the signal table entry and flattened pins for one signal,
+    or None for both when the signal is not generated. `keys` lists the hashes of
+    the signals from the last build in input order. `names` counts the definitions
+    of each signal name, `duplicate_names` holds the names defined more than once,
+    `pin_owners` lists the pin entries that claim each package pin and
+    `shared_pins` holds the pins listed with more than one entry, in the order
+    they came to be shared. The indexes always describe the signals in `keys`.
+
+    """
+
+    def __init__(self) -> None:
+        self.records: dict[str, dict[str, Any]] = {}
+        self.keys: list[str] = []
+        self.names: Counter[str] = Counter()
+        self.duplicate_names: set[str] = set()
+        self.pin_owners: dict[str, list[PinRecord]] = {}
+        self.shared_pins: dict[str, None] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def build_tables(self, board: dict[str, Any]) -> dict[str, Any]:
+        """Validates a board and returns its tables, reusing unchanged signals
+
+        Returns the same tables as `io_gen.cache.build_tables`.
+
+        Raises:
+            jsonschema.exceptions.ValidationError: If the board does not conform to
+                the schema
+            ValueError: If the signal or bank table is invalid
+
+        """
+        bank_table = prepare_bank_table(board)
+
+        keys = []
+        for index, signal in enumerate(board["signals"]):
+            key = hash_signal(signal, bank_table)
+            if key is not None and key in self.records:
+                self.hits += 1
+            else:
+                self.misses += 1
+                record = build_record(signal, index, bank_table)
+                # A signal without a canonical form is never reused
+                if key is None:
+                    key = f"unhashed:{uuid.uuid4().hex}"
+                self.records[key] = record
+            keys.append(key)
+
+        self.update_indexes(keys)
+        self.check_duplicate_names()
+
+        signal_table = []
+        pin_table = PinTable()
+        for key in keys:
+            record = self.records[key]
+            if record["entry"] is not None:
+                signal_table.append(record["entry"])
+                pin_table.add_signal(record["entry"], record["pins"])
+
+        return {
+            "part": board["part"],
+            "signal_table": signal_table,
+            "bank_table": bank_table,
+            "pin_table": pin_table,
+        }
+
+    def update_indexes(self, keys: list[str]) -> None:
+        """Moves the indexes from the signals of the last build to `keys`
+
+        Only the signals that were added or removed since the last build are
+        visited. Records that are no longer used are dropped.
+
+        """
+        old_keys = Counter(self.keys)
+        new_keys = Counter(keys)
+
+        for key, count in (old_keys - new_keys).items():
+            for _ in range(count):
+                self.remove_from_indexes(self.records[key])
+        for key, count in (new_keys - old_keys).items():
+            for _ in range(count):
+                self.add_to_indexes(self.records[key])
+
+        self.keys = keys
+        for key in set(self.records) - set(new_keys):
+            del self.records[key]
+
+    def add_to_indexes(self, record: dict[str, Any]) -> None:
+        """Adds one signal to the name and pin owner indexes"""
+        if record["entry"] is None:
+            return
+
+        name = record["entry"]["name"]
+        self.names[name] += 1
+        if self.names[name] > 1:
+            self.duplicate_names.add(name)
+        for pin, entry in iter_package_pins(record["pins"]):
+            owners = self.pin_owners.setdefault(pin, [])
+            owners.append(entry)
+            if len(owners) > 1:
+                self.shared_pins[pin] = None
+
+    def remove_from_indexes(self, record: dict[str, Any]) -> None:
+        """Removes one signal from the name and pin owner indexes"""
+        if record["entry"] is None:
+            return
+
+        name = record["entry"]["name"]
+        self.names[name] -= 1
+        if self.names[name] < 2:
+            self.duplicate_names.discard(name)
+        if not self.names[name]:
+            del self.names[name]
+        for pin, entry in iter_package_pins(record["pins"]):
+            owners = self.pin_owners[pin]
+            owners.remove(entry)
+            if len(owners) < 2:
+                self.shared_pins.pop(pin, None)
+            if not owners:
+                del self.pin_owners[pin]
+
+    def check_duplicate_names(self) -> None:
+        """Raises if the name index shows a signal defined more than once
+
+        Raises:
+            ValueError - If duplicate signal names are present in the input data
+
+        """
+        if not self.duplicate_names:
+            return
+
+        # Report the first duplicate in input order, as extract_signal_table does
+        seen = set()
+        for key in self.keys:
+            entry = self.records[key]["entry"]
+            if entry is None:
+                continue
+            if entry["name"] in seen:
+                msg = f"Duplicate signal name '{entry['name']}'"
+                raise ValueError(msg)
+            seen.add(entry["name"])
+
+    def get_pin_conflicts(self) -> list[PinConflict]:
+        """Returns the package pins claimed more than once, see `shared_pins`
+
+        Only the shared pins are looked up, through the same check that
+        `io_gen.validate_pins.find_pin_conflicts` runs on a whole pin table.
+
+        """
+        return get_pin_conflicts(self.pin_owners, self.shared_pins)
+
+    def to_json(self) -> dict[str, Any]:
+        """Returns the JSON form of the memo, see `from_json`"""
+        return {"keys": self.keys, "records": thaw(self.records)}
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> "SignalMemo":
+        """Rebuilds a memo from its JSON form, see `restore_signal_entry`"""
+        memo = cls()
+        memo.records = data["records"]
+        for record in memo.records.values():
+            if record["entry"] is not None:
+                entry = restore_signal_entry(record["entry"])
+                record["entry"] = entry
+                record["pins"] = [make_pin_entry(entry, pin) for pin in record["pins"]]
+
+        memo.update_indexes(data["keys"])
+        return memo
+
+
+def build_record(
+    signal: Any, index: int, bank_table: Mapping[int, Mapping[str, Any]]
+) -> dict[str, Any]:
+    """Validates and flattens one signal found at `index` in the document"""
+    validate_signal(signal, index)
+
+    if not signal.get("generate", True):
+        return {"entry": None, "pins": None}
+
+    entry = form_signal_entry(signal)
+    validate_signal_entry(entry)
+    return {"entry": entry, "pins": flatten_signal(entry, bank_table)}
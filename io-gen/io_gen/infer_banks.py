@@ -0,0 +1,176 @@
+"""
+Infer the bank of each pin from the package pinout of the target device
+
+A signal must state either `bank` or `iostandard`, and every multibank fragment
+must state `bank`, although the bank of a pin is fixed by the package. With the
+package pinout from `io_gen.pinout` the missing banks are filled in before the
+board is validated, so `resolve_iostandard` and `resolve_iostandard_multibank`
+inherit from the bank table exactly as if the banks had been written out:
+
+- A signal with neither `bank` nor `iostandard` whose pins are all in one bank
+  gets that `bank`
+- Such a signal with a `pins` or `pinset` array that spans banks is split into
+  `multibank` fragments, one per run of consecutive bits in the same bank
+- A multibank fragment without `bank` gets the bank of its pins, and is split
+  the same way if they span banks
+
+Anything that cannot be inferred (a pin that is not a user IO of the package, or
+the two pins of a pair in different banks) is left as written, for validation
+to report. The pin to bank lookups go through the indexed pinout, which is built
+once per package and cached, see `io_gen.pinout.load_pinout`.
+"""
+
+from typing import Any, Sequence
+
+from io_gen.pinout import PackagePinout
+
+
+def get_pin_bank(pinout: PackagePinout, pin: Any) -> int | None:
+    """Returns the bank of a user IO pin, or None if it has none"""
+    package_pin = pinout.get_pin(pin) if isinstance(pin, str) else None
+    if package_pin is None or not package_pin.is_user_io:
+        return None
+    return package_pin.bank
+
+
+def get_bit_banks(
+    pinout: PackagePinout, definition: dict[str, Any]
+) -> list[int | None] | None:
+    """Returns the bank of each bit of a signal or fragment, in bit order
+
+    A pair is only given a bank if both of its pins are in it. Returns None if the
+    definition has neither a `pins` nor a `pinset` in a form that can be read.
+
+    """
+    if "pins" in definition:
+        pins = definition["pins"]
+        if isinstance(pins, str):
+            pins = [pins]
+        if not isinstance(pins, list):
+            return None
+        return [get_pin_bank(pinout, pin) for pin in pins]
+
+    pinset = definition.get("pinset")
+    if not isinstance(pinset, dict):
+        return None
+    p, n = pinset.get("p"), pinset.get("n")
+    if isinstance(p, str) and isinstance(n, str):
+        p, n = [p], [n]
+    if not isinstance(p, list) or not isinstance(n, list) or len(p) != len(n):
+        return None
+
+    banks = []
+    for p_pin, n_pin in zip(p, n):
+        bank = get_pin_bank(pinout, p_pin)
+        banks.append(bank if bank == get_pin_bank(pinout, n_pin) else None)
+    return banks
+
+
+def get_bank_runs(banks: Sequence[int | None]) -> list[tuple[int | None, int, int]]:
+    """Returns the runs of consecutive bits in one bank, as (bank, start, stop)
+
+    Bits whose bank is not known, given as None, form runs of their own.
+
+    """
+    runs = []
+    start = 0
+    for index in range(1, len(banks) + 1):
+        if index == len(banks) or banks[index] != banks[start]:
+            runs.append((banks[start], start, index))
+            start = index
+    return runs
+
+
+def split_fragment(
+    definition: dict[str, Any], bank: int | None, offset: int, start: int, stop: int
+) -> dict[str, Any]:
+    """Returns the multibank fragment for bits `start` to `stop` of a definition"""
+    fragment: dict[str, Any] = {"bank": bank, "offset": offset + start}
+    if "pins" in definition:
+        fragment["pins"] = definition["pins"][start:stop]
+    else:
+        pinset = definition["pinset"]
+        p, n = pinset["p"][start:stop], pinset["n"][start:stop]
+        fragment["pinset"] = {"p": p, "n": n}
+    return fragment
+
+
+def infer_fragment_banks(
+    fragment: dict[str, Any], pinout: PackagePinout
+) -> list[dict[str, Any]]:
+    """Returns a multibank fragment with its bank filled in, split by bank"""
+    if not isinstance(fragment, dict) or "bank" in fragment:
+        return [fragment]
+
+    banks = get_bit_banks(pinout, fragment)
+    if not banks or None in banks or not isinstance(fragment.get("offset"), int):
+        return [fragment]
+
+    runs = get_bank_runs(banks)
+    if len(runs) == 1:
+        return [{"bank": banks[0], **fragment}]
+
+    # Every other key is kept on each part, including any the schema will reject
+    rest = {
+        key: value
+        for key, value in fragment.items()
+        if key not in ("offset", "pins", "pinset")
+    }
+    return [
+        {**split_fragment(fragment, bank, fragment["offset"], start, stop), **rest}
+        for bank, start, stop in runs
+    ]
+
+
+def infer_signal_banks(signal: dict[str, Any], pinout: PackagePinout) -> dict[str, Any]:
+    """Returns a signal definition with its banks filled in, see the module docs
+
+    The signal is returned unchanged if it has nothing to infer, otherwise a new
+    definition is returned and the one given is left untouched.
+
+    """
+    if not isinstance(signal, dict):
+        return signal
+
+    multibank = signal.get("multibank")
+    if isinstance(multibank, list):
+        if all(isinstance(f, dict) and "bank" in f for f in multibank):
+            return signal
+        fragments = []
+        for fragment in multibank:
+            fragments.extend(infer_fragment_banks(fragment, pinout))
+        return {**signal, "multibank": fragments}
+
+    # A signal with an explicit iostandard does not need its bank
+    if "bank" in signal or "iostandard" in signal:
+        return signal
+
+    banks = get_bit_banks(pinout, signal)
+    if not banks or None in banks:
+        return signal
+
+    runs = get_bank_runs(banks)
+    if len(runs) == 1:
+        return {**signal, "bank": banks[0]}
+
+    inferred = {
+        key: value for key, value in signal.items() if key not in ("pins", "pinset")
+    }
+    inferred["multibank"] = [
+        split_fragment(signal, bank, 0, start, stop) for bank, start, stop in runs
+    ]
+    return inferred
+
+
+def infer_board_banks(board: dict[str, Any], pinout: PackagePinout) -> dict[str, Any]:
+    """Returns a board with the banks of its signals inferred from the pinout
+
+    Signals are rewritten with `infer_signal_banks`; the board given is left
+    untouched.
+
+    """
+    signals = board.get("signals") if isinstance(board, dict) else None
+    if not isinstance(signals, list):
+        return board
+
+    return {**board, "signals": [infer_signal_banks(s, pinout) for s in signals]}
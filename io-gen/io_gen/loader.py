@@ -0,0 +1,231 @@
+"""
+Load board descriptions incrementally from YAML
+
+`yaml.safe_load` composes a node tree for the entire document before constructing
+any Python objects, so the memory needed to load a board grows with the whole
+file. The loader here drives the YAML parser one event at a time instead. Every
+top-level value other than `signals` (title, part, banks, ...) is built eagerly,
+while each item of `signals` is composed, constructed and handed to the caller as
+soon as it is complete. Only one signal's node tree is alive at any time.
+
+Whole boards are loaded with `load_board`, which picks the fastest parser that is
+available: the stdlib json parser for machine-generated `.json` descriptions, and
+PyYAML's libyaml bindings for YAML when PyYAML was built against libyaml. Both the
+whole-board and the incremental loaders fall back to the pure-Python parser
+otherwise, and produce identical data either way.
+"""
+
+import json
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+import yaml
+from yaml.composer import ComposerError
+
+# Fastest available YAML loader and the name of the backend behind it
+if getattr(yaml, "__with_libyaml__", False):
+    YAML_LOADER: type = yaml.CSafeLoader
+    YAML_BACKEND = "libyaml"
+else:
+    YAML_LOADER = yaml.SafeLoader
+    YAML_BACKEND = "pyyaml"
+
+# File suffixes that are parsed as JSON rather than YAML
+JSON_SUFFIXES = (".json",)
+
+
+def load_board(path: Path) -> tuple[Any, str]:
+    """Loads a board description from a YAML or JSON file
+
+    Args:
+        path: Path to the board description. Files ending in `.json` are parsed as
+            JSON; anything else is parsed as YAML.
+
+    Returns:
+        The loaded board and the name of the backend that parsed it, one of
+        'json', 'libyaml' or 'pyyaml'.
+
+    Raises:
+        json.JSONDecodeError: If a JSON board is not valid JSON
+        yaml.YAMLError: If a YAML board is not valid YAML
+
+    """
+    path = Path(path)
+    with path.open("r", encoding="utf-8") as f:
+        if is_json_path(path):
+            return load_json(f), "json"
+        return load_yaml(f), YAML_BACKEND
+
+
+def parse_board(text: str, path: Path) -> tuple[Any, str]:
+    """Parses board text that was read from `path`, see `load_board`"""
+    if is_json_path(path):
+        return load_json(text), "json"
+    return load_yaml(text), YAML_BACKEND
+
+
+def is_json_path(path: Path) -> bool:
+    """Returns True if a board file should be parsed as JSON rather than YAML"""
+    return Path(path).suffix.lower() in JSON_SUFFIXES
+
+
+def load_yaml(stream: str | IO, loader: type = YAML_LOADER) -> Any:
+    """Loads a YAML board description with the fastest available loader"""
+    return yaml.load(stream, Loader=loader)
+
+
+def load_json(stream: str | IO) -> Any:
+    """Loads a JSON board description
+
+    JSON object keys are always strings, so bank numbers come back as integers the
+    same way they do from YAML.
+
+    """
+    if isinstance(stream, str):
+        board = json.loads(stream)
+    else:
+        board = json.load(stream)
+
+    if isinstance(board, dict) and isinstance(board.get("banks"), dict):
+        board["banks"] = {
+            parse_bank_key(key): value for key, value in board["banks"].items()
+        }
+
+    return board
+
+
+def parse_bank_key(key: str) -> int | str:
+    """Returns a bank number key as an integer, leaving any other key for the schema"""
+    if key.isascii() and key.isdigit():
+        return int(key)
+    return key
+
+
+def iter_signals(
+    stream: str | IO, header: dict[str, Any], loader: type = YAML_LOADER
+) -> Iterator[Any]:
+    """Lazily yields the items of `signals` from a YAML board description
+
+    Every other top-level key is constructed and stored in `header` as it is
+    reached. Keys that precede `signals` in the document (the usual layout) are in
+    `header` before the first signal is yielded; the rest are added once the
+    signals have been exhausted. Since the items are not collected, `header` gets
+    an empty `signals` list to record that the key was present.
+
+    Args:
+        stream: YAML text or a file opened for reading
+        header: Dictionary that receives the top-level values other than signals
+        loader: PyYAML safe loader class that parses the stream
+
+    Yields:
+        Each item of the `signals` sequence, in document order.
+
+    Raises:
+        ValueError: If the document is not a single top-level mapping
+        yaml.YAMLError: If the document is not valid YAML
+
+    """
+    parser = loader(stream)
+    try:
+        yield from iter_document_signals(parser, header)
+    finally:
+        parser.dispose()
+
+
+def iter_document_signals(loader: Any, header: dict[str, Any]) -> Iterator[Any]:
+    """Walks the events of a single board document, see `iter_signals`"""
+    anchors: dict[str, yaml.Node] = {}
+
+    loader.get_event()
+    if loader.check_event(yaml.StreamEndEvent):
+        msg = "Board description is empty"
+        raise ValueError(msg)
+
+    loader.get_event()
+    if not loader.check_event(yaml.MappingStartEvent):
+        msg = "Board description must be a mapping at the top level"
+        raise ValueError(msg)
+
+    loader.get_event()
+    while not loader.check_event(yaml.MappingEndEvent):
+        key = loader.construct_document(compose_node(loader, anchors))
+
+        # Anything other than a sequence of signals is kept whole so that schema
+        # validation can report it
+        if key != "signals" or not loader.check_event(yaml.SequenceStartEvent):
+            header[key] = loader.construct_document(compose_node(loader, anchors))
+            continue
+
+        header["signals"] = []
+        loader.get_event()
+        while not loader.check_event(yaml.SequenceEndEvent):
+            yield loader.construct_document(compose_node(loader, anchors))
+        loader.get_event()
+
+    loader.get_event()
+    loader.get_event()
+    if not loader.check_event(yaml.StreamEndEvent):
+        msg = "Board description must contain a single YAML document"
+        raise ValueError(msg)
+
+
+def compose_node(loader: Any, anchors: dict[str, yaml.Node]) -> yaml.Node:
+    """Composes the next node from parser events
+
+    This mirrors PyYAML's own composer, but works a node at a time on any loader
+    that provides the event API and a resolver, so the caller decides how much of
+    the document is ever held as nodes.
+
+    """
+    event = loader.get_event()
+
+    if isinstance(event, yaml.AliasEvent):
+        if event.anchor not in anchors:
+            raise ComposerError(
+                None, None, f"found undefined alias {event.anchor!r}", event.start_mark
+            )
+        return anchors[event.anchor]
+
+    if isinstance(event, yaml.ScalarEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(
+            tag, event.value, event.start_mark, event.end_mark, style=event.style
+        )
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+        return node
+
+    if isinstance(event, yaml.SequenceStartEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.SequenceNode, None, event.implicit)
+        node = yaml.SequenceNode(
+            tag, [], event.start_mark, None, flow_style=event.flow_style
+        )
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+        while not loader.check_event(yaml.SequenceEndEvent):
+            node.value.append(compose_node(loader, anchors))
+        node.end_mark = loader.get_event().end_mark
+        return node
+
+    if isinstance(event, yaml.MappingStartEvent):
+        tag = event.tag
+        if tag is None or tag == "!":
+            tag = loader.resolve(yaml.MappingNode, None, event.implicit)
+        node = yaml.MappingNode(
+            tag, [], event.start_mark, None, flow_style=event.flow_style
+        )
+        if event.anchor is not None:
+            anchors[event.anchor] = node
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = compose_node(loader, anchors)
+            value = compose_node(loader, anchors)
+            node.value.append((key, value))
+        node.end_mark = loader.get_event().end_mark
+        return node
+
+    msg = f"Unexpected YAML event {type(event).__name__}"
+    raise ValueError(msg)
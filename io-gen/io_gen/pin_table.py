@@ -1,13 +1,8 @@
-from typing import Any
-
-from io_gen.utils import (
-    is_array_pins,
-    is_array_pinset,
-    is_multibank_pins,
-    is_multibank_pinset,
-    is_scalar_pins,
-    is_scalar_pinset,
-)
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+from io_gen.bank_table import extract_bank_table
+from io_gen.records import DiffPinEntry, PinRecord, as_pin_entries
+from io_gen.utils import SignalKind, get_multibank_fragment_width, get_signal_kind
 
 from io_gen.flatten import (
     flatten_scalar_pins,
@@ -18,55 +13,189 @@ from io_gen.flatten import (
     flatten_multibank_pinset,
 )
 
+# Per-kind flatteners, dispatched on the kind cached in each signal table entry
+FLATTENERS = {
+    SignalKind.SCALAR_PINS: flatten_scalar_pins,
+    SignalKind.ARRAY_PINS: flatten_array_pins,
+    SignalKind.SCALAR_PINSET: flatten_scalar_pinset,
+    SignalKind.ARRAY_PINSET: flatten_array_pinset,
+    SignalKind.MULTIBANK_PINS: flatten_multibank_pins,
+    SignalKind.MULTIBANK_PINSET: flatten_multibank_pinset,
+}
+
+
+class PinTable:
+    """Flattened pin table with hash indexes by signal name, package pin and bank
+
+    Entries are stored in signal order and, within a signal, in index order. The
+    indexes are built as signals are added, so lookups never scan or re-sort the
+    table. Iterating over a pin table yields the entries in the same order as the
+    list that used to be returned by `extract_pin_table`.
+
+    """
+
+    def __init__(self) -> None:
+        self.entries: list[PinRecord] = []
+        self.by_signal: dict[str, Sequence[PinRecord]] = {}
+        self.by_pin: dict[str, list[PinRecord]] = {}
+        self.by_bank: dict[int, list[PinRecord]] = {}
+        self.signal_banks: dict[str, dict[int, int]] = {}
+
+    def __iter__(self) -> Iterator[PinRecord]:
+        return iter(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __getitem__(self, index: int) -> PinRecord:
+        return self.entries[index]
+
+    def add_signal(
+        self, signal: Mapping[str, Any], pin_entries: Iterable[Mapping[str, Any]]
+    ) -> None:
+        """Adds the flattened pins of one signal and indexes them
+
+        Args:
+            signal: The signal table entry the pins were flattened from
+            pin_entries: Flattened pin entries for the signal, as records or as
+                plain dicts, see `io_gen.records.as_pin_entry`
+
+        Raises:
+            ValueError: If the signal has already been added to the table
+
+        """
+        name = signal["name"]
+        if name in self.by_signal:
+            msg = f"Signal '{name}' has already been added to the pin table"
+            raise ValueError(msg)
+
+        # Sort once here and never again on lookup
+        pin_entries = order_by_index(as_pin_entries(pin_entries))
+
+        banks = get_signal_banks(signal)
+        self.by_signal[name] = pin_entries
+        self.signal_banks[name] = banks
+        for entry in pin_entries:
+            self.entries.append(entry)
+
+            # Differential pairs are indexed under both package pins
+            if isinstance(entry, DiffPinEntry):
+                self.by_pin.setdefault(entry.p, []).append(entry)
+                self.by_pin.setdefault(entry.n, []).append(entry)
+            else:
+                self.by_pin.setdefault(entry.pin, []).append(entry)
+
+            bank = banks.get(entry.index)
+            if bank is not None:
+                self.by_bank.setdefault(bank, []).append(entry)
+
+    def get_pins_by_signal(self, name: str) -> Sequence[PinRecord]:
+        """Returns flattened pins for a signal in index order"""
+        pins = self.by_signal.get(name)
+        if not pins:
+            msg = f"No pins found for signal '{name}'"
+            raise ValueError(msg)
+        return pins
+
+    def get_pins_by_package_pin(self, pin: str) -> list[PinRecord]:
+        """Returns every pin entry that uses a package pin (either side of a pair)"""
+        return self.by_pin.get(pin, [])
+
+    def get_pins_by_bank(self, bank: int) -> list[PinRecord]:
+        """Returns every pin entry that is declared in a bank"""
+        return self.by_bank.get(bank, [])
+
+    def get_bank(self, name: str, index: int) -> int | None:
+        """Returns the declared bank of a signal bit, or None if it has none"""
+        return self.signal_banks.get(name, {}).get(index)
+
 
 def extract_pin_table(
-    signal_table: list[dict[str, Any]], bank_table: dict[int, dict[str, Any]]
-) -> list[dict[str, Any]]:
+    signal_table: Sequence[Mapping[str, Any]],
+    bank_table: Mapping[int, Mapping[str, Any]],
+) -> PinTable:
     """Flatten signals into atomic pin entries
 
-    This function transforms all signal definitions into a flat list of atomic
-    pins or differential pairs.
+    This function transforms all signal definitions into a flat, indexed table of
+    atomic pins or differential pairs.
 
     Args:
         signal_table: The extracted per-signal metadata table
         bank_table: The extracted per-bank metadata table, with keys as bank numbers
 
     Returns:
-        A list of dicts, one per atomic pin or pin pair, each with full metadata.
+        A PinTable with one dict per atomic pin or pin pair, each with full metadata.
 
     """
-    pin_table = []
+    pin_table = PinTable()
+
+    for signal, pin_entries in iter_signal_pins(signal_table, bank_table):
+        pin_table.add_signal(signal, pin_entries)
+
+    return pin_table
 
+
+def iter_signal_pins(
+    signal_table: Iterable[Mapping[str, Any]],
+    bank_table: Mapping[int, Mapping[str, Any]],
+) -> Iterator[tuple[Mapping[str, Any], Sequence[PinRecord]]]:
+    """Lazily flattens signals, yielding each signal with its pins in index order
+
+    This is the streaming form of `extract_pin_table`: only the pins of the current
+    signal are held at once, and a width or index error in a signal is raised as
+    soon as that signal is reached.
+
+    """
+    # Wrapped once, so every bank lookup reads precomputed attributes
+    bank_table = extract_bank_table(bank_table)
     for signal in signal_table:
-        if is_scalar_pins(signal):
-            pin_entries = flatten_scalar_pins(signal, bank_table)
-        elif is_array_pins(signal):
-            pin_entries = flatten_array_pins(signal, bank_table)
-        elif is_scalar_pinset(signal):
-            pin_entries = flatten_scalar_pinset(signal, bank_table)
-        elif is_array_pinset(signal):
-            pin_entries = flatten_array_pinset(signal, bank_table)
-        elif is_multibank_pins(signal):
-            pin_entries = flatten_multibank_pins(signal, bank_table)
-        elif is_multibank_pinset(signal):
-            pin_entries = flatten_multibank_pinset(signal, bank_table)
-        else:
-            msg = f"Signal '{signal['name']}' has unknown pin type"
-            raise ValueError(msg)
+        yield signal, flatten_signal(signal, bank_table)
 
-        pin_table.extend(pin_entries)
 
-    return pin_table
+def flatten_signal(
+    signal: Mapping[str, Any], bank_table: Mapping[int, Mapping[str, Any]]
+) -> Sequence[PinRecord]:
+    """Flattens one signal table entry into its pin entries in index order"""
+    flatten = FLATTENERS[get_signal_kind(signal)]
+    return order_by_index(flatten(signal, bank_table))
+
+
+def order_by_index(pin_entries: Sequence[PinRecord]) -> Sequence[PinRecord]:
+    """Returns the pin entries of one signal in index order
+
+    Flattening produces entries in index order except for multibank signals whose
+    fragments are declared out of order, so most signals are returned unchanged.
+
+    """
+    indices = [entry.index for entry in pin_entries]
+    if any(a > b for a, b in zip(indices, indices[1:])):
+        return sorted(pin_entries, key=lambda entry: entry.index)
+    return pin_entries
 
 
-def get_pins_by_signal(
-    name: str, pin_table: list[dict[str, Any]]
-) -> list[dict[str, Any]]:
-    """Groups and returns flattened pins from the pin table sorted by index"""
+def get_pins_by_signal(name: str, pin_table: PinTable) -> Sequence[PinRecord]:
+    """Returns flattened pins from the pin table in index order"""
+    return pin_table.get_pins_by_signal(name)
+
+
+def get_signal_banks(signal: Mapping[str, Any]) -> dict[int, int]:
+    """Returns the declared bank of each bit index of a signal
+
+    Non-multibank signals have at most one bank for every bit, while multibank
+    signals declare a bank per fragment. Bits without a declared bank are omitted.
+
+    """
+    if "multibank" not in signal:
+        if "bank" not in signal:
+            return {}
+        bank: int = signal["bank"]
+        return dict.fromkeys(range(signal["width"]), bank)
 
-    pins = [entry for entry in pin_table if entry["signal"] == name]
-    if not pins:
-        msg = f"No pins found for signal '{name}'"
-        raise ValueError(msg)
+    banks = {}
+    for fragment in signal["multibank"]:
+        count = get_multibank_fragment_width(fragment)
+        offset = fragment["offset"]
+        for index in range(offset, offset + count):
+            banks[index] = fragment["bank"]
 
-    return sorted(pins, key=lambda entry: entry["index"])
+    return banks
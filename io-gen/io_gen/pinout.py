@@ -0,0 +1,454 @@
+"""
+Package pinouts of the target device, read from vendor ASCII pinout files
+
+The vendor publishes one pinout file per device and package, e.g.
+`xc7z020clg400pkg.txt`, with a row per package pin giving its pin name (such as
+`IO_L6P_T0_34`), bank and I/O type. The pin name also tells whether a user IO is
+the P or N side of a differential pair, which pair, and whether it is clock
+capable. Pinout files are read from a local directory, `$IO_GEN_PINOUT_DIR` or
+`io_gen/pinouts` under `$XDG_DATA_HOME` or `~/.local/share`, and chosen by the
+`part` field of the board.
+
+Parsing a large package on every run would cost more than the rest of the
+pipeline, so the parsed pinout is written once to a compact binary index in the
+io_gen cache, keyed by the bytes of the pinout file. Later runs memory-map the
+index and look pins up in place through its hash table, without reading or
+decoding the rest of the file:
+
+    header | pin records | hash buckets by pin | bank ranges | pin text
+
+Pin records are sorted by bank, so the pins of one bank are one contiguous range.
+"""
+
+import hashlib
+import mmap
+import os
+import re
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from io_gen.cache_dir import get_cache_dir
+
+# Environment variable that overrides the pinout directory
+PINOUT_DIR_ENV = "IO_GEN_PINOUT_DIR"
+
+# Bumped whenever the layout of the binary index changes
+PINOUT_FORMAT = 1
+
+# Binary index layout, all little-endian. The header holds the magic, the format,
+# and the number of pins, hash buckets and banks. A pin record holds the offset
+# and length of its text, its bank (or NO_BANK), its pair number and its flags.
+# A bucket holds a record number plus one, or 0 when empty. A bank range holds a
+# bank and the first record and number of records in it.
+MAGIC = b"IOGENPKG"
+HEADER = struct.Struct("<8sIIII")
+RECORD = struct.Struct("<IHhHBx")
+BUCKET = struct.Struct("<I")
+BANK_RANGE = struct.Struct("<hxxII")
+
+NO_BANK = -1
+
+# Pin record flags
+SIDE_P = 1
+SIDE_N = 2
+CLOCK_CAPABLE = 4
+
+# Differential side and pair number of a user IO, e.g. IO_L6P_T0_34
+IO_PAIR = re.compile(r"^IO_L(\d+)([PN])_")
+
+# Fields of a pin name that mark a clock-capable IO, in 7 series and UltraScale
+CLOCK_FIELDS = frozenset(("MRCC", "SRCC", "GC", "HDGC"))
+
+
+@dataclass(frozen=True, slots=True)
+class PackagePin:
+    """One pin of a device package
+
+    Attributes:
+        pin: Package pin, e.g. 'P14'
+        name: Vendor pin name, e.g. 'IO_L6P_T0_34'
+        bank: Bank number, or None for pins outside any bank
+        io_type: I/O type column of the pinout, e.g. 'HR', or None if not given
+        pair: Number of the differential pair a user IO belongs to, or None
+        side: 'p' or 'n' for one side of a differential pair, otherwise None
+        clock_capable: Whether the pin can drive a clock network
+
+    """
+
+    pin: str
+    name: str
+    bank: int | None
+    io_type: str | None
+    pair: int | None
+    side: str | None
+    clock_capable: bool
+
+    @property
+    def is_user_io(self) -> bool:
+        """Whether the pin is a general purpose IO that a signal can use"""
+        return self.name.startswith("IO_")
+
+
+def get_pinout_dir() -> Path:
+    """Returns the directory that holds package pinout files"""
+    pinout_dir = os.environ.get(PINOUT_DIR_ENV)
+    if pinout_dir:
+        return Path(pinout_dir)
+
+    data_home = os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share"
+    return Path(data_home) / "io_gen" / "pinouts"
+
+
+def get_package_name(part: str) -> str:
+    """Returns the device and package of a part, as used in pinout file names
+
+    The speed grade and temperature range are dropped, so both 'xc7z020clg400-1'
+    and 'xc7z020clg400-2' give 'xc7z020clg400', and 'xczu9eg-ffvb1156-2-e' gives
+    'xczu9egffvb1156'.
+
+    """
+    fields = part.lower().split("-")
+    package = fields[0]
+    if len(fields) > 1 and re.fullmatch(r"[a-z]+\d+", fields[1]):
+        package += fields[1]
+    return package
+
+
+def find_pinout_file(part: str, pinout_dir: Path | None = None) -> Path:
+    """Returns the pinout file for a part
+
+    Raises:
+        FileNotFoundError: If the pinout directory has no file for the part
+
+    """
+    package = get_package_name(part)
+    directory = Path(pinout_dir) if pinout_dir is not None else get_pinout_dir()
+    for name in (f"{package}pkg.txt", f"{package}pkg.csv", f"{package}.txt"):
+        path = directory / name
+        if path.is_file():
+            return path
+
+    msg = f"No pinout for part '{part}' in '{directory}' (expected '{package}pkg.txt')"
+    raise FileNotFoundError(msg)
+
+
+def parse_pinout(text: str) -> list[PackagePin]:
+    """Parses a vendor ASCII pinout into its pins, in file order
+
+    Lines before the column header, comment lines starting with '--' and lines
+    that do not have one field per column are skipped, and the pin count that
+    ends the table ends the parse. Columns are separated by whitespace, or by
+    commas in CSV pinouts.
+
+    Raises:
+        ValueError: If there is no column header with 'Pin', 'Pin Name' and 'Bank'
+            columns, or a pin is listed twice
+
+    """
+    columns = None
+    separator = None
+    pins = []
+    seen = set()
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("--"):
+            continue
+        if line.startswith("Total Number of Pins"):
+            break
+
+        if columns is None:
+            if line.startswith("Pin,"):
+                separator = ","
+                columns = [column.strip() for column in line.split(",")]
+            elif re.match(r"Pin\s{2,}", line):
+                columns = re.split(r"\s{2,}", line)
+            else:
+                continue
+            missing = {"Pin", "Pin Name", "Bank"} - set(columns)
+            if missing:
+                msg = f"Pinout header is missing columns {sorted(missing)}: {line!r}"
+                raise ValueError(msg)
+            continue
+
+        fields = [field.strip() for field in line.split(separator)]
+        if len(fields) != len(columns):
+            continue
+
+        pin = make_package_pin(dict(zip(columns, fields)))
+        if pin.pin in seen:
+            msg = f"Pin '{pin.pin}' is listed more than once in the pinout"
+            raise ValueError(msg)
+        seen.add(pin.pin)
+        pins.append(pin)
+
+    if columns is None:
+        msg = "Pinout has no 'Pin' and 'Pin Name' column header"
+        raise ValueError(msg)
+    return pins
+
+
+def make_package_pin(row: dict[str, str]) -> PackagePin:
+    """Returns the package pin described by one row of a pinout, by column"""
+    name = row["Pin Name"]
+    bank = row["Bank"]
+    io_type = row.get("I/O Type", "NA")
+
+    pair = side = None
+    match = IO_PAIR.match(name)
+    if match:
+        pair = int(match[1])
+        side = match[2].lower()
+
+    return PackagePin(
+        pin=row["Pin"],
+        name=name,
+        bank=None if bank == "NA" else int(bank),
+        io_type=None if io_type == "NA" else io_type,
+        pair=pair,
+        side=side,
+        clock_capable=not CLOCK_FIELDS.isdisjoint(name.split("_")),
+    )
+
+
+def hash_pin(pin: bytes) -> int:
+    """Returns the hash of a package pin name that is stored in the index
+
+    Python's own string hash changes between runs, so a fixed one is used.
+
+    """
+    return zlib.crc32(pin)
+
+
+def build_pinout_index(pins: list[PackagePin]) -> bytes:
+    """Returns the binary index of a parsed pinout, see the module docs"""
+    ordered = sorted(pins, key=lambda pin: NO_BANK if pin.bank is None else pin.bank)
+
+    records = bytearray()
+    text = bytearray()
+    bank_ranges: list[list[int]] = []
+    for number, pin in enumerate(ordered):
+        bank = NO_BANK if pin.bank is None else pin.bank
+        if not bank_ranges or bank_ranges[-1][0] != bank:
+            bank_ranges.append([bank, number, 0])
+        bank_ranges[-1][2] += 1
+
+        flags = {"p": SIDE_P, "n": SIDE_N, None: 0}[pin.side]
+        if pin.clock_capable:
+            flags |= CLOCK_CAPABLE
+        entry = "\t".join((pin.pin, pin.name, pin.io_type or "")).encode()
+        records += RECORD.pack(len(text), len(entry), bank, pin.pair or 0, flags)
+        text += entry
+
+    # Open addressing with linear probing, at most half full
+    bucket_count = 1 << max(1, (2 * len(ordered) - 1).bit_length())
+    mask = bucket_count - 1
+    buckets = [0] * bucket_count
+    for number, pin in enumerate(ordered):
+        slot = hash_pin(pin.pin.encode()) & mask
+        while buckets[slot]:
+            slot = (slot + 1) & mask
+        buckets[slot] = number + 1
+
+    header = HEADER.pack(
+        MAGIC, PINOUT_FORMAT, len(ordered), bucket_count, len(bank_ranges)
+    )
+    return b"".join(
+        (
+            header,
+            records,
+            struct.pack(f"<{bucket_count}I", *buckets),
+            b"".join(BANK_RANGE.pack(*bank_range) for bank_range in bank_ranges),
+            text,
+        )
+    )
+
+
+class PackagePinout:
+    """Read-only view of a binary pinout index, see `build_pinout_index`
+
+    The index can be any buffer, normally a memory-mapped cache file. Pins are
+    decoded only when they are looked up.
+
+    """
+
+    def __init__(self, buffer: Any) -> None:
+        if len(buffer) < HEADER.size:
+            msg = "Pinout index is truncated"
+            raise ValueError(msg)
+        magic, version, count, bucket_count, bank_count = HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != PINOUT_FORMAT:
+            msg = "Not a pinout index of the current format"
+            raise ValueError(msg)
+
+        self.buffer = buffer
+        self.count = count
+        self.mask = bucket_count - 1
+        self.buckets_start = HEADER.size + count * RECORD.size
+        self.banks_start = self.buckets_start + bucket_count * BUCKET.size
+        self.text_start = self.banks_start + bank_count * BANK_RANGE.size
+        if len(buffer) < self.text_start:
+            msg = "Pinout index is truncated"
+            raise ValueError(msg)
+
+        self.bank_ranges = {
+            bank: (first, size)
+            for bank, first, size in BANK_RANGE.iter_unpack(
+                buffer[self.banks_start : self.text_start]
+            )
+        }
+
+    @classmethod
+    def open(cls, path: Path) -> "PackagePinout":
+        """Memory-maps a binary pinout index file
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a pinout index of the current format
+
+        """
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buffer)
+        except ValueError:
+            buffer.close()
+            raise
+
+    def close(self) -> None:
+        """Releases the memory map, if the index is memory-mapped"""
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def __enter__(self) -> "PackagePinout":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self) -> Iterator[PackagePin]:
+        return (self.get_record(number) for number in range(self.count))
+
+    def __contains__(self, pin: str) -> bool:
+        return self.find_record(pin) is not None
+
+    @property
+    def banks(self) -> list[int]:
+        """Returns the numbers of the banks in the package, in ascending order"""
+        return [bank for bank in self.bank_ranges if bank != NO_BANK]
+
+    def get_pin(self, pin: str) -> PackagePin | None:
+        """Returns a package pin by name, or None if the package has no such pin"""
+        number = self.find_record(pin)
+        return None if number is None else self.get_record(number)
+
+    def get_pins_by_bank(self, bank: int) -> list[PackagePin]:
+        """Returns every pin of a bank, in pinout order"""
+        first, size = self.bank_ranges.get(bank, (0, 0))
+        return [self.get_record(number) for number in range(first, first + size)]
+
+    def find_record(self, pin: str) -> int | None:
+        """Returns the record number of a package pin, or None if it is absent"""
+        key = pin.encode() + b"\t"
+        buffer = self.buffer
+        slot = hash_pin(key[:-1]) & self.mask
+        while True:
+            (entry,) = BUCKET.unpack_from(
+                buffer, self.buckets_start + slot * BUCKET.size
+            )
+            if not entry:
+                return None
+            offset, _, _, _, _ = RECORD.unpack_from(
+                buffer, HEADER.size + (entry - 1) * RECORD.size
+            )
+            start = self.text_start + offset
+            if buffer[start : start + len(key)] == key:
+                return entry - 1
+            slot = (slot + 1) & self.mask
+
+    def get_record(self, number: int) -> PackagePin:
+        """Decodes one pin record"""
+        offset, length, bank, pair, flags = RECORD.unpack_from(
+            self.buffer, HEADER.size + number * RECORD.size
+        )
+        start = self.text_start + offset
+        text = bytes(self.buffer[start : start + length]).decode()
+        pin, name, io_type = text.split("\t")
+        if flags & SIDE_P:
+            side = "p"
+        elif flags & SIDE_N:
+            side = "n"
+        else:
+            side = None
+        return PackagePin(
+            pin=pin,
+            name=name,
+            bank=None if bank == NO_BANK else bank,
+            io_type=io_type or None,
+            pair=pair if side else None,
+            side=side,
+            clock_capable=bool(flags & CLOCK_CAPABLE),
+        )
+
+
+def get_pinout_key(source: bytes) -> str:
+    """Returns the cache key of the binary index for the bytes of a pinout file"""
+    digest = hashlib.sha256(f"io_gen pinout format {PINOUT_FORMAT}\0".encode())
+    digest.update(source)
+    return digest.hexdigest()
+
+
+def write_index_file(path: Path, data: bytes) -> None:
+    """Atomically writes a binary pinout index to a file in the cache"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def load_pinout(
+    part: str, pinout_dir: Path | None = None, cache_dir: Path | None = None
+) -> PackagePinout:
+    """Returns the package pinout of a part, from the cached index if possible
+
+    Args:
+        part: Part number, as in the `part` field of a board, e.g. 'xc7z020clg400-1'
+        pinout_dir: Directory that holds pinout files, see `get_pinout_dir`
+        cache_dir: Directory that holds cached indexes, see `io_gen.cache`
+
+    Raises:
+        FileNotFoundError: If there is no pinout file for the part
+        ValueError: If the pinout file cannot be parsed
+
+    """
+    path = find_pinout_file(part, pinout_dir)
+    source = path.read_bytes()
+    if cache_dir is None:
+        cache_dir = get_cache_dir()
+    index_path = Path(cache_dir) / "pinout" / f"{get_pinout_key(source)}.bin"
+
+    try:
+        return PackagePinout.open(index_path)
+    except (OSError, ValueError):
+        pass
+
+    data = build_pinout_index(parse_pinout(source.decode("utf-8")))
+
+    # A read-only or full cache only costs the next run its parse
+    try:
+        write_index_file(index_path, data)
+    except OSError:
+        return PackagePinout(data)
+    return PackagePinout.open(index_path)
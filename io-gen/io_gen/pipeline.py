@@ -0,0 +1,187 @@
+"""
+Run the validation, flattening and emission stages as a streaming pipeline
+
+Each stage is a generator that pulls one signal at a time from the stage before
+it, so peak memory depends on the largest signal rather than on the whole design.
+Checks that used to happen at stage boundaries still happen in input order: a
+schema error, duplicate name or width mismatch is raised as soon as the offending
+signal reaches the stage that detects it. With `check_pins` set, a package pin
+claimed a second time is reported when the signal that claims it is flattened.
+"""
+
+import itertools
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Mapping, Sequence, TextIO
+
+from io_gen.bank_table import prepare_bank_table
+from io_gen.cache import load_tables
+from io_gen.emit_xdc import get_xdc_emitter, iter_xdc
+from io_gen.emitters import write_output, write_output_file
+from io_gen.loader import iter_signals
+from io_gen.pin_table import iter_signal_pins
+from io_gen.port_names import PortNamer, iter_named_signal_pins
+from io_gen.records import PinRecord, SignalEntry
+from io_gen.signal_table import iter_signal_table
+from io_gen.validate_pins import iter_checked_signal_pins, validate_pin_table
+from io_gen.validate_signals import validate_signal_entry
+from io_gen.validator import validate_signal
+
+# Top-level keys needed before any signal can be flattened
+HEADER_KEYS = ("title", "part", "banks")
+
+
+def iter_valid_signals(signals: Iterable[Any]) -> Iterator[dict[str, Any]]:
+    """Schema-validates signal definitions one at a time as they are consumed"""
+    for index, signal in enumerate(signals):
+        validate_signal(signal, index)
+        yield signal
+
+
+def iter_checked_signal_table(signals: Iterable[Any]) -> Iterator[SignalEntry]:
+    """Lazily yields validated signal table entries from raw signal definitions"""
+    for entry in iter_signal_table(iter_valid_signals(signals)):
+        validate_signal_entry(entry)
+        yield entry
+
+
+def iter_xdc_lines(
+    board: dict[str, Any],
+    signals: Iterable[Any] | None = None,
+    compact: bool = False,
+    check_pins: bool = False,
+    namer: PortNamer | None = None,
+) -> Iterator[str]:
+    """Lazily yields the XDC lines for a board
+
+    Args:
+        board: The board description. Its 'signals' are ignored if `signals` is given.
+        signals: Signal definitions to stream instead of the ones in `board`, such
+            as the items produced by an incremental YAML loader.
+        compact: Write the shorter constraints of `io_gen.emit_xdc.emit_xdc_compact`
+        check_pins: Raise a ValueError as soon as a package pin is claimed more
+            than once, see `io_gen.validate_pins.iter_checked_signal_pins`
+        namer: Names the ports, or None for the default convention, see
+            `io_gen.port_names`
+
+    """
+    signal_pins = iter_board_signal_pins(board, signals, check_pins)
+    yield from iter_xdc(signal_pins, compact, namer)
+
+
+def iter_board_signal_pins(
+    board: dict[str, Any],
+    signals: Iterable[Any] | None = None,
+    check_pins: bool = False,
+) -> Iterator[tuple[Mapping[str, Any], Sequence[PinRecord]]]:
+    """Lazily yields each checked signal table entry of a board with its pins
+
+    See `iter_xdc_lines` for the arguments.
+
+    """
+    bank_table = prepare_bank_table(board)
+    signal_table = iter_checked_signal_table(
+        board["signals"] if signals is None else signals
+    )
+    signal_pins = iter_signal_pins(signal_table, bank_table)
+    if check_pins:
+        signal_pins = iter_checked_signal_pins(signal_pins)
+    yield from signal_pins
+
+
+def iter_xdc_lines_from_yaml(
+    stream: str | IO,
+    compact: bool = False,
+    check_pins: bool = False,
+    namer: PortNamer | None = None,
+) -> Iterator[str]:
+    """Lazily yields the XDC lines for a YAML board, parsing it one signal at a time
+
+    Each signal is validated and turned into a signal table entry as soon as the
+    loader has parsed it. When the title, part and banks precede the signals in the
+    document, as they do in every board file in this repository, each signal is also
+    flattened and emitted before the next one is parsed. Otherwise the header is not
+    complete until the end of the document, so the signal table entries are kept
+    until then. See `iter_xdc_lines` for the other arguments.
+
+    """
+    header: dict[str, Any] = {}
+    signal_table = iter_checked_signal_table(iter_signals(stream, header))
+
+    first = next(signal_table, None)
+    if first is None:
+        pending: Iterable[SignalEntry] = []
+    elif all(key in header for key in HEADER_KEYS):
+        pending = itertools.chain([first], signal_table)
+    else:
+        pending = [first, *signal_table]
+
+    bank_table = prepare_bank_table(header)
+    signal_pins = iter_signal_pins(pending, bank_table)
+    if check_pins:
+        signal_pins = iter_checked_signal_pins(signal_pins)
+    yield from iter_xdc(signal_pins, compact, namer)
+
+
+def iter_xdc_lines_cached(
+    path: Path,
+    cache_dir: Path | None = None,
+    compact: bool = False,
+    check_pins: bool = False,
+    namer: PortNamer | None = None,
+) -> Iterator[str]:
+    """Lazily yields the XDC lines for a board file, reusing cached tables
+
+    On a cache hit validation and flattening are skipped entirely and emission
+    starts from the stored tables. The whole pin table is at hand, so with
+    `check_pins` set it is checked before the first line is produced, see
+    `io_gen.validate_pins.validate_pin_table`. See `io_gen.cache.load_tables`, and
+    `iter_xdc_lines` for the other arguments.
+
+    """
+    tables, _ = load_tables(path, cache_dir)
+    pin_table = tables["pin_table"]
+    if check_pins:
+        validate_pin_table(pin_table)
+    signal_pins = (
+        (signal, pin_table.get_pins_by_signal(signal["name"]))
+        for signal in tables["signal_table"]
+    )
+    yield from iter_xdc(signal_pins, compact, namer)
+
+
+def stream_xdc(
+    board: dict[str, Any],
+    stream: TextIO,
+    signals: Iterable[Any] | None = None,
+    compact: bool = False,
+    check_pins: bool = False,
+    namer: PortNamer | None = None,
+) -> None:
+    """Writes the XDC constraints for a board to a text stream as they are produced
+
+    See `iter_xdc_lines` for the arguments.
+
+    """
+    emitter = get_xdc_emitter(compact)
+    signal_pins = iter_board_signal_pins(board, signals, check_pins)
+    write_output(emitter, iter_named_signal_pins(signal_pins, namer), stream)
+
+
+def stream_xdc_file(
+    board: dict[str, Any],
+    path: Path,
+    signals: Iterable[Any] | None = None,
+    compact: bool = False,
+    check_pins: bool = False,
+    namer: PortNamer | None = None,
+) -> None:
+    """Streams the XDC constraints for a board to a file through a buffered handle
+
+    Output goes to a temporary file next to `path` that replaces it only once every
+    signal has been emitted, so an error part way through never leaves a truncated
+    constraints file behind. See `iter_xdc_lines` for the other arguments.
+
+    """
+    emitter = get_xdc_emitter(compact)
+    signal_pins = iter_board_signal_pins(board, signals, check_pins)
+    write_output_file(emitter, iter_named_signal_pins(signal_pins, namer), path)
@@ -0,0 +1,202 @@
+"""
+Name the top-level ports of every signal once, for all emitters
+
+Each signal has package-side ports (`foo_pad`, or `foo_p` and `foo_n` for a
+differential pair) and core-side ports (`foo`, or `foo_i`, `foo_o` and `foo_t`
+for an inout). Bus bits are selected as `foo_pad[3]`. The suffixes and the bit
+format come from a `NamingConvention`.
+
+`PortNamer` works out a signal's names once and returns them as a `SignalPorts`.
+Every emitter reads its names from that object instead of building its own
+strings, so no output can drift from the others. The namer also keeps one index of
+the package port names it has handed out, which every output writes. Each name is
+looked up once as it is added, so a collision between signals is found in the
+same pass. Core-side ports are only written by the HDL wrapper, which checks them
+in an index of its own, see `io_gen.emit_hdl`. Names are compared without regard
+to case only under a convention with `fold_case` set, as the VHDL wrapper uses,
+since VHDL does not tell `foo` from `FOO`.
+
+Every entry point that emits ports takes an optional `namer`, so a board can be
+written under a convention other than `DEFAULT_CONVENTION`.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence
+
+from io_gen.records import PinRecord, as_pin_entries
+
+# Core-side port roles of a signal, by signal direction
+CORE_ROLES = {
+    "in": ("core",),
+    "out": ("core",),
+    "inout": ("core_i", "core_o", "core_t"),
+}
+
+
+@dataclass(frozen=True)
+class NamingConvention:
+    """Suffixes added to a signal name to form its port names
+
+    Attributes:
+        pad: Suffix of a single-ended package port
+        p: Suffix of the P side of a differential package port
+        n: Suffix of the N side of a differential package port
+        core: Suffix of each core-side port, by role, see `CORE_ROLES`
+        bit: Format of one bit of a bus port, with fields `port` and `index`
+        fold_case: Whether names that differ only in case collide
+
+    """
+
+    pad: str = "_pad"
+    p: str = "_p"
+    n: str = "_n"
+    core: Mapping[str, str] = field(
+        default_factory=lambda: {
+            "core": "",
+            "core_i": "_i",
+            "core_o": "_o",
+            "core_t": "_t",
+        }
+    )
+    bit: str = "{port}[{index}]"
+    fold_case: bool = False
+
+    def get_bit_name(self, port: str, index: Any) -> str:
+        """Returns the name of one bit of a bus port, or a pattern if `index` is '*'"""
+        return self.bit.format(port=port, index=index)
+
+    def get_bit_format(self, port: str) -> Callable[[Any], str]:
+        """Returns a function that names the bits of one bus port by index
+
+        The port name is filled in once, so naming each bit only formats its index.
+
+        """
+        escaped = port.replace("{", "{{").replace("}", "}}")
+        return self.bit.format(port=escaped, index="{0}").format
+
+
+DEFAULT_CONVENTION = NamingConvention()
+
+
+@dataclass(frozen=True, slots=True)
+class SignalPorts:
+    """The port names of one signal
+
+    Attributes:
+        package: Base names of the package-side ports, by role: 'pad', or 'p' and
+            'n' for a differential pair
+        core: Base names of the core-side ports, by role, see `CORE_ROLES`
+        bits: Package port name of each pin, in the order of the pins, with the
+            bit selected for a bus. A pair of names for a differential pair.
+        patterns: Patterns that match every bit of each package port of a bus,
+            e.g. 'foo_pad[*]'. Empty for a scalar.
+
+    """
+
+    package: Mapping[str, str]
+    core: Mapping[str, str]
+    bits: tuple[Any, ...]
+    patterns: tuple[str, ...] = ()
+
+
+class PortNamer:
+    """Names the ports of each signal under one convention and finds collisions
+
+    `owners` maps every package port name handed out so far to the signal and role
+    that own it. Names are keyed in lower case if the convention has `fold_case`
+    set, see `get_key`.
+
+    """
+
+    def __init__(self, convention: NamingConvention = DEFAULT_CONVENTION) -> None:
+        self.convention = convention
+        self.owners: dict[str, tuple[str, str]] = {}
+
+    def name_signal(
+        self, signal: Mapping[str, Any], pins: Sequence[PinRecord]
+    ) -> SignalPorts:
+        """Returns the port names of a signal and its pins
+
+        Raises:
+            ValueError: If a package port name is already used by another port
+
+        """
+        convention = self.convention
+        name = signal["name"]
+
+        if signal["diff_pair"]:
+            package = {"p": f"{name}{convention.p}", "n": f"{name}{convention.n}"}
+        else:
+            package = {"pad": f"{name}{convention.pad}"}
+        core = {
+            role: f"{name}{convention.core[role]}"
+            for role in CORE_ROLES[signal["direction"]]
+        }
+
+        for role, port in package.items():
+            self.add_owner(port, name, role)
+
+        if signal["bus"]:
+            patterns = tuple(
+                convention.get_bit_name(port, "*") for port in package.values()
+            )
+            indices = [pin.index for pin in pins]
+            if signal["diff_pair"]:
+                bits: tuple[Any, ...] = tuple(
+                    zip(
+                        map(convention.get_bit_format(package["p"]), indices),
+                        map(convention.get_bit_format(package["n"]), indices),
+                    )
+                )
+            else:
+                bits = tuple(map(convention.get_bit_format(package["pad"]), indices))
+            return SignalPorts(package, core, bits, patterns)
+
+        if signal["diff_pair"]:
+            bits = tuple((package["p"], package["n"]) for _ in pins)
+        else:
+            bits = tuple(package["pad"] for _ in pins)
+        return SignalPorts(package, core, bits)
+
+    def add_owner(self, port: str, name: str, role: str) -> None:
+        """Records the owner of a port name, or of another name beside the ports
+
+        An HDL wrapper records its core ports, instance names and loop labels in an
+        index of its own, see `io_gen.emit_hdl`.
+
+        Raises:
+            ValueError: If the name already belongs to another owner or role
+
+        """
+        owner = self.owners.setdefault(self.get_key(port), (name, role))
+        if owner != (name, role):
+            msg = (
+                f"Name '{port}' of '{name}' ({role}) collides with the same name "
+                f"of '{owner[0]}' ({owner[1]})"
+            )
+            raise ValueError(msg)
+
+    def get_owner(self, port: str) -> tuple[str, str] | None:
+        """Returns the signal and role that own a name, or None if it is free"""
+        return self.owners.get(self.get_key(port))
+
+    def get_key(self, port: str) -> str:
+        """Returns the key a name is recorded under in `owners`"""
+        return port.lower() if self.convention.fold_case else port
+
+
+def iter_named_signal_pins(
+    signal_pins: Iterable[tuple[Mapping[str, Any], Iterable[Mapping[str, Any]]]],
+    namer: PortNamer | None = None,
+) -> Iterator[tuple[Mapping[str, Any], Sequence[PinRecord], SignalPorts]]:
+    """Lazily adds the port names to each signal and its pins
+
+    Pins are handed on as pin records, see `io_gen.records.as_pin_entries`. A new
+    `PortNamer` with the default convention is used unless one is given.
+
+    """
+    if namer is None:
+        namer = PortNamer()
+    for signal, pins in signal_pins:
+        records = as_pin_entries(pins)
+        yield signal, records, namer.name_signal(signal, records)
@@ -0,0 +1,260 @@
+"""
+Compact records for signal table and pin table entries
+
+Pin table entries used to be dicts that each carried a copy of their signal's
+name, direction, buffer and flags, so a wide bus repeated the same metadata once
+per bit. The records here use `__slots__` instead, and a pin record keeps a
+reference to its parent signal entry rather than copying its fields.
+
+io_gen itself reads the fields as attributes, such as `pin.index` and
+`pin.signal`, since a slot read costs much less than a mapping lookup. For other
+callers every record is also a read-only `Mapping` with the same keys the dicts
+had, so code written against `entry["name"]` keeps working and a record compares
+equal to the dict it replaces.
+"""
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Sequence, cast
+
+from io_gen.utils import SignalKind
+
+
+class Missing:
+    """Marks an optional signal field that was not given"""
+
+    def __repr__(self) -> str:
+        return "MISSING"
+
+
+MISSING: Any = Missing()
+
+
+class RecordMapping(Mapping):
+    """Read-only mapping view of a slotted record, keyed by its field names
+
+    Subclasses list their keys in `KEYS`, in the order the equivalent dict had
+    them. Optional fields hold `MISSING` when absent and are then not keys.
+
+    """
+
+    __slots__ = ()
+    KEYS: tuple[str, ...] = ()
+    KEY_SET: frozenset[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.KEY_SET = frozenset(cls.KEYS)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.KEY_SET:
+            value = getattr(self, key)
+            if value is not MISSING:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # Mapping.get goes through a KeyError for every absent optional field
+        if key in self.KEY_SET:
+            value = getattr(self, key)
+            if value is not MISSING:
+                return value
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return (
+            isinstance(key, str)
+            and key in self.KEY_SET
+            and getattr(self, key) is not MISSING
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self.KEYS if getattr(self, key) is not MISSING)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+class PinRecordMapping(RecordMapping):
+    """Mapping view of a pin record, with the signal's fields read from the signal"""
+
+    __slots__ = ()
+
+    # Every key is always present, and the signal's keys are properties
+    def __getitem__(self, key: str) -> Any:
+        if key in self.KEY_SET:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self.KEY_SET:
+            return getattr(self, key)
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.KEY_SET
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class SignalEntry(RecordMapping):
+    """One signal table entry, see `io_gen.signal_table.form_signal_entry`
+
+    Exactly one of `pins`, `pinset` and `multibank` is given, and `iostandard` and
+    `bank` are optional.
+
+    """
+
+    KEYS = (
+        "name",
+        "direction",
+        "buffer",
+        "parameters",
+        "instance",
+        "group",
+        "comment",
+        "iostandard",
+        "bank",
+        "pins",
+        "pinset",
+        "multibank",
+        "diff_pair",
+        "bus",
+        "kind",
+        "width",
+    )
+
+    name: str
+    direction: str
+    buffer: str
+    parameters: Mapping[str, Any]
+    instance: str | None
+    group: str
+    comment: Mapping[str, Any]
+    diff_pair: bool
+    bus: bool
+    kind: SignalKind
+    width: int
+    iostandard: str = MISSING
+    bank: int = MISSING
+    pins: Any = MISSING
+    pinset: Any = MISSING
+    multibank: Any = MISSING
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class PinEntry(PinRecordMapping):
+    """One single-ended pin of a signal"""
+
+    KEYS = (
+        "name",
+        "direction",
+        "buffer",
+        "diff_pair",
+        "bus",
+        "index",
+        "pin",
+        "iostandard",
+    )
+
+    signal: Mapping[str, Any]
+    index: int
+    pin: str
+    iostandard: str
+
+    @property
+    def name(self) -> str:
+        return self.signal["name"]
+
+    @property
+    def direction(self) -> str:
+        return self.signal["direction"]
+
+    @property
+    def buffer(self) -> str:
+        return self.signal["buffer"]
+
+    @property
+    def diff_pair(self) -> bool:
+        return self.signal["diff_pair"]
+
+    @property
+    def bus(self) -> bool:
+        return self.signal["bus"]
+
+
+@dataclass(slots=True, eq=False, repr=False)
+class DiffPinEntry(PinRecordMapping):
+    """One differential pin pair of a signal"""
+
+    KEYS = (
+        "name",
+        "direction",
+        "buffer",
+        "diff_pair",
+        "bus",
+        "index",
+        "p",
+        "n",
+        "iostandard",
+    )
+
+    signal: Mapping[str, Any]
+    index: int
+    p: str
+    n: str
+    iostandard: str
+
+    name = PinEntry.name
+    direction = PinEntry.direction
+    buffer = PinEntry.buffer
+    diff_pair = PinEntry.diff_pair
+    bus = PinEntry.bus
+
+
+# A pin record of either kind
+PinRecord = PinEntry | DiffPinEntry
+
+PIN_RECORDS = (PinEntry, DiffPinEntry)
+
+
+def make_pin_entry(signal: Mapping[str, Any], data: Mapping[str, Any]) -> PinRecord:
+    """Rebuilds a pin record of `signal` from a pin entry in dict or JSON form"""
+    if signal["diff_pair"]:
+        return DiffPinEntry(
+            signal, data["index"], data["p"], data["n"], data["iostandard"]
+        )
+    return PinEntry(signal, data["index"], data["pin"], data["iostandard"])
+
+
+def as_pin_entry(pin: Mapping[str, Any]) -> PinRecord:
+    """Returns a pin record for a pin entry given as a record or as a plain dict
+
+    A dict carries its signal's fields itself, so it serves as its own parent.
+
+    """
+    if isinstance(pin, PIN_RECORDS):
+        return pin
+    return make_pin_entry(pin, pin)
+
+
+def as_pin_entries(pins: Iterable[Mapping[str, Any]]) -> Sequence[PinRecord]:
+    """Returns the pins of one signal as pin records, see `as_pin_entry`
+
+    Pins that are already a sequence of records, as io_gen produces them, are
+    returned as they are.
+
+    """
+    if isinstance(pins, (list, tuple)) and all(
+        isinstance(pin, PIN_RECORDS) for pin in pins
+    ):
+        return cast(Sequence[PinRecord], pins)
+    return [as_pin_entry(pin) for pin in pins]
@@ -0,0 +1,154 @@
+"""
+Bundle the IO schema and its definitions into one pre-resolved document
+
+The source schema is split across `schema/schema.json` and the files in
+`schema/defs`, tied together with relative `$ref`s. Resolving those at runtime
+means opening and parsing every file and building a reference registry. This
+module inlines every `$ref` once and writes the result, along with a hash of the
+source files, to `schema/schema.bundle.json`. Run it as a module to rebuild the
+bundle after editing the schema:
+
+    python -m io_gen.schema_bundle
+
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# Schema locations
+SCHEMA_DIR = Path(__file__).parent.parent / "schema"
+SCHEMA_PATH = SCHEMA_DIR / "schema.json"
+DEFS_DIR = SCHEMA_DIR / "defs"
+BUNDLE_PATH = SCHEMA_DIR / "schema.bundle.json"
+
+
+def get_schema_sources() -> list[Path]:
+    """Returns the source schema files in a stable order"""
+    return [SCHEMA_PATH, *sorted(DEFS_DIR.glob("*.json"))]
+
+
+def hash_schema_sources() -> str:
+    """Returns a SHA-256 digest over the names and contents of the schema sources"""
+    digest = hashlib.sha256()
+    for path in get_schema_sources():
+        digest.update(path.relative_to(SCHEMA_DIR).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def resolve_refs(schema: Any, base_dir: Path, stack: tuple[Path, ...] = ()) -> Any:
+    """Returns a copy of a schema with every relative `$ref` replaced by its target
+
+    References are resolved relative to the directory of the file that contains
+    them, which is how the `defs` files refer to one another. Nested `$schema`
+    keywords are dropped since the inlined definitions are no longer documents of
+    their own.
+
+    Raises:
+        ValueError: If a reference is circular or points outside the schema files
+
+    """
+    if isinstance(schema, list):
+        return [resolve_refs(item, base_dir, stack) for item in schema]
+
+    if not isinstance(schema, dict):
+        return schema
+
+    resolved = {
+        key: resolve_refs(value, base_dir, stack)
+        for key, value in schema.items()
+        if key != "$ref"
+    }
+
+    if "$ref" not in schema:
+        return resolved
+
+    ref = schema["$ref"]
+    if "#" in ref or ":" in ref:
+        msg = f"Schema reference '{ref}' is not a relative file reference"
+        raise ValueError(msg)
+
+    ref_path = (base_dir / ref).resolve()
+    if ref_path in stack:
+        msg = f"Schema reference '{ref}' is circular"
+        raise ValueError(msg)
+
+    with ref_path.open("r", encoding="utf-8") as f:
+        target = json.load(f)
+    target.pop("$schema", None)
+    target = resolve_refs(target, ref_path.parent, stack + (ref_path,))
+
+    # A reference with sibling keywords still has to satisfy both
+    if resolved:
+        return {"allOf": [target], **resolved}
+    return target
+
+
+def build_bundle() -> dict[str, Any]:
+    """Returns the bundled schema along with the hash of the sources it came from"""
+    with SCHEMA_PATH.open("r", encoding="utf-8") as f:
+        base_schema = json.load(f)
+
+    return {
+        "source_hash": hash_schema_sources(),
+        "schema": resolve_refs(base_schema, SCHEMA_DIR),
+    }
+
+
+def write_bundle(path: Path = BUNDLE_PATH) -> dict[str, Any]:
+    """Builds the schema bundle and atomically writes it to disk"""
+    bundle = build_bundle()
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".schema-bundle-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(bundle, f, indent=4)
+            f.write("\n")
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+    return bundle
+
+
+def load_bundle(path: Path = BUNDLE_PATH) -> dict[str, Any]:
+    """Returns the schema bundle, rebuilding it if it is stale
+
+    The bundle is considered stale when it is missing or when the hash it records
+    no longer matches the source schema files. A stale bundle is rebuilt and, if
+    the schema directory is writable, saved for the next run.
+
+    """
+    source_hash = hash_schema_sources()
+
+    try:
+        with path.open("r", encoding="utf-8") as f:
+            bundle = json.load(f)
+    except (OSError, ValueError):
+        bundle = None
+
+    if bundle is None or bundle.get("source_hash") != source_hash:
+        try:
+            bundle = write_bundle(path)
+        except OSError:
+            bundle = build_bundle()
+
+    return bundle
+
+
+def load_bundled_schema(path: Path = BUNDLE_PATH) -> dict[str, Any]:
+    """Returns the pre-resolved schema, rebuilding the bundle if it is stale"""
+    return load_bundle(path)["schema"]
+
+
+if __name__ == "__main__":
+    bundle = write_bundle()
+    print(f"Wrote {BUNDLE_PATH} ({bundle['source_hash']})")
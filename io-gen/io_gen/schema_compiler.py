@@ -0,0 +1,403 @@
+"""
+Compile the bundled IO schema into a specialized Python validation function
+
+The generic jsonschema interpreter walks the schema for every instance it checks,
+re-evaluating `oneOf`, `allOf` and `if`/`then`/`else` keyword by keyword. This
+module turns the pre-resolved schema from `io_gen.schema_bundle` into straight-line
+Python that only answers whether a document is valid. It is meant for the happy
+path: when it rejects a document, `io_gen.validator` re-runs jsonschema to produce
+a detailed error.
+
+The generated module is written to `io_gen/schema_fast.py`. Run this module to
+regenerate it after editing the schema:
+
+    python -m io_gen.schema_compiler
+
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+from io_gen.schema_bundle import BUNDLE_PATH, hash_schema_sources, load_bundle
+
+FAST_VALIDATOR_PATH = Path(__file__).parent / "schema_fast.py"
+
+# Keywords that only annotate a schema and never affect validity
+ANNOTATION_KEYWORDS = {"$schema", "$comment", "title", "description", "default"}
+
+# Checks for each JSON type, written against the instance variable 'x'
+TYPE_CHECKS = {
+    "object": "isinstance(x, dict)",
+    "array": "isinstance(x, list)",
+    "string": "isinstance(x, str)",
+    "integer": "_is_integer(x)",
+    "number": "_is_number(x)",
+    "boolean": "isinstance(x, bool)",
+    "null": "x is None",
+}
+
+# Helpers shared by every generated validator. Equality follows JSON semantics, in
+# which booleans are never equal to numbers.
+PRELUDE = """\
+import re
+
+
+def _is_number(x):
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+def _is_integer(x):
+    if isinstance(x, float):
+        return x.is_integer()
+    return isinstance(x, int) and not isinstance(x, bool)
+
+
+def _equal(a, b):
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, str) or isinstance(b, str):
+        return a == b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_equal(i, j) for i, j in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    return a == b
+
+
+def _unique(items):
+    if all(isinstance(item, str) for item in items):
+        return len(set(items)) == len(items)
+    for i, item in enumerate(items):
+        if any(_equal(item, other) for other in items[i + 1 :]):
+            return False
+    return True
+"""
+
+
+class SchemaCompiler:
+    """Generates one Python function per subschema of a pre-resolved schema
+
+    Each generated function takes a single instance and returns True if it is valid
+    against its subschema. Keywords are checked in the order jsonschema would apply
+    them, and keywords that only apply to a given type are guarded by a type check,
+    just as in JSON Schema.
+
+    """
+
+    def __init__(self) -> None:
+        self.functions: list[str] = []
+        self.constants: list[str] = []
+        self.count = 0
+
+    def new_name(self, prefix: str) -> str:
+        self.count += 1
+        return f"{prefix}{self.count}"
+
+    def add_constant(self, source: str) -> str:
+        name = self.new_name("_c")
+        self.constants.append(f"{name} = {source}")
+        return name
+
+    def compile(self, schema: Any) -> str:
+        """Compiles a subschema and returns the name of its generated function"""
+        name = self.new_name("_v")
+
+        if schema is True or schema == {}:
+            self.functions.append(f"def {name}(x):\n    return True\n")
+            return name
+        if schema is False:
+            self.functions.append(f"def {name}(x):\n    return False\n")
+            return name
+        if not isinstance(schema, dict):
+            msg = f"Cannot compile schema of type {type(schema).__name__}"
+            raise ValueError(msg)
+
+        unknown = set(schema) - ANNOTATION_KEYWORDS - set(KEYWORDS)
+        if unknown:
+            msg = f"Cannot compile unsupported schema keywords {sorted(unknown)}"
+            raise ValueError(msg)
+
+        body = []
+        for keyword, handler in KEYWORDS.items():
+            if keyword in schema:
+                body.extend(handler(self, schema))
+
+        body.append("return True")
+        source = f"def {name}(x):\n" + "".join(f"    {line}\n" for line in body)
+        self.functions.append(source)
+        return name
+
+
+def compile_type(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    types = schema["type"]
+    if isinstance(types, str):
+        types = [types]
+    if len(types) == 1:
+        checks = TYPE_CHECKS[types[0]]
+    else:
+        checks = " or ".join(f"({TYPE_CHECKS[name]})" for name in types)
+    return [f"if not ({checks}):", "    return False"]
+
+
+def compile_enum(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    values = schema["enum"]
+    if all(isinstance(value, str) for value in values):
+        name = compiler.add_constant(f"frozenset({sorted(values)!r})")
+        return [f"if not (isinstance(x, str) and x in {name}):", "    return False"]
+
+    name = compiler.add_constant(repr(values))
+    return [f"if not any(_equal(x, value) for value in {name}):", "    return False"]
+
+
+def compile_const(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    name = compiler.add_constant(repr(schema["const"]))
+    return [f"if not _equal(x, {name}):", "    return False"]
+
+
+def compile_numeric(keyword: str, operator: str) -> Callable:
+    def compile_bound(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+        bound = schema[keyword]
+        return [f"if _is_number(x) and x {operator} {bound!r}:", "    return False"]
+
+    return compile_bound
+
+
+def compile_length(keyword: str, operator: str, kind: str) -> Callable:
+    def compile_bound(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+        bound = schema[keyword]
+        return [
+            f"if isinstance(x, {kind}) and len(x) {operator} {bound!r}:",
+            "    return False",
+        ]
+
+    return compile_bound
+
+
+def compile_pattern(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    name = compiler.add_constant(f"re.compile({schema['pattern']!r})")
+    return [f"if isinstance(x, str) and not {name}.search(x):", "    return False"]
+
+
+def compile_unique_items(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    if not schema["uniqueItems"]:
+        return []
+    return ["if isinstance(x, list) and not _unique(x):", "    return False"]
+
+
+def compile_items(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    func = compiler.compile(schema["items"])
+    return [
+        "if isinstance(x, list):",
+        "    for item in x:",
+        f"        if not {func}(item):",
+        "            return False",
+    ]
+
+
+def compile_required(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    if not schema["required"]:
+        return []
+    lines = ["if isinstance(x, dict):"]
+    for key in schema["required"]:
+        lines.extend([f"    if {key!r} not in x:", "        return False"])
+    return lines
+
+
+def compile_properties(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    if not schema["properties"]:
+        return []
+    lines = ["if isinstance(x, dict):"]
+    for key, subschema in schema["properties"].items():
+        func = compiler.compile(subschema)
+        lines.extend(
+            [f"    if {key!r} in x and not {func}(x[{key!r}]):", "        return False"]
+        )
+    return lines
+
+
+def compile_additional_properties(
+    compiler: SchemaCompiler, schema: dict[str, Any]
+) -> list[str]:
+    additional = schema["additionalProperties"]
+    if additional is True:
+        return []
+
+    known = compiler.add_constant(
+        f"frozenset({sorted(schema.get('properties', {}))!r})"
+    )
+    if additional is False:
+        return [
+            "if isinstance(x, dict):",
+            "    for key in x:",
+            f"        if key not in {known}:",
+            "            return False",
+        ]
+
+    func = compiler.compile(additional)
+    return [
+        "if isinstance(x, dict):",
+        "    for key, value in x.items():",
+        f"        if key not in {known} and not {func}(value):",
+        "            return False",
+    ]
+
+
+def compile_property_names(
+    compiler: SchemaCompiler, schema: dict[str, Any]
+) -> list[str]:
+    func = compiler.compile(schema["propertyNames"])
+    return [
+        "if isinstance(x, dict):",
+        "    for key in x:",
+        f"        if not {func}(key):",
+        "            return False",
+    ]
+
+
+def compile_all_of(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    lines = []
+    for subschema in schema["allOf"]:
+        func = compiler.compile(subschema)
+        lines.extend([f"if not {func}(x):", "    return False"])
+    return lines
+
+
+def compile_any_of(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    funcs = [compiler.compile(subschema) for subschema in schema["anyOf"]]
+    checks = " or ".join(f"{func}(x)" for func in funcs)
+    return [f"if not ({checks}):", "    return False"]
+
+
+def compile_one_of(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    funcs = [compiler.compile(subschema) for subschema in schema["oneOf"]]
+    checks = ", ".join(f"{func}(x)" for func in funcs)
+    return [f"if [{checks}].count(True) != 1:", "    return False"]
+
+
+def compile_not(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    func = compiler.compile(schema["not"])
+    return [f"if {func}(x):", "    return False"]
+
+
+def compile_if(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    lines = [f"if {compiler.compile(schema['if'])}(x):"]
+    if "then" in schema:
+        lines.extend([f"    if not {compiler.compile(schema['then'])}(x):"])
+        lines.append("        return False")
+    else:
+        lines.append("    pass")
+    if "else" in schema:
+        lines.extend(["else:", f"    if not {compiler.compile(schema['else'])}(x):"])
+        lines.append("        return False")
+    return lines
+
+
+def compile_nothing(compiler: SchemaCompiler, schema: dict[str, Any]) -> list[str]:
+    """Handles 'then' and 'else', which only have meaning next to 'if'"""
+    return []
+
+
+# Supported keywords and their code generators, in the order they are checked
+KEYWORDS = {
+    "type": compile_type,
+    "enum": compile_enum,
+    "const": compile_const,
+    "minimum": compile_numeric("minimum", "<"),
+    "maximum": compile_numeric("maximum", ">"),
+    "exclusiveMinimum": compile_numeric("exclusiveMinimum", "<="),
+    "exclusiveMaximum": compile_numeric("exclusiveMaximum", ">="),
+    "minLength": compile_length("minLength", "<", "str"),
+    "maxLength": compile_length("maxLength", ">", "str"),
+    "pattern": compile_pattern,
+    "minItems": compile_length("minItems", "<", "list"),
+    "maxItems": compile_length("maxItems", ">", "list"),
+    "uniqueItems": compile_unique_items,
+    "items": compile_items,
+    "required": compile_required,
+    "properties": compile_properties,
+    "additionalProperties": compile_additional_properties,
+    "propertyNames": compile_property_names,
+    "allOf": compile_all_of,
+    "anyOf": compile_any_of,
+    "oneOf": compile_one_of,
+    "not": compile_not,
+    "if": compile_if,
+    "then": compile_nothing,
+    "else": compile_nothing,
+}
+
+
+def compile_schema(schema: dict[str, Any], source_hash: str) -> str:
+    """Returns the source of a Python module that validates against a schema
+
+    The module defines `SOURCE_HASH`, the hash of the schema sources it was
+    compiled from, and `is_valid(x)`, which returns True for valid documents.
+
+    Raises:
+        ValueError: If the schema uses keywords the compiler does not support
+
+    """
+    compiler = SchemaCompiler()
+    root = compiler.compile(schema)
+
+    sections = [
+        '"""\nGenerated by io_gen.schema_compiler from the bundled IO schema.\n'
+        'Do not edit; run `python -m io_gen.schema_compiler` instead.\n"""\n',
+        PRELUDE,
+        f"SOURCE_HASH = {source_hash!r}\n",
+        "\n".join(compiler.constants) + "\n",
+        *compiler.functions,
+        f"is_valid = {root}\n",
+    ]
+    return "\n\n".join(sections)
+
+
+def load_compiled(source: str) -> Callable[[Any], bool]:
+    """Executes generated validator source and returns its `is_valid` function"""
+    namespace: dict[str, Any] = {"__name__": "io_gen.schema_fast"}
+    exec(compile(source, str(FAST_VALIDATOR_PATH), "exec"), namespace)
+    return namespace["is_valid"]
+
+
+def write_fast_validator(path: Path = FAST_VALIDATOR_PATH) -> str:
+    """Compiles the bundled schema and atomically writes the generated module"""
+    bundle = load_bundle(BUNDLE_PATH)
+    source = compile_schema(bundle["schema"], bundle["source_hash"])
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".schema-fast-")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(source)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+    return bundle["source_hash"]
+
+
+def load_fast_validator() -> Callable[[Any], bool]:
+    """Returns the generated validation function for the current schema
+
+    The checked-in `io_gen.schema_fast` module is used when it was compiled from the
+    current schema sources. Otherwise the schema is compiled in memory, so a stale
+    generated module can never accept a document the schema would reject.
+
+    """
+    try:
+        from io_gen import schema_fast
+    except ImportError:
+        schema_fast = None
+
+    if schema_fast is not None and schema_fast.SOURCE_HASH == hash_schema_sources():
+        return schema_fast.is_valid
+
+    bundle = load_bundle(BUNDLE_PATH)
+    return load_compiled(compile_schema(bundle["schema"], bundle["source_hash"]))
+
+
+if __name__ == "__main__":
+    source_hash = write_fast_validator()
+    print(f"Wrote {FAST_VALIDATOR_PATH} ({source_hash})")
@@ -0,0 +1,812 @@
+"""
+Generated by io_gen.schema_compiler from the bundled IO schema.
+Do not edit; run `python -m io_gen.schema_compiler` instead.
+"""
+
+
+import re
+
+
+def _is_number(x):
+    return isinstance(x, (int, float)) and not isinstance(x, bool)
+
+
+def _is_integer(x):
+    if isinstance(x, float):
+        return x.is_integer()
+    return isinstance(x, int) and not isinstance(x, bool)
+
+
+def _equal(a, b):
+    if isinstance(a, bool) or isinstance(b, bool):
+        return isinstance(a, bool) and isinstance(b, bool) and a == b
+    if isinstance(a, str) or isinstance(b, str):
+        return a == b
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_equal(i, j) for i, j in zip(a, b))
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_equal(a[k], b[k]) for k in a)
+    return a == b
+
+
+def _unique(items):
+    if all(isinstance(item, str) for item in items):
+        return len(set(items)) == len(items)
+    for i, item in enumerate(items):
+        if any(_equal(item, other) for other in items[i + 1 :]):
+            return False
+    return True
+
+
+SOURCE_HASH = '5424744a587fdc767ceec000a317c3178702d2aa0b6d13663be34c84ee5b89a3'
+
+
+_c8 = frozenset(['in', 'inout', 'out'])
+_c10 = frozenset(['ibuf', 'ibufds', 'infer', 'iobuf', 'obuf', 'obufds'])
+_c15 = frozenset(['LVCMOS12', 'LVCMOS15', 'LVCMOS18', 'LVCMOS25', 'LVCMOS33', 'LVDS', 'LVDS_25', 'SSTL15', 'SSTL18', 'TMDS_33'])
+_c17 = frozenset(['clock', 'emio', 'led', 'pmod', 'reset', 'switch', 'uart', 'unused'])
+_c26 = frozenset(['n', 'p'])
+_c32 = frozenset(['n', 'p'])
+_c44 = frozenset(['n', 'p'])
+_c50 = frozenset(['n', 'p'])
+_c52 = frozenset(['LVCMOS12', 'LVCMOS15', 'LVCMOS18', 'LVCMOS25', 'LVCMOS33', 'LVDS', 'LVDS_25', 'SSTL15', 'SSTL18', 'TMDS_33'])
+_c54 = frozenset(['bank', 'iostandard', 'offset', 'pins', 'pinset'])
+_c62 = frozenset(['hdl', 'xdc'])
+_c63 = frozenset(['bank', 'buffer', 'comment', 'direction', 'generate', 'group', 'instance', 'iostandard', 'multibank', 'name', 'parameters', 'pins', 'pinset', 'width'])
+_c67 = False
+_c86 = frozenset([])
+_c89 = frozenset(['LVCMOS12', 'LVCMOS15', 'LVCMOS18', 'LVCMOS25', 'LVCMOS33', 'LVDS', 'LVDS_25', 'SSTL15', 'SSTL18', 'TMDS_33'])
+_c91 = frozenset(['HD', 'HP', 'HR'])
+_c93 = frozenset(['comment', 'iostandard', 'performance'])
+_c95 = re.compile('^[0-9]+$')
+
+
+def _v2(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v3(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v6(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v7(x):
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x in _c8):
+        return False
+    return True
+
+
+def _v9(x):
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x in _c10):
+        return False
+    return True
+
+
+def _v11(x):
+    if not (isinstance(x, dict)):
+        return False
+    return True
+
+
+def _v12(x):
+    if not ((isinstance(x, str)) or (x is None)):
+        return False
+    return True
+
+
+def _v13(x):
+    if not (_is_integer(x)):
+        return False
+    if _is_number(x) and x < 0:
+        return False
+    return True
+
+
+def _v14(x):
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x in _c15):
+        return False
+    return True
+
+
+def _v16(x):
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x in _c17):
+        return False
+    return True
+
+
+def _v19(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v21(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v20(x):
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not _unique(x):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v21(item):
+                return False
+    return True
+
+
+def _v18(x):
+    if [_v19(x), _v20(x)].count(True) != 1:
+        return False
+    return True
+
+
+def _v24(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v25(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v23(x):
+    if isinstance(x, dict):
+        if 'p' not in x:
+            return False
+        if 'n' not in x:
+            return False
+    if isinstance(x, dict):
+        if 'p' in x and not _v24(x['p']):
+            return False
+        if 'n' in x and not _v25(x['n']):
+            return False
+    if isinstance(x, dict):
+        for key in x:
+            if key not in _c26:
+                return False
+    return True
+
+
+def _v29(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v28(x):
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not _unique(x):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v29(item):
+                return False
+    return True
+
+
+def _v31(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v30(x):
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not _unique(x):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v31(item):
+                return False
+    return True
+
+
+def _v27(x):
+    if isinstance(x, dict):
+        if 'p' not in x:
+            return False
+        if 'n' not in x:
+            return False
+    if isinstance(x, dict):
+        if 'p' in x and not _v28(x['p']):
+            return False
+        if 'n' in x and not _v30(x['n']):
+            return False
+    if isinstance(x, dict):
+        for key in x:
+            if key not in _c32:
+                return False
+    return True
+
+
+def _v22(x):
+    if not (isinstance(x, dict)):
+        return False
+    if [_v23(x), _v27(x)].count(True) != 1:
+        return False
+    return True
+
+
+def _v35(x):
+    if not (_is_integer(x)):
+        return False
+    if _is_number(x) and x < 0:
+        return False
+    return True
+
+
+def _v37(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v39(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v38(x):
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not _unique(x):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v39(item):
+                return False
+    return True
+
+
+def _v36(x):
+    if [_v37(x), _v38(x)].count(True) != 1:
+        return False
+    return True
+
+
+def _v42(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v43(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v41(x):
+    if isinstance(x, dict):
+        if 'p' not in x:
+            return False
+        if 'n' not in x:
+            return False
+    if isinstance(x, dict):
+        if 'p' in x and not _v42(x['p']):
+            return False
+        if 'n' in x and not _v43(x['n']):
+            return False
+    if isinstance(x, dict):
+        for key in x:
+            if key not in _c44:
+                return False
+    return True
+
+
+def _v47(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v46(x):
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not _unique(x):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v47(item):
+                return False
+    return True
+
+
+def _v49(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v48(x):
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list) and not _unique(x):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v49(item):
+                return False
+    return True
+
+
+def _v45(x):
+    if isinstance(x, dict):
+        if 'p' not in x:
+            return False
+        if 'n' not in x:
+            return False
+    if isinstance(x, dict):
+        if 'p' in x and not _v46(x['p']):
+            return False
+        if 'n' in x and not _v48(x['n']):
+            return False
+    if isinstance(x, dict):
+        for key in x:
+            if key not in _c50:
+                return False
+    return True
+
+
+def _v40(x):
+    if not (isinstance(x, dict)):
+        return False
+    if [_v41(x), _v45(x)].count(True) != 1:
+        return False
+    return True
+
+
+def _v51(x):
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x in _c52):
+        return False
+    return True
+
+
+def _v53(x):
+    if not (_is_integer(x)):
+        return False
+    if _is_number(x) and x < 0:
+        return False
+    return True
+
+
+def _v55(x):
+    if isinstance(x, dict):
+        if 'pins' not in x:
+            return False
+    return True
+
+
+def _v56(x):
+    if isinstance(x, dict):
+        if 'pinset' not in x:
+            return False
+    return True
+
+
+def _v34(x):
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if 'bank' not in x:
+            return False
+        if 'offset' not in x:
+            return False
+    if isinstance(x, dict):
+        if 'bank' in x and not _v35(x['bank']):
+            return False
+        if 'pins' in x and not _v36(x['pins']):
+            return False
+        if 'pinset' in x and not _v40(x['pinset']):
+            return False
+        if 'iostandard' in x and not _v51(x['iostandard']):
+            return False
+        if 'offset' in x and not _v53(x['offset']):
+            return False
+    if isinstance(x, dict):
+        for key in x:
+            if key not in _c54:
+                return False
+    if [_v55(x), _v56(x)].count(True) != 1:
+        return False
+    return True
+
+
+def _v33(x):
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list) and len(x) < 1:
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v34(item):
+                return False
+    return True
+
+
+def _v57(x):
+    if not (_is_integer(x)):
+        return False
+    if _is_number(x) and x < 1:
+        return False
+    return True
+
+
+def _v58(x):
+    if not (isinstance(x, bool)):
+        return False
+    return True
+
+
+def _v60(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v61(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v59(x):
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if 'xdc' in x and not _v60(x['xdc']):
+            return False
+        if 'hdl' in x and not _v61(x['hdl']):
+            return False
+    if isinstance(x, dict):
+        for key in x:
+            if key not in _c62:
+                return False
+    return True
+
+
+def _v66(x):
+    if not _equal(x, _c67):
+        return False
+    return True
+
+
+def _v65(x):
+    if isinstance(x, dict):
+        if 'generate' not in x:
+            return False
+    if isinstance(x, dict):
+        if 'generate' in x and not _v66(x['generate']):
+            return False
+    return True
+
+
+def _v68(x):
+    if isinstance(x, dict):
+        if 'name' not in x:
+            return False
+    return True
+
+
+def _v69(x):
+    if isinstance(x, dict):
+        if 'name' not in x:
+            return False
+        if 'direction' not in x:
+            return False
+        if 'buffer' not in x:
+            return False
+    return True
+
+
+def _v64(x):
+    if _v65(x):
+        if not _v68(x):
+            return False
+    else:
+        if not _v69(x):
+            return False
+    return True
+
+
+def _v71(x):
+    if isinstance(x, dict):
+        if 'multibank' not in x:
+            return False
+    return True
+
+
+def _v72(x):
+    if isinstance(x, dict):
+        if 'width' not in x:
+            return False
+    return True
+
+
+def _v70(x):
+    if _v71(x):
+        if not _v72(x):
+            return False
+    return True
+
+
+def _v75(x):
+    if not (isinstance(x, list)):
+        return False
+    return True
+
+
+def _v74(x):
+    if isinstance(x, dict):
+        if 'pins' not in x:
+            return False
+    if isinstance(x, dict):
+        if 'pins' in x and not _v75(x['pins']):
+            return False
+    return True
+
+
+def _v76(x):
+    if isinstance(x, dict):
+        if 'width' not in x:
+            return False
+    return True
+
+
+def _v73(x):
+    if _v74(x):
+        if not _v76(x):
+            return False
+    return True
+
+
+def _v80(x):
+    if not (isinstance(x, list)):
+        return False
+    return True
+
+
+def _v79(x):
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if 'p' not in x:
+            return False
+    if isinstance(x, dict):
+        if 'p' in x and not _v80(x['p']):
+            return False
+    return True
+
+
+def _v78(x):
+    if isinstance(x, dict):
+        if 'pinset' not in x:
+            return False
+    if isinstance(x, dict):
+        if 'pinset' in x and not _v79(x['pinset']):
+            return False
+    return True
+
+
+def _v81(x):
+    if isinstance(x, dict):
+        if 'width' not in x:
+            return False
+    return True
+
+
+def _v77(x):
+    if _v78(x):
+        if not _v81(x):
+            return False
+    return True
+
+
+def _v82(x):
+    if isinstance(x, dict):
+        if 'pins' not in x:
+            return False
+    return True
+
+
+def _v83(x):
+    if isinstance(x, dict):
+        if 'pinset' not in x:
+            return False
+    return True
+
+
+def _v84(x):
+    if isinstance(x, dict):
+        if 'multibank' not in x:
+            return False
+    return True
+
+
+def _v5(x):
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if 'name' in x and not _v6(x['name']):
+            return False
+        if 'direction' in x and not _v7(x['direction']):
+            return False
+        if 'buffer' in x and not _v9(x['buffer']):
+            return False
+        if 'parameters' in x and not _v11(x['parameters']):
+            return False
+        if 'instance' in x and not _v12(x['instance']):
+            return False
+        if 'bank' in x and not _v13(x['bank']):
+            return False
+        if 'iostandard' in x and not _v14(x['iostandard']):
+            return False
+        if 'group' in x and not _v16(x['group']):
+            return False
+        if 'pins' in x and not _v18(x['pins']):
+            return False
+        if 'pinset' in x and not _v22(x['pinset']):
+            return False
+        if 'multibank' in x and not _v33(x['multibank']):
+            return False
+        if 'width' in x and not _v57(x['width']):
+            return False
+        if 'generate' in x and not _v58(x['generate']):
+            return False
+        if 'comment' in x and not _v59(x['comment']):
+            return False
+    if isinstance(x, dict):
+        for key in x:
+            if key not in _c63:
+                return False
+    if not _v64(x):
+        return False
+    if not _v70(x):
+        return False
+    if not _v73(x):
+        return False
+    if not _v77(x):
+        return False
+    if [_v82(x), _v83(x), _v84(x)].count(True) != 1:
+        return False
+    return True
+
+
+def _v4(x):
+    if not (isinstance(x, list)):
+        return False
+    if isinstance(x, list):
+        for item in x:
+            if not _v5(item):
+                return False
+    return True
+
+
+def _v88(x):
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x in _c89):
+        return False
+    return True
+
+
+def _v90(x):
+    if not (isinstance(x, str)):
+        return False
+    if not (isinstance(x, str) and x in _c91):
+        return False
+    return True
+
+
+def _v92(x):
+    if not (isinstance(x, str)):
+        return False
+    return True
+
+
+def _v87(x):
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if 'iostandard' not in x:
+            return False
+        if 'performance' not in x:
+            return False
+    if isinstance(x, dict):
+        if 'iostandard' in x and not _v88(x['iostandard']):
+            return False
+        if 'performance' in x and not _v90(x['performance']):
+            return False
+        if 'comment' in x and not _v92(x['comment']):
+            return False
+    if isinstance(x, dict):
+        for key in x:
+            if key not in _c93:
+                return False
+    return True
+
+
+def _v94(x):
+    if isinstance(x, str) and not _c95.search(x):
+        return False
+    return True
+
+
+def _v85(x):
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        for key, value in x.items():
+            if key not in _c86 and not _v87(value):
+                return False
+    if isinstance(x, dict):
+        for key in x:
+            if not _v94(key):
+                return False
+    return True
+
+
+def _v1(x):
+    if not (isinstance(x, dict)):
+        return False
+    if isinstance(x, dict):
+        if 'title' not in x:
+            return False
+        if 'part' not in x:
+            return False
+        if 'signals' not in x:
+            return False
+    if isinstance(x, dict):
+        if 'title' in x and not _v2(x['title']):
+            return False
+        if 'part' in x and not _v3(x['part']):
+            return False
+        if 'signals' in x and not _v4(x['signals']):
+            return False
+        if 'banks' in x and not _v85(x['banks']):
+            return False
+    return True
+
+
+is_valid = _v1
@@ -2,21 +2,23 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-from copy import deepcopy
-from typing import Any
+from typing import Any, Iterable, Iterator, Mapping, Sequence
 
-from io_gen.utils import (
-    get_sig_width,
-    is_array_pins,
-    is_array_pinset,
-    is_multibank_pins,
-    is_multibank_pinset,
-    is_scalar_pins,
-    is_scalar_pinset,
-)
+from io_gen.records import SignalEntry
+from io_gen.utils import SignalKind, classify_signal, freeze, get_sig_width
 
+# The pin definition key and the diff_pair and bus flags for each kind of signal
+SIGNAL_KIND_FIELDS = {
+    SignalKind.SCALAR_PINS: ("pins", False, False),
+    SignalKind.SCALAR_PINSET: ("pinset", True, False),
+    SignalKind.ARRAY_PINS: ("pins", False, True),
+    SignalKind.ARRAY_PINSET: ("pinset", True, True),
+    SignalKind.MULTIBANK_PINS: ("multibank", False, True),
+    SignalKind.MULTIBANK_PINSET: ("multibank", True, True),
+}
 
-def extract_signal_table(signals: list[dict[str, Any]]) -> list[dict[str, Any]]:
+
+def extract_signal_table(signals: list[dict[str, Any]]) -> list[SignalEntry]:
     """Convert list of signal definitions into a signal table keyed by name.
 
     This function builds a per-signal metadata table (width, group, comment, etc.) based
@@ -27,13 +29,32 @@ def extract_signal_table(signals: list[dict[str, Any]]) -> list[dict[str, Any]]:
         signals: List of signal definitions from the YAML input.
 
     Returns:
-        list of dict
+        list of SignalEntry records, see `form_signal_entry`
+
+    Raises:
+        ValueError - If duplicate signal names are present in the input data
+
+    """
+    return list(iter_signal_table(signals))
+
+
+def iter_signal_table(signals: Iterable[dict[str, Any]]) -> Iterator[SignalEntry]:
+    """Lazily yields signal table entries as signal definitions arrive.
+
+    This is the streaming form of `extract_signal_table`. Only the set of names seen
+    so far is kept, so a duplicate signal name is reported as soon as the second
+    definition is reached and before anything is yielded for it.
+
+    Args:
+        signals: Iterable of signal definitions from the YAML input.
+
+    Yields:
+        One signal table entry per generated signal, in input order.
 
     Raises:
         ValueError - If duplicate signal names are present in the input data
 
     """
-    sig_table = []
     sig_names = set()
 
     for sig in signals:
@@ -49,16 +70,23 @@ def extract_signal_table(signals: list[dict[str, Any]]) -> list[dict[str, Any]]:
             raise ValueError(msg)
         else:
             sig_names.add(name)
+        yield form_signal_entry(sig)
 
-        # No reason to keep dragging these generate = true keys around everywhere
-        sig.pop("generate", None)
-        sig_table.append(form_signal_entry(sig))
 
-    return sig_table
+def form_signal_entry(signal: dict[str, Any]) -> SignalEntry:
+    """Creates a signal table entry from a YAML entry
 
+    The entry is a slotted record that reads like a dict, see `io_gen.records`. The
+    YAML entry is never modified. Its pin definition, buffer parameters and
+    comments are carried over as read-only views, with tuples for pin lists and
+    read-only mappings for pinsets, multibank fragments, parameters and comments,
+    so the parsed document can be reused or shared.
 
-def form_signal_entry(signal: dict[str, Any]) -> dict[str, Any]:
-    """Creates a signal table entry from a YAML entry"""
+    """
+
+    # Classify the signal once and cache the result on the entry so that later
+    # stages can dispatch on it without inspecting the pin definition again
+    kind = classify_signal(signal)
 
     # These fields are required by the schema (for signals that will be
     # added to the table)
@@ -81,13 +109,13 @@ def form_signal_entry(signal: dict[str, Any]) -> dict[str, Any]:
 
     # All signal types will get these keys, but for inferred types, we fallback to
     # an empty dict or None (just like comments)
-    entry["parameters"] = signal.get("parameters", {})
+    entry["parameters"] = freeze(signal.get("parameters", {}))
     entry["instance"] = signal.get("instance", None)
 
     # Comment and group for signals are optional
     entry["group"] = signal.get("group", "")
     # Signals contain structured comments so just leave this empty if none provided
-    entry["comment"] = signal.get("comment", {})
+    entry["comment"] = freeze(signal.get("comment", {}))
 
     # Recall that 'iostandard' is an optional property for the entire
     # signal (including multibank - multibank signals can specify the
@@ -96,46 +124,34 @@ def form_signal_entry(signal: dict[str, Any]) -> dict[str, Any]:
         entry["iostandard"] = signal["iostandard"]
 
     # Per the schema, bank is required for multibank signals (so when we
-    # deepcopy it later we'll get the banks) but is optional for other
+    # freeze it later we'll get the banks) but is optional for other
     # kinds of signals so that we can inherit the 'iostandard' per bank.
-    if not is_multibank_pinset(signal) and not is_multibank_pins(signal):
+    if kind not in (SignalKind.MULTIBANK_PINS, SignalKind.MULTIBANK_PINSET):
         if "bank" in signal:
             entry["bank"] = signal["bank"]
 
     # Determine pin type
-    if is_scalar_pins(signal):
-        entry["pins"] = deepcopy(signal["pins"])
-        entry["diff_pair"] = False
-        entry["bus"] = False
-    elif is_scalar_pinset(signal):
-        entry["pinset"] = deepcopy(signal["pinset"])
-        entry["diff_pair"] = True
-        entry["bus"] = False
-    elif is_array_pins(signal):
-        entry["pins"] = deepcopy(signal["pins"])
-        entry["diff_pair"] = False
-        entry["bus"] = True
-    elif is_array_pinset(signal):
-        entry["pinset"] = deepcopy(signal["pinset"])
-        entry["diff_pair"] = True
-        entry["bus"] = True
-    elif is_multibank_pins(signal):
-        entry["multibank"] = deepcopy(signal["multibank"])
-        entry["diff_pair"] = False
-        entry["bus"] = True
-    elif is_multibank_pinset(signal):
-        entry["multibank"] = deepcopy(signal["multibank"])
-        entry["diff_pair"] = True
-        entry["bus"] = True
-    else:
-        msg = f"Signal '{name}' has missing or malformed pin definition"
-        raise ValueError(msg)
-
-    entry["width"] = get_sig_width(signal)
-
-    return entry
-
-
-def get_signal_names(signal_table: list[dict[str, Any]]) -> list[str]:
+    pin_key, diff_pair, bus = SIGNAL_KIND_FIELDS[kind]
+    entry[pin_key] = freeze(signal[pin_key])
+    entry["diff_pair"] = diff_pair
+    entry["bus"] = bus
+    entry["kind"] = kind
+
+    entry["width"] = get_sig_width(signal, kind)
+
+    return SignalEntry(**entry)
+
+
+def restore_signal_entry(signal: dict[str, Any]) -> SignalEntry:
+    """Rebuilds a signal table entry from its JSON form, as written with `thaw`"""
+    kind = SignalKind(signal["kind"])
+    pin_key = SIGNAL_KIND_FIELDS[kind][0]
+    for key in (pin_key, "parameters", "comment"):
+        signal[key] = freeze(signal[key])
+    signal["kind"] = kind
+    return SignalEntry(**signal)
+
+
+def get_signal_names(signal_table: Sequence[Mapping[str, Any]]) -> list[str]:
     """Returns a list of signal names from the signal table"""
     return list(set(sig["name"] for sig in signal_table))
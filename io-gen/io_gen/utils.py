@@ -1,6 +1,90 @@
-from typing import Any
+from enum import StrEnum
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
 
-def is_scalar_pins(signal: dict[str, Any]) -> bool:
+class SignalKind(StrEnum):
+    """The pin structure of a signal, determined once when it enters the signal table"""
+
+    SCALAR_PINS = "scalar_pins"
+    ARRAY_PINS = "array_pins"
+    SCALAR_PINSET = "scalar_pinset"
+    ARRAY_PINSET = "array_pinset"
+    MULTIBANK_PINS = "multibank_pins"
+    MULTIBANK_PINSET = "multibank_pinset"
+
+def classify_signal(signal: Mapping[str, Any]) -> SignalKind:
+    """Classifies a signal from YAML by its pin structure in a single pass
+
+    This performs the same checks as the `is_*` predicates below, but inspects each
+    multibank fragment exactly once instead of once per predicate.
+
+    Raises:
+        ValueError: If the pin definition is missing, mixed or of unsupported type
+
+    """
+    name = signal.get('name', "?")
+
+    if 'pins' in signal:
+        if isinstance(signal['pins'], str):
+            return SignalKind.SCALAR_PINS
+        return SignalKind.ARRAY_PINS
+
+    if 'pinset' in signal:
+        pinset = signal['pinset']
+        p_pins = pinset.get('p')
+        n_pins = pinset.get('n')
+        if type(p_pins) != type(n_pins):
+            msg = (
+                f"Signal '{name}' has mismatched types in 'pinset': "
+                f"'p' is {type(p_pins).__name__}, 'n' is {type(n_pins).__name__}. "
+                f"Both must be lists of equal length or both must be strings."
+            )
+            raise ValueError(msg)
+        if isinstance(p_pins, str):
+            return SignalKind.SCALAR_PINSET
+        if isinstance(p_pins, (list, tuple)):
+            return SignalKind.ARRAY_PINSET
+        msg = (
+            f"Signal '{name}' has unsupported pinset types: "
+            f"{type(p_pins).__name__}. Must be str or list."
+        )
+        raise ValueError(msg)
+
+    if 'multibank' in signal:
+        multibank = signal['multibank']
+        if not multibank:
+            msg = f"Multibank signal '{name}' has a missing pin definition"
+            raise ValueError(msg)
+
+        fragment_types = set()
+        for fragment in multibank:
+            if 'pins' in fragment:
+                fragment_types.add('pins')
+            elif 'pinset' in fragment:
+                fragment_types.add('pinset')
+            else:
+                msg = f"Signal '{name}' contains unknown pin types"
+                raise ValueError(msg)
+
+        if len(fragment_types) > 1:
+            msg = f"Multibank signal {name} contains mixed pin definitions"
+            raise ValueError(msg)
+
+        if 'pins' in fragment_types:
+            return SignalKind.MULTIBANK_PINS
+        return SignalKind.MULTIBANK_PINSET
+
+    msg = f"Signal '{name}' has missing or malformed pin definition"
+    raise ValueError(msg)
+
+def get_signal_kind(signal: Mapping[str, Any]) -> SignalKind:
+    """Returns the cached kind of a signal table entry, classifying it if absent"""
+    kind = signal.get('kind')
+    if kind is None:
+        return classify_signal(signal)
+    return SignalKind(kind)
+
+def is_scalar_pins(signal: Mapping[str, Any]) -> bool:
     """Returns true if signal from YAML is a single ended pin"""
     if 'pins' not in signal:
         return False
@@ -11,7 +95,7 @@ def is_scalar_pins(signal: dict[str, Any]) -> bool:
     else:
         return False
 
-def is_scalar_pinset(signal: dict[str, Any]) -> bool:
+def is_scalar_pinset(signal: Mapping[str, Any]) -> bool:
     """Returns true if signal from YAML is a single diff pair"""
     if 'pinset' not in signal:
         return False
@@ -29,7 +113,7 @@ def is_scalar_pinset(signal: dict[str, Any]) -> bool:
         raise ValueError(msg)
 
     # Don't do any width checks - that's later
-    if isinstance(p_pins, list):
+    if isinstance(p_pins, (list, tuple)):
         return False
     elif isinstance(p_pins, str):
         return True
@@ -40,7 +124,7 @@ def is_scalar_pinset(signal: dict[str, Any]) -> bool:
         )
         raise ValueError(msg)
 
-def is_array_pins(signal: dict[str, Any]) -> bool:
+def is_array_pins(signal: Mapping[str, Any]) -> bool:
     """Returns true if signal from YAML is an array of single-ended pins"""
     if 'pins' not in signal:
         return False
@@ -50,7 +134,7 @@ def is_array_pins(signal: dict[str, Any]) -> bool:
     else:
         return True
 
-def is_array_pinset(signal: dict[str, Any]) -> bool:
+def is_array_pinset(signal: Mapping[str, Any]) -> bool:
     """Returns true if signal from YAML is an array of diff pairs"""
     if 'pinset' not in signal:
         return False
@@ -68,7 +152,7 @@ def is_array_pinset(signal: dict[str, Any]) -> bool:
         raise ValueError(msg)
 
     # Don't do any width checks - that's later
-    if isinstance(p_pins, list):
+    if isinstance(p_pins, (list, tuple)):
         return True
     elif isinstance(p_pins, str):
         return False
@@ -79,7 +163,7 @@ def is_array_pinset(signal: dict[str, Any]) -> bool:
         )
         raise ValueError(msg)
 
-def is_multibank_pins(signal: dict[str, Any]) -> bool:
+def is_multibank_pins(signal: Mapping[str, Any]) -> bool:
     """Returns true if signal from YAML is multibank array of single ended pins"""
     if 'multibank' not in signal:
         return False
@@ -97,7 +181,7 @@ def is_multibank_pins(signal: dict[str, Any]) -> bool:
     else:
         return False
      
-def is_multibank_pinset(signal: dict[str, Any]) -> bool:
+def is_multibank_pinset(signal: Mapping[str, Any]) -> bool:
     """Returns true if signal from YAML is multibank array of diff pairs"""
     if 'multibank' not in signal:
         return False
@@ -115,7 +199,7 @@ def is_multibank_pinset(signal: dict[str, Any]) -> bool:
     else:
         return False
 
-def is_mixed_multibank(signal: dict[str, Any]) -> bool:
+def is_mixed_multibank(signal: Mapping[str, Any]) -> bool:
     """Returns true if a multibank signal has mixed pin and pinset fragments"""
     assert 'multibank' in signal, f"Signal '{signal['name']}' does not contain 'multibank'"
 
@@ -131,7 +215,7 @@ def is_mixed_multibank(signal: dict[str, Any]) -> bool:
 
     return len(set(fragment_types)) > 1
 
-def check_multibank_width(signal: dict[str, Any]) -> None:
+def check_multibank_width(signal: Mapping[str, Any]) -> None:
     """Check that multibank signals define their offsets and widths correctly
 
     Raises:
@@ -139,35 +223,105 @@ def check_multibank_width(signal: dict[str, Any]) -> None:
     """
     assert 'multibank' in signal, f"Signal '{signal['name']}' does not contain 'multibank'"
 
-    width = signal["width"]
-    expected = set(range(width))
-    seen = set()
+    intervals = [
+        (fragment['offset'], get_multibank_fragment_width(fragment))
+        for fragment in signal['multibank']
+    ]
+    check_index_coverage(signal['name'], intervals, signal['width'])
+
+def get_index_runs(indices: Iterable[int]) -> list[tuple[int, int]]:
+    """Collapses bit indices into (offset, count) runs of consecutive indices"""
+    runs = []
+    for index in indices:
+        if runs and index == runs[-1][0] + runs[-1][1]:
+            runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+        else:
+            runs.append((index, 1))
+    return runs
 
-    for fragment in signal["multibank"]:
-        count = get_multibank_fragment_width(fragment)
+def find_coverage_errors(
+    intervals: Iterable[tuple[int, int]], width: int
+) -> list[tuple[str, int, int]]:
+    """Finds where (offset, count) intervals fail to cover 0..width - 1 exactly once
 
-        offset = fragment["offset"]
-        indices = set(range(offset, offset + count))
-        overlap = seen & indices
-        if overlap:
-            msg = f"Overlapping multibank indices at offsets {sorted(overlap)}"
-            raise ValueError(msg)
+    The intervals are sorted by offset and swept once, so the cost depends on the
+    number of intervals rather than on the width they cover.
 
-        seen.update(indices)
+    Returns:
+        A list of (problem, first, last) index ranges, where the problem is 'gap',
+        'overlap' or 'out of range', in index order for each kind of problem.
 
-    if seen != expected:
-        msg = (
-            f"Multibank fragments cover indices {sorted(seen)}, "
-            f"but expected full range 0..{width - 1}"
-        )
-        raise ValueError(msg)
+    """
+    gaps = []
+    overlaps = []
+    out_of_range = []
+
+    # Everything below `covered` is covered by an earlier interval
+    covered = 0
+    for offset, count in sorted(interval for interval in intervals if interval[1] > 0):
+        end = offset + count
+        if offset < 0:
+            out_of_range.append((offset, min(end, 0) - 1))
+            offset = 0
+            if end <= 0:
+                continue
+
+        if offset > covered and covered < width:
+            gaps.append((covered, min(offset, width) - 1))
+        elif offset < covered:
+            overlaps.append((offset, min(end, covered) - 1))
+
+        # Only the indices past the width that no earlier interval reported
+        first = max(offset, width, covered)
+        if first < end:
+            if out_of_range and out_of_range[-1][1] == first - 1:
+                out_of_range[-1] = (out_of_range[-1][0], end - 1)
+            else:
+                out_of_range.append((first, end - 1))
+
+        covered = max(covered, end)
+
+    if covered < width:
+        gaps.append((covered, width - 1))
+
+    return (
+        [('gap', first, last) for first, last in gaps]
+        + [('overlap', first, last) for first, last in overlaps]
+        + [('out of range', first, last) for first, last in out_of_range]
+    )
+
+def check_index_coverage(
+    name: str, intervals: Iterable[tuple[int, int]], width: int
+) -> None:
+    """Checks that (offset, count) intervals cover bits 0..width - 1 exactly once
 
-def get_sig_width(signal: dict[str, Any]) -> int:
-    """Returns width of a signal"""
+    Raises:
+        ValueError: If there are gaps, overlaps or indices outside the width, giving
+            each offending index range
+
+    """
+    errors = find_coverage_errors(intervals, width)
+    if not errors:
+        return
+
+    ranges = ', '.join(
+        f"{problem} at {first}" if first == last else f"{problem} at {first}..{last}"
+        for problem, first, last in errors
+    )
+    msg = (
+        f"Signal '{name}' does not cover indices 0..{width - 1} exactly once: "
+        f"{ranges}"
+    )
+    raise ValueError(msg)
+
+def get_sig_width(signal: Mapping[str, Any], kind: SignalKind | None = None) -> int:
+    """Returns width of a signal, classifying it first if its kind is not given"""
+    if kind is None:
+        kind = get_signal_kind(signal)
 
     # Independently calculate the width of the signal - note that scalars do not need
     # to provide width, but if they do, we check it and error out if it isn't 1.
-    if is_scalar_pins(signal) or is_scalar_pinset(signal):
+    if kind in (SignalKind.SCALAR_PINS, SignalKind.SCALAR_PINSET):
         if signal.get('width', 1) > 1:
             msg = f"Scalar signal '{signal['name']}' has width > 1"
             raise ValueError(msg)
@@ -179,10 +333,10 @@ def get_sig_width(signal: dict[str, Any]) -> int:
         msg = f"Signal '{signal['name']}' must declare 'width'"
         raise ValueError(msg)
 
-    if is_array_pins(signal):
+    if kind == SignalKind.ARRAY_PINS:
         width = len(signal['pins'])
 
-    elif is_array_pinset(signal):
+    elif kind == SignalKind.ARRAY_PINSET:
         pinset = signal['pinset']
         p_pins = pinset['p']
         n_pins = pinset['n']
@@ -197,7 +351,7 @@ def get_sig_width(signal: dict[str, Any]) -> int:
 
         width = len(p_pins)
 
-    elif is_multibank_pins(signal) or is_multibank_pinset(signal):
+    elif kind in (SignalKind.MULTIBANK_PINS, SignalKind.MULTIBANK_PINSET):
         check_multibank_width(signal)
         width = sum(get_multibank_fragment_width(fragment) for fragment in signal['multibank'])
 
@@ -228,3 +382,24 @@ def get_multibank_fragment_width(fragment: dict) -> int:
 
     return count
 
+def freeze(value: Any) -> Any:
+    """Returns a read-only view of a parsed YAML value
+
+    Lists become tuples and mappings become read-only mappings, recursively. Strings
+    and other scalars are immutable already and are shared with the input rather
+    than copied.
+
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    return value
+
+def thaw(value: Any) -> Any:
+    """Returns a plain list and dict copy of a frozen value, e.g. for JSON output"""
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    return value
@@ -1,10 +1,10 @@
-from typing import Any
+from typing import Any, Mapping
 
 # TODO: These should get pulled from JSON
 ENUM_BANK_PERFORMANCE = {"HP", "HR", "HD"}
 
 
-def validate_bank_table(bank_table: dict[int, dict[str, Any]]) -> None:
+def validate_bank_table(bank_table: Mapping[int, Mapping[str, Any]]) -> None:
     """
     Validate the extracted bank table for correctness.
 
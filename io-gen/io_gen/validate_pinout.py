@@ -0,0 +1,141 @@
+"""
+Check the pin table against the package pinout of the target device
+
+The schema and the signal checks only see the board file, so a signal can
+declare `bank: 34` and list pins that sit in bank 35, or pair two pins in a
+`pinset` that are not the two sides of one differential pair. With the package
+pinout from `io_gen.pinout` each pin of the flattened pin table is checked
+with a constant number of indexed lookups:
+
+- The pin exists in the package and is a user IO
+- The pin is in the bank declared for its bit, by the signal or its fragment
+- The `p` and `n` pins of a pair are the P and N sides of one pair in one bank
+- A clock input (`group: clock`) is on a clock-capable pin, and a single-ended
+  clock is on the P side of it
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
+
+from io_gen.pin_table import PinTable
+from io_gen.pinout import PackagePin, PackagePinout
+
+
+@dataclass(frozen=True)
+class PinoutViolation:
+    """One pin that breaks a pinout rule
+
+    `rule` is one of 'pin' (not a user IO of the package), 'bank', 'pair' or
+    'clock'.
+
+    """
+
+    signal: str
+    index: int
+    rule: str
+    message: str
+
+
+def describe_pin(pin: PackagePin) -> str:
+    """Returns a package pin with its vendor name, for use in messages"""
+    return f"'{pin.pin}' ({pin.name})"
+
+
+def check_package_pin(
+    pinout: PackagePinout, pin: str, bit: str
+) -> tuple[PackagePin | None, str | None]:
+    """Returns a package pin and, if a signal cannot use it, the reason why"""
+    package_pin = pinout.get_pin(pin)
+    if package_pin is None:
+        return None, f"{bit} uses pin '{pin}', which is not in the package"
+    if not package_pin.is_user_io:
+        return None, f"{bit} uses pin {describe_pin(package_pin)}, not a user IO"
+    return package_pin, None
+
+
+def iter_signal_violations(
+    signal: Mapping[str, Any], pin_table: PinTable, pinout: PackagePinout
+) -> Iterable[PinoutViolation]:
+    """Yields every pinout rule that the pins of one signal break"""
+    name = signal["name"]
+    clock_input = signal["group"] == "clock" and signal["direction"] != "out"
+
+    for entry in pin_table.get_pins_by_signal(name):
+        index = entry.index
+        bit = f"{name}[{index}]"
+
+        sides = ("p", "n") if signal["diff_pair"] else ("pin",)
+        package_pins = []
+        for side in sides:
+            package_pin, message = check_package_pin(pinout, getattr(entry, side), bit)
+            if message is not None:
+                yield PinoutViolation(name, index, "pin", message)
+            package_pins.append(package_pin)
+        if None in package_pins:
+            continue
+
+        bank = pin_table.get_bank(name, index)
+        for package_pin in package_pins:
+            if bank is not None and package_pin.bank != bank:
+                message = (
+                    f"{bit} is declared in bank {bank} but pin "
+                    f"{describe_pin(package_pin)} is in bank {package_pin.bank}"
+                )
+                yield PinoutViolation(name, index, "bank", message)
+
+        if signal["diff_pair"]:
+            p, n = package_pins
+            if p.side != "p" or n.side != "n" or (p.bank, p.pair) != (n.bank, n.pair):
+                message = (
+                    f"{bit} pairs P side {describe_pin(p)} with N side "
+                    f"{describe_pin(n)}, which are not one differential pair"
+                )
+                yield PinoutViolation(name, index, "pair", message)
+
+        if clock_input:
+            first = package_pins[0]
+            if not first.clock_capable:
+                message = (
+                    f"{bit} is a clock input on pin {describe_pin(first)}, which is "
+                    f"not clock capable"
+                )
+                yield PinoutViolation(name, index, "clock", message)
+            elif first.side != "p":
+                message = (
+                    f"{bit} is a single-ended clock input on pin "
+                    f"{describe_pin(first)}, which is not the P side of a "
+                    f"clock-capable pair"
+                )
+                yield PinoutViolation(name, index, "clock", message)
+
+
+def find_pinout_violations(
+    signal_table: Iterable[Mapping[str, Any]],
+    pin_table: PinTable,
+    pinout: PackagePinout,
+) -> list[PinoutViolation]:
+    """Returns every pinout rule broken by the pin table, in pin table order"""
+    violations = []
+    for signal in signal_table:
+        violations.extend(iter_signal_violations(signal, pin_table, pinout))
+    return violations
+
+
+def validate_pinout(
+    signal_table: Iterable[Mapping[str, Any]],
+    pin_table: PinTable,
+    pinout: PackagePinout,
+) -> None:
+    """Checks the pin table against the package pinout, see the module docs
+
+    Raises:
+        ValueError: If any pin breaks a pinout rule, naming every violation
+
+    """
+    violations = find_pinout_violations(signal_table, pin_table, pinout)
+    if not violations:
+        return
+
+    details = "; ".join(violation.message for violation in violations)
+    msg = f"Pins do not match the package pinout: {details}"
+    raise ValueError(msg)
@@ -0,0 +1,197 @@
+"""
+Find package pins claimed more than once across the whole pin table
+
+The schema's `uniqueItems` only rejects a pin repeated within one `pins` array or
+one side of a `pinset`. Two different signals, two bits of one signal, or the P
+side of one pair and the N side of another can still claim the same package pin.
+The checks here read the package pin index that `PinTable` builds as signals are
+added, which holds every single-ended `pin` and both sides of every differential
+pair, so finding every collision is one pass over that index.
+
+`io_gen.build.build_targets` and the entry points of `io_gen.pipeline` run this
+check when `check_pins` is set, and the pipeline's streaming entry points check
+each signal as it arrives. The incremental `io_gen.incremental.SignalMemo` keeps
+a package pin index of its own and reads it with `get_pin_conflicts`, and the
+columnar `io_gen.columnar.ColumnarPinTable` finds its repeated pins with NumPy and
+groups their claims with `collect_pin_conflicts`, so every form of the pin table
+reports the same conflicts.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator, Mapping, Sequence
+
+from io_gen.pin_table import PinTable
+from io_gen.records import DiffPinEntry, PinRecord
+
+
+@dataclass(frozen=True)
+class PinUse:
+    """One claim on a package pin: a signal bit and the side of the pin it uses
+
+    `side` is 'pin' for a single-ended pin, or 'p' or 'n' for one side of a
+    differential pair.
+
+    """
+
+    signal: str
+    index: int
+    side: str
+
+    def __str__(self) -> str:
+        if self.side == "pin":
+            return f"{self.signal}[{self.index}]"
+        return f"{self.signal}[{self.index}] ({self.side.upper()})"
+
+
+@dataclass(frozen=True)
+class PinConflict:
+    """A package pin and every claim on it, in pin table order"""
+
+    pin: str
+    uses: tuple[PinUse, ...]
+
+
+def get_pin_uses(pin: str, entries: Iterable[PinRecord]) -> list[PinUse]:
+    """Returns every claim that the pin entries indexed under a package pin make"""
+    uses = []
+    seen = set()
+    for entry in entries:
+        # A pair with both sides on one pin is indexed under it twice
+        if id(entry) in seen:
+            continue
+        seen.add(id(entry))
+
+        if isinstance(entry, DiffPinEntry):
+            uses.extend(
+                PinUse(entry.name, entry.index, side)
+                for side, side_pin in (("p", entry.p), ("n", entry.n))
+                if side_pin == pin
+            )
+        else:
+            uses.append(PinUse(entry.name, entry.index, "pin"))
+
+    return uses
+
+
+def iter_package_pins(
+    pin_entries: Iterable[PinRecord],
+) -> Iterator[tuple[str, PinRecord]]:
+    """Yields each package pin used by flattened pin entries with its entry
+
+    Both sides of a differential pair are yielded, P first.
+
+    """
+    for entry in pin_entries:
+        if isinstance(entry, DiffPinEntry):
+            yield entry.p, entry
+            yield entry.n, entry
+        else:
+            yield entry.pin, entry
+
+
+def get_package_pins(pin_entries: Iterable[PinRecord]) -> list[str]:
+    """Returns the package pins used by flattened pin entries, both sides of a pair"""
+    return [pin for pin, _ in iter_package_pins(pin_entries)]
+
+
+def get_pin_conflict(
+    by_pin: Mapping[str, Sequence[PinRecord]], pin: str
+) -> PinConflict | None:
+    """Returns the claims on a package pin if there is more than one, else None
+
+    `by_pin` is an index of the pin entries that use each package pin, with a pair
+    indexed under both of its pins, such as `io_gen.pin_table.PinTable.by_pin`.
+
+    """
+    entries = by_pin.get(pin, ())
+    # Most pins are indexed once, so they cannot be in conflict
+    if len(entries) < 2:
+        return None
+    uses = get_pin_uses(pin, entries)
+    if len(uses) < 2:
+        return None
+    return PinConflict(pin, tuple(uses))
+
+
+def get_pin_conflicts(
+    by_pin: Mapping[str, Sequence[PinRecord]], pins: Iterable[str]
+) -> list[PinConflict]:
+    """Returns the conflicts on the given package pins, in the order given
+
+    See `get_pin_conflict` for `by_pin`.
+
+    """
+    conflicts = (get_pin_conflict(by_pin, pin) for pin in pins)
+    return [conflict for conflict in conflicts if conflict is not None]
+
+
+def find_pin_conflicts(pin_table: PinTable) -> list[PinConflict]:
+    """Returns every package pin that is claimed more than once, in pin table order"""
+    return get_pin_conflicts(pin_table.by_pin, pin_table.by_pin)
+
+
+def collect_pin_conflicts(claims: Iterable[tuple[str, PinUse]]) -> list[PinConflict]:
+    """Groups claims on package pins and returns the pins claimed more than once
+
+    Claims are given in pin table order, and the conflicts come out in the order
+    of each pin's first claim, as `find_pin_conflicts` returns them.
+
+    """
+    uses: dict[str, list[PinUse]] = {}
+    for pin, use in claims:
+        uses.setdefault(pin, []).append(use)
+    return [
+        PinConflict(pin, tuple(pin_uses))
+        for pin, pin_uses in uses.items()
+        if len(pin_uses) > 1
+    ]
+
+
+def get_pin_conflicts_message(conflicts: Iterable[PinConflict]) -> str:
+    """Returns the error message that names each conflict and its claims"""
+    details = "; ".join(
+        f"{conflict.pin} ({', '.join(str(use) for use in conflict.uses)})"
+        for conflict in conflicts
+    )
+    return f"Package pins are claimed more than once: {details}"
+
+
+def validate_pin_table(pin_table: PinTable) -> None:
+    """Checks that no package pin is claimed more than once
+
+    Raises:
+        ValueError: If any package pin has more than one claim, naming every such
+            pin with the signal bits that claim it
+
+    """
+    conflicts = find_pin_conflicts(pin_table)
+    if conflicts:
+        msg = get_pin_conflicts_message(conflicts)
+        raise ValueError(msg)
+
+
+def iter_checked_signal_pins(
+    signal_pins: Iterable[tuple[Mapping[str, Any], Iterable[Mapping[str, Any]]]],
+) -> Iterator[tuple[Mapping[str, Any], Sequence[PinRecord]]]:
+    """Lazily passes on each signal and its pins once its package pins are checked
+
+    This is the streaming form of `validate_pin_table`. Each signal is added to a
+    `PinTable` of the signals so far, and only the package pins of that signal are
+    looked up, so a pin claimed again is reported as soon as the second claim is
+    reached, with the claims made up to that point.
+
+    Raises:
+        ValueError: If a package pin of a signal is already claimed
+
+    """
+    pin_table = PinTable()
+    for signal, pins in signal_pins:
+        pin_table.add_signal(signal, pins)
+        records = pin_table.get_pins_by_signal(signal["name"])
+        # A pair with both sides on one pin names it twice
+        package_pins = dict.fromkeys(get_package_pins(records))
+        conflicts = get_pin_conflicts(pin_table.by_pin, package_pins)
+        if conflicts:
+            msg = get_pin_conflicts_message(conflicts)
+            raise ValueError(msg)
+        yield signal, records
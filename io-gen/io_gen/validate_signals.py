@@ -2,19 +2,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-from typing import Any
+from typing import Any, Mapping, Sequence
 
-from io_gen.utils import (
-    is_array_pins,
-    is_array_pinset,
-    is_multibank_pins,
-    is_multibank_pinset,
-    is_scalar_pins,
-    is_scalar_pinset,
-)
+from io_gen.utils import SignalKind, get_signal_kind
 
 
-def validate_signal_table(signal_table: list[dict[str, Any]]) -> None:
+def validate_signal_table(signal_table: Sequence[Mapping[str, Any]]) -> None:
     """
     Validate the signal table for semantic correctness before flattening.
 
@@ -31,26 +24,21 @@ def validate_signal_table(signal_table: list[dict[str, Any]]) -> None:
     """
     logger.debug("Validating signal table")
     for signal in signal_table:
-        if is_scalar_pins(signal):
-            validate_scalar_pins(signal)
-        elif is_array_pins(signal):
-            validate_array_pins(signal)
-        elif is_scalar_pinset(signal):
-            validate_scalar_pinset(signal)
-        elif is_array_pinset(signal):
-            validate_array_pinset(signal)
-        elif is_multibank_pins(signal):
-            validate_multibank_pins(signal)
-        elif is_multibank_pinset(signal):
-            validate_multibank_pinset(signal)
-        else:
-            msg = (
-                f"Signal '{signal['name']}' has unrecognized or unsupported structure."
-            )
-            raise ValueError(msg)
+        validate_signal_entry(signal)
+
 
+def validate_signal_entry(signal: Mapping[str, Any]) -> None:
+    """Validate a single signal table entry, dispatching on its kind.
 
-def validate_scalar_pins(signal: dict[str, Any]) -> None:
+    Raises:
+        ValueError: If the signal entry is semantically invalid or ambiguous.
+
+    """
+    validator = SIGNAL_VALIDATORS[get_signal_kind(signal)]
+    validator(signal)
+
+
+def validate_scalar_pins(signal: Mapping[str, Any]) -> None:
     """Validate a single-ended scalar pin signal."""
     name = signal["name"]
     assert "pins" in signal, f"Signal '{name}' does not contain a 'pins' element"
@@ -70,7 +58,7 @@ def validate_scalar_pins(signal: dict[str, Any]) -> None:
         raise ValueError(msg)
 
 
-def validate_array_pins(signal: dict[str, Any]) -> None:
+def validate_array_pins(signal: Mapping[str, Any]) -> None:
     """Validate a single-ended pin array signal.
 
     Ensures consistent use of 'bank' or 'iostandard', and verifies that pin arrays
@@ -89,12 +77,12 @@ def validate_array_pins(signal: dict[str, Any]) -> None:
         raise ValueError(msg)
 
     # Last, we check the type to make sure its consistent
-    if not isinstance(signal["pins"], list):
+    if not isinstance(signal["pins"], (list, tuple)):
         msg = f"Signal '{name}' is not an array"
         raise ValueError(msg)
 
 
-def validate_scalar_pinset(signal: dict[str, Any]) -> None:
+def validate_scalar_pinset(signal: Mapping[str, Any]) -> None:
     """Validate a scalar differential signal using 'pinset'.
 
     Confirms that the signal contains either a top-level 'iostandard' or inherits from a
@@ -125,7 +113,7 @@ def validate_scalar_pinset(signal: dict[str, Any]) -> None:
         raise ValueError(msg)
 
 
-def validate_array_pinset(signal: dict[str, Any]) -> None:
+def validate_array_pinset(signal: Mapping[str, Any]) -> None:
     """Validate an array of differential signals using 'pinset'.
 
     Checks that each entry has appropriate structure and that either
@@ -149,7 +137,9 @@ def validate_array_pinset(signal: dict[str, Any]) -> None:
         raise ValueError(msg)
 
     # Check that both are lists of equal length
-    if not isinstance(pinset["p"], list) or not isinstance(pinset["n"], list):
+    if not isinstance(pinset["p"], (list, tuple)) or not isinstance(
+        pinset["n"], (list, tuple)
+    ):
         msg = f"Signal '{name}' must have lists for both 'p' and 'n'"
         raise ValueError(msg)
 
@@ -161,7 +151,7 @@ def validate_array_pinset(signal: dict[str, Any]) -> None:
         raise ValueError(msg)
 
 
-def validate_multibank_pins(signal: dict[str, Any]) -> None:
+def validate_multibank_pins(signal: Mapping[str, Any]) -> None:
     """Validate a multibank signal composed of single-ended pin fragments.
 
     Enforces correct use of 'iostandard' and 'bank' at the top and fragment levels,
@@ -188,7 +178,7 @@ def validate_multibank_pins(signal: dict[str, Any]) -> None:
             raise ValueError(msg)
 
 
-def validate_multibank_pinset(signal: dict[str, Any]) -> None:
+def validate_multibank_pinset(signal: Mapping[str, Any]) -> None:
     """Validate a multibank differential signal composed of pinset fragments.
 
     Ensures exclusive or consistent use of 'iostandard' across fragments and
@@ -215,7 +205,7 @@ def validate_multibank_pinset(signal: dict[str, Any]) -> None:
             raise ValueError(msg)
 
 
-def validate_required_fields(signal: dict[str, Any]) -> None:
+def validate_required_fields(signal: Mapping[str, Any]) -> None:
     """Validate that default and required fields are present"""
 
     # Required by schema
@@ -246,7 +236,7 @@ def validate_required_fields(signal: dict[str, Any]) -> None:
     # Comment is optional, but structured
     if "comment" in signal:
         comment = signal["comment"]
-        if not isinstance(comment, dict):
+        if not isinstance(comment, Mapping):
             msg = f"Signal '{name}' has optional 'comment' field but of the wrong type"
             raise ValueError(msg)
         extra_keys = set(comment.keys()) - {"xdc", "hdl"}
@@ -254,7 +244,7 @@ def validate_required_fields(signal: dict[str, Any]) -> None:
             raise ValueError(f"Invalid keys in comment: {extra_keys}")
 
 
-def validate_required_multibank_fields(signal: dict[str, Any]) -> None:
+def validate_required_multibank_fields(signal: Mapping[str, Any]) -> None:
     """Validate that required fields for multibank signals are present"""
     name = signal["name"]
     assert (
@@ -279,7 +269,7 @@ def validate_required_multibank_fields(signal: dict[str, Any]) -> None:
     validate_required_fields(signal)
 
 
-def validate_iostandard_bank_no_multibank(signal: dict[str, Any]) -> None:
+def validate_iostandard_bank_no_multibank(signal: Mapping[str, Any]) -> None:
     """Validate that iostandard or banks are present (for non multibank signals)
 
     Pin and pinset arrays and scalars inherit their iostandard properties
@@ -303,7 +293,7 @@ def validate_iostandard_bank_no_multibank(signal: dict[str, Any]) -> None:
         raise ValueError(msg)
 
 
-def validate_iostandard_bank_yes_multibank(signal: dict[str, Any]) -> None:
+def validate_iostandard_bank_yes_multibank(signal: Mapping[str, Any]) -> None:
     """Validate that iostandard or banks are present for multibank signals
 
     Multibank signals inherit their iostandard properties differently than
@@ -328,3 +318,14 @@ def validate_iostandard_bank_yes_multibank(signal: dict[str, Any]) -> None:
         if any("iostandard" in fragment for fragment in multibank):
             msg = f"Signal '{name}' tries to override multibank 'iostandard'"
             raise ValueError(msg)
+
+
+# Per-kind validators, dispatched on the kind cached in each signal table entry
+SIGNAL_VALIDATORS = {
+    SignalKind.SCALAR_PINS: validate_scalar_pins,
+    SignalKind.ARRAY_PINS: validate_array_pins,
+    SignalKind.SCALAR_PINSET: validate_scalar_pinset,
+    SignalKind.ARRAY_PINSET: validate_array_pinset,
+    SignalKind.MULTIBANK_PINS: validate_multibank_pins,
+    SignalKind.MULTIBANK_PINSET: validate_multibank_pinset,
+}
@@ -3,42 +3,51 @@ Validate input data before processing
 """
 
 import json
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
-from jsonschema import Draft202012Validator
-from jsonschema.exceptions import ValidationError
-from referencing import Registry, Resource
+from io_gen.schema_bundle import (
+    BUNDLE_PATH,
+    DEFS_DIR,
+    SCHEMA_DIR,
+    SCHEMA_PATH,
+    load_bundle,
+    load_bundled_schema,
+)
+from io_gen.schema_compiler import compile_schema, load_compiled, load_fast_validator
 
-# Schema locations
-SCHEMA_DIR = Path(__file__).parent.parent / "schema"
-SCHEMA_PATH = SCHEMA_DIR / "schema.json"
-DEFS_DIR = SCHEMA_DIR / "defs"
+# jsonschema is comparatively expensive to import, so it is only imported once a
+# document actually needs validating
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
+    from jsonschema.exceptions import ValidationError
 
-with open(SCHEMA_PATH) as f:
-    io_gen_base_schema = json.load(f)
+# Location of the subschema for one item of 'signals' within the bundled schema
+SIGNAL_SCHEMA_PATH = ("properties", "signals", "items")
 
-defs = {
-    "defs/iostandard.json": json.load((DEFS_DIR / "iostandard.json").open()),
-    "defs/buffer.json": json.load((DEFS_DIR / "buffer.json").open()),
-    "defs/parameters.json": json.load((DEFS_DIR / "parameters.json").open()),
-    "defs/instance.json": json.load((DEFS_DIR / "instance.json").open()),
-    "defs/direction.json": json.load((DEFS_DIR / "direction.json").open()),
-    "defs/group.json": json.load((DEFS_DIR / "group.json").open()),
-    "defs/bank.json": json.load((DEFS_DIR / "bank.json").open()),
-    "defs/performance.json": json.load((DEFS_DIR / "performance.json").open()),
-    "defs/pins.json": json.load((DEFS_DIR / "pins.json").open()),
-    "defs/pinset.json": json.load((DEFS_DIR / "pinset.json").open()),
-    "defs/multibank.json": json.load((DEFS_DIR / "multibank.json").open()),
-}
+# Number of signals each worker validates at a time in parallel mode
+DEFAULT_CHUNK_SIZE = 500
 
-resources = {
-    "schema.json": Resource.from_contents(io_gen_base_schema),
-    **{key: Resource.from_contents(value) for key, value in defs.items()},
-}
 
-registry = Registry().with_resources(resources.items())
+@cache
+def get_validator() -> "Draft202012Validator":
+    """Returns the schema validator, constructing it on first use
 
-validator = Draft202012Validator(io_gen_base_schema, registry=registry)
+    The validator is built from the pre-resolved schema bundle, so no reference
+    registry is needed and only a single file is parsed.
+
+    """
+    from jsonschema import Draft202012Validator
+
+    return Draft202012Validator(load_bundled_schema(BUNDLE_PATH))
+
+
+@cache
+def get_fast_validator() -> Callable[[Any], bool]:
+    """Returns the generated validation function, loading it on first use"""
+    return load_fast_validator()
 
 
 def validate(data: dict) -> None:
@@ -52,7 +61,161 @@ def validate(data: dict) -> None:
         jsonschema.exceptions.ValidationError: If the data does not conform to the schema.
 
     """
-    validator.validate(data)
+    # The generated validator only answers yes or no, so documents it rejects are
+    # validated again by jsonschema to report a detailed error
+    if get_fast_validator()(data):
+        return
+
+    get_validator().validate(data)
+
+
+@cache
+def get_signal_validators() -> tuple[Callable[[Any], bool], "Draft202012Validator"]:
+    """Returns the generated and jsonschema validators for a single signal item
+
+    Every item of 'signals' is validated independently against the same subschema,
+    which is what allows signals to be validated one at a time or in parallel.
+
+    """
+    from jsonschema import Draft202012Validator
+
+    bundle = load_bundle(BUNDLE_PATH)
+    schema = bundle["schema"]
+    for key in SIGNAL_SCHEMA_PATH:
+        schema = schema[key]
+
+    fast = load_compiled(compile_schema(schema, bundle["source_hash"]))
+    return fast, Draft202012Validator(schema)
+
+
+def check_signal(signal: Any, index: int) -> dict[str, Any] | None:
+    """Validates one signal item and describes its most relevant error, if any
+
+    The description holds only plain data, with paths relative to the whole
+    document, so that it can be returned from a worker process and turned back
+    into a ValidationError with `make_validation_error`.
+
+    """
+    from jsonschema.exceptions import best_match
+
+    fast, validator = get_signal_validators()
+    if fast(signal):
+        return None
+
+    error = best_match(validator.iter_errors(signal))
+    if error is None:
+        return None
+
+    return {
+        "message": error.message,
+        "validator": error.validator,
+        "validator_value": error.validator_value,
+        "instance": error.instance,
+        "schema": error.schema,
+        "path": ["signals", index, *error.relative_path],
+        "schema_path": [*SIGNAL_SCHEMA_PATH, *error.relative_schema_path],
+    }
+
+
+def check_signal_chunk(start: int, signals: list[Any]) -> list[dict[str, Any]]:
+    """Validates a chunk of signals starting at index `start`, in source order"""
+    errors = []
+    for index, signal in enumerate(signals, start):
+        error = check_signal(signal, index)
+        if error is not None:
+            errors.append(error)
+    return errors
+
+
+def make_validation_error(error: dict[str, Any]) -> "ValidationError":
+    """Rebuilds a ValidationError from the description made by `check_signal`"""
+    from jsonschema.exceptions import ValidationError
+
+    return ValidationError(
+        error["message"],
+        validator=error["validator"],
+        validator_value=error["validator_value"],
+        instance=error["instance"],
+        schema=error["schema"],
+        path=error["path"],
+        schema_path=error["schema_path"],
+    )
+
+
+def validate_signal(signal: Any, index: int) -> None:
+    """Validates a single item of 'signals' found at `index` in the document
+
+    Raises:
+        jsonschema.exceptions.ValidationError: If the signal does not conform to the
+            schema. The error path is relative to the whole document.
+
+    """
+    error = check_signal(signal, index)
+    if error is not None:
+        raise make_validation_error(error)
+
+
+def find_signal_errors(
+    signals: list[Any], jobs: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> list["ValidationError"]:
+    """Validates signal items in chunks across a process pool
+
+    Args:
+        signals: The 'signals' list of a document
+        jobs: Number of worker processes, defaulting to one per CPU. With a single
+            job the signals are validated in this process.
+        chunk_size: Number of signals handed to a worker at a time
+
+    Returns:
+        The most relevant error of every invalid signal, in source order.
+
+    """
+    starts = range(0, len(signals), chunk_size)
+    chunks = [signals[start : start + chunk_size] for start in starts]
+
+    if jobs == 1 or len(chunks) <= 1:
+        results = map(check_signal_chunk, starts, chunks)
+        return [make_validation_error(e) for result in results for e in result]
+
+    # Results come back in submission order regardless of which worker finishes
+    # first, so the errors are always reported in source order
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        results = pool.map(check_signal_chunk, starts, chunks)
+        return [make_validation_error(e) for result in results for e in result]
+
+
+def validate_parallel(
+    data: dict, jobs: int | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> None:
+    """
+    Validate a document, spreading validation of its signals across processes.
+
+    The document is first validated once with an empty 'signals' list, which checks
+    everything except the signal items. The items are then validated in chunks in
+    a process pool. This is meant for very large synthetic or merged board files;
+    for ordinary boards `validate` is faster since it avoids starting workers.
+
+    Args:
+        data: A dictionary loaded from a YAML file using yaml.safe_load().
+        jobs: Number of worker processes, defaulting to one per CPU.
+        chunk_size: Number of signals handed to a worker at a time.
+
+    Raises:
+        jsonschema.exceptions.ValidationError: If the data does not conform to the
+            schema. When several signals are invalid, the error for the first of
+            them in source order is raised.
+
+    """
+    signals = data.get("signals") if isinstance(data, dict) else None
+    if not isinstance(signals, list):
+        validate(data)
+        return
+
+    validate({**data, "signals": []})
+
+    errors = find_signal_errors(signals, jobs, chunk_size)
+    if errors:
+        raise errors[0]
 
 
 def load_enum_values(schema_path: Path) -> list[str]:
@@ -0,0 +1,124 @@
+import pytest
+
+from io_gen import bank_table as bank_table_module
+from io_gen.bank_table import BankTable, extract_bank_table, get_bank_iostandard
+from io_gen.flatten import flatten_array_pins, flatten_multibank_pins
+from io_gen.pin_table import extract_pin_table
+from io_gen.signal_table import extract_signal_table
+
+BANKS = {
+    34: {"iostandard": "LVCMOS33", "performance": "HR"},
+    35: {"iostandard": "LVCMOS18", "performance": "HP"},
+}
+
+
+class CountingBankTable(BankTable):
+    def __init__(self, banks):
+        super().__init__(banks)
+        self.lookups = 0
+
+    def get_attributes(self, number, name=None):
+        self.lookups += 1
+        return super().get_attributes(number, name)
+
+
+def test_attributes_precomputed():
+    bank_table = extract_bank_table(BANKS)
+
+    assert bank_table.get_iostandard(34) == "LVCMOS33"
+    assert bank_table.get_performance(35) == "HP"
+    assert bank_table.get_vcco(34) == 3.3
+    assert bank_table.get_vcco(35) == 1.8
+
+    # Still reads like the declared bank dictionary
+    assert bank_table == BANKS
+    assert bank_table[34] is BANKS[34]
+    assert extract_bank_table(bank_table) is bank_table
+
+
+def test_missing_bank_lists_defined_banks():
+    bank_table = extract_bank_table(BANKS)
+    with pytest.raises(ValueError, match=r"Signal 'led' uses bank 13 .*: 34, 35\)"):
+        bank_table.get_iostandard(13, "led")
+
+
+def test_bus_resolves_bank_once():
+    bank_table = CountingBankTable(BANKS)
+    signal = {
+        "name": "data",
+        "pins": tuple(f"A{i}" for i in range(64)),
+        "bank": 34,
+        "direction": "in",
+        "buffer": "ibuf",
+        "diff_pair": False,
+        "bus": True,
+        "width": 64,
+    }
+    pins = flatten_array_pins(signal, bank_table)
+
+    assert len(pins) == 64
+    assert {pin["iostandard"] for pin in pins} == {"LVCMOS33"}
+    assert bank_table.lookups == 1
+
+
+def test_multibank_resolves_each_fragment_once():
+    bank_table = CountingBankTable(BANKS)
+    signal = {
+        "name": "ctrl",
+        "multibank": (
+            {"pins": ("A1", "A2", "A3"), "bank": 34, "offset": 0},
+            {"pins": ("B1", "B2"), "bank": 35, "offset": 3},
+        ),
+        "direction": "out",
+        "buffer": "obuf",
+        "diff_pair": False,
+        "bus": True,
+        "width": 5,
+    }
+    pins = flatten_multibank_pins(signal, bank_table)
+
+    assert [pin["iostandard"] for pin in pins] == ["LVCMOS33"] * 3 + ["LVCMOS18"] * 2
+    assert bank_table.lookups == 2
+
+
+def test_missing_fragment_bank_names_signal():
+    signal = {
+        "name": "ctrl",
+        "multibank": ({"pins": ("A1",), "bank": 13, "offset": 0},),
+        "direction": "out",
+        "buffer": "obuf",
+        "diff_pair": False,
+        "bus": True,
+        "width": 1,
+    }
+    with pytest.raises(ValueError, match="Signal 'ctrl' uses bank 13"):
+        flatten_multibank_pins(signal, BANKS)
+
+
+def test_plain_bank_dict_is_wrapped_once(monkeypatch):
+    built = []
+
+    class RecordingBankTable(BankTable):
+        def __init__(self, banks):
+            super().__init__(banks)
+            built.append(self)
+
+    monkeypatch.setattr(bank_table_module, "BankTable", RecordingBankTable)
+    signals = [
+        {
+            "name": f"led{index}",
+            "pins": f"A{index}",
+            "bank": 34,
+            "direction": "out",
+            "buffer": "obuf",
+        }
+        for index in range(4)
+    ]
+    extract_pin_table(extract_signal_table(signals), BANKS)
+    assert len(built) == 1
+
+
+def test_plain_bank_dict_lookup():
+    assert get_bank_iostandard(35, BANKS) == "LVCMOS18"
+    with pytest.raises(ValueError, match=r"Signal 'led' uses bank 13 .*: 34, 35\)"):
+        get_bank_iostandard(13, BANKS, "led")
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import pytest
+from io_gen.build import build_targets, freeze_named_signal_pins, freeze_signal_pins
+from io_gen.cache import build_tables
+from io_gen.emit_xdc import emit_xdc
+from io_gen.loader import load_board
+from io_gen.port_names import NamingConvention, PortNamer
+
+BOARD = Path("tests/fixtures/pipeline/integration.yaml")
+
+TARGETS = ["xdc", "pins"]
+
+
+def test_concurrent_matches_serial(tmp_path):
+    serial = build_targets(
+        BOARD, tmp_path / "serial", TARGETS, jobs=1, cache_dir=tmp_path / "cache"
+    )
+    concurrent = build_targets(
+        BOARD, tmp_path / "concurrent", TARGETS, cache_dir=tmp_path / "cache"
+    )
+
+    assert [result.name for result in serial] == TARGETS
+    assert [result.name for result in concurrent] == TARGETS
+    for a, b in zip(serial, concurrent):
+        assert a.path.name == b.path.name
+        assert a.path.read_bytes() == b.path.read_bytes()
+        assert b.seconds >= 0
+
+
+def test_build_xdc_matches_emit_xdc(tmp_path):
+    board, _ = load_board(BOARD)
+    tables = build_tables(board)
+    expected = "".join(
+        f"{line}\n" for line in emit_xdc(tables["signal_table"], tables["pin_table"])
+    )
+
+    (result,) = build_targets(BOARD, tmp_path, ["xdc"], cache_dir=tmp_path / "cache")
+
+    assert result.path == tmp_path / "integration.xdc"
+    assert result.path.read_text(encoding="utf-8") == expected
+
+
+def test_pin_report(tmp_path):
+    build_targets(BOARD, tmp_path, ["pins"], cache_dir=tmp_path / "cache")
+
+    rows = (tmp_path / "integration.csv").read_text(encoding="utf-8").splitlines()
+    assert rows[0] == "signal,index,port,pin,iostandard"
+    assert "bus_34_inherit,1,bus_34_inherit_pad[1],R14,LVCMOS18" in rows
+    assert "d_array_34,2,d_array_34_n[2],J15,LVCMOS18" in rows
+
+
+@pytest.mark.parametrize(
+    "targets, match",
+    [
+        (["xdc", "nope"], "Unknown emitter 'nope'"),
+        (["xdc", "xdc-compact"], "both write"),
+    ],
+)
+def test_build_targets_rejects(tmp_path, targets, match):
+    with pytest.raises(ValueError, match=match):
+        build_targets(BOARD, tmp_path, targets, cache_dir=tmp_path / "cache")
+
+
+def test_freeze_signal_pins():
+    board, _ = load_board(BOARD)
+    tables = build_tables(board)
+    signal_pins = freeze_signal_pins(tables["signal_table"], tables["pin_table"])
+
+    assert isinstance(signal_pins, tuple)
+    assert [signal for signal, _ in signal_pins] == tables["signal_table"]
+    assert all(isinstance(pins, tuple) for _, pins in signal_pins)
+
+
+def test_freeze_named_signal_pins():
+    board, _ = load_board(BOARD)
+    tables = build_tables(board)
+    named = freeze_named_signal_pins(tables["signal_table"], tables["pin_table"])
+
+    assert [signal for signal, _, _ in named] == tables["signal_table"]
+    for _, pins, ports in named:
+        assert len(ports.bits) == len(pins)
+
+
+def test_build_targets_convention(tmp_path):
+    namer = PortNamer(NamingConvention(pad="_io", bit="{port}_{index}"))
+    targets = ["xdc", "verilog"]
+    xdc, verilog = build_targets(
+        BOARD, tmp_path, targets, cache_dir=tmp_path / "cache", namer=namer
+    )
+
+    assert "[get_ports {bus_34_inherit_io_1}]" in xdc.path.read_text()
+    assert "bus_34_inherit_io" in verilog.path.read_text()
+    assert "bus_34_inherit_pad" not in verilog.path.read_text()
@@ -0,0 +1,128 @@
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+from jsonschema.exceptions import ValidationError
+
+from io_gen import cache
+from io_gen.cache import load_tables
+from io_gen.cache_dir import CACHE_DIR_ENV, get_cache_dir
+from io_gen.pipeline import iter_xdc_lines, iter_xdc_lines_cached
+from io_gen.utils import SignalKind
+
+FIXTURE_YAML = Path("tests/fixtures/pipeline/integration.yaml")
+
+
+@pytest.fixture
+def board_path(tmp_path):
+    path = tmp_path / FIXTURE_YAML.name
+    path.write_bytes(FIXTURE_YAML.read_bytes())
+    return path
+
+
+def test_warm_run_matches_cold_run(board_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+
+    cold, hit = load_tables(board_path, cache_dir)
+    assert not hit
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    warm, hit = load_tables(board_path, cache_dir)
+    assert hit
+
+    assert warm["part"] == cold["part"] == "xc7z020clg400-1"
+    assert warm["signal_table"] == cold["signal_table"]
+    assert warm["bank_table"] == cold["bank_table"]
+    assert list(warm["pin_table"]) == list(cold["pin_table"])
+    assert warm["pin_table"].by_pin == cold["pin_table"].by_pin
+    assert warm["pin_table"].by_bank == cold["pin_table"].by_bank
+
+    # JSON round trips lose these, so they have to be restored on load
+    assert all(type(s["kind"]) is SignalKind for s in warm["signal_table"])
+    assert all(type(bank) is int for bank in warm["bank_table"])
+
+
+def test_changed_input_misses(board_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+    load_tables(board_path, cache_dir)
+
+    board_path.write_bytes(board_path.read_bytes() + b"\n")
+    _, hit = load_tables(board_path, cache_dir)
+    assert not hit
+    assert len(list(cache_dir.glob("*.json"))) == 2
+
+
+def test_changed_code_misses(board_path, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    load_tables(board_path, cache_dir)
+
+    code_dir = tmp_path / "io_gen"
+    code_dir.mkdir()
+    (code_dir / "flatten.py").write_text("# edited\n")
+    monkeypatch.setattr(cache, "CODE_DIR", code_dir)
+    cache.hash_code_sources.cache_clear()
+    try:
+        _, hit = load_tables(board_path, cache_dir)
+    finally:
+        cache.hash_code_sources.cache_clear()
+    assert not hit
+
+
+def test_json_input_is_cached_separately(board_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+    with open(FIXTURE_YAML) as f:
+        board = yaml.safe_load(f)
+
+    json_path = tmp_path / "integration.json"
+    json_path.write_text(json.dumps(board))
+
+    yaml_tables, _ = load_tables(board_path, cache_dir)
+    json_tables, hit = load_tables(json_path, cache_dir)
+    assert not hit
+    assert json_tables["signal_table"] == yaml_tables["signal_table"]
+
+
+def test_corrupt_entry_is_rebuilt(board_path, tmp_path):
+    cache_dir = tmp_path / "cache"
+    expected, _ = load_tables(board_path, cache_dir)
+
+    (entry,) = cache_dir.glob("*.json")
+    entry.write_text("{")
+
+    tables, hit = load_tables(board_path, cache_dir)
+    assert not hit
+    assert tables["signal_table"] == expected["signal_table"]
+    assert load_tables(board_path, cache_dir)[1]
+
+
+def test_invalid_board_is_not_cached(tmp_path):
+    cache_dir = tmp_path / "cache"
+    path = tmp_path / "bad.yaml"
+    path.write_text("title: t\n")
+
+    with pytest.raises(ValidationError):
+        load_tables(path, cache_dir)
+    assert not cache_dir.exists()
+
+
+def test_cache_dir_from_environment(monkeypatch, tmp_path):
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    assert get_cache_dir() == tmp_path
+
+    monkeypatch.delenv(CACHE_DIR_ENV)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    assert get_cache_dir() == tmp_path / "xdg" / "io_gen"
+
+
+def test_cached_xdc_matches_pipeline(board_path, tmp_path):
+    with open(FIXTURE_YAML) as f:
+        expected = list(iter_xdc_lines(yaml.safe_load(f)))
+
+    cache_dir = tmp_path / "cache"
+    assert list(iter_xdc_lines_cached(board_path, cache_dir)) == expected
+    assert list(iter_xdc_lines_cached(board_path, cache_dir)) == expected
+
+    with open(FIXTURE_YAML) as f:
+        compact = list(iter_xdc_lines(yaml.safe_load(f), compact=True))
+    assert list(iter_xdc_lines_cached(board_path, cache_dir, compact=True)) == compact
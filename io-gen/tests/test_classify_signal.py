@@ -0,0 +1,87 @@
+import pytest
+
+from io_gen.utils import SignalKind, classify_signal, get_signal_kind
+
+cases = [
+    {
+        "id": "scalar-pins",
+        "signal": {"name": "led", "pins": "A1"},
+        "expected": SignalKind.SCALAR_PINS,
+    },
+    {
+        "id": "array-pins",
+        "signal": {"name": "sw", "pins": ["A1", "A2"]},
+        "expected": SignalKind.ARRAY_PINS,
+    },
+    {
+        "id": "scalar-pinset",
+        "signal": {"name": "clk", "pinset": {"p": "C1", "n": "C2"}},
+        "expected": SignalKind.SCALAR_PINSET,
+    },
+    {
+        "id": "array-pinset",
+        "signal": {"name": "data", "pinset": {"p": ["C1"], "n": ["C2"]}},
+        "expected": SignalKind.ARRAY_PINSET,
+    },
+    {
+        "id": "multibank-pins",
+        "signal": {
+            "name": "ctrl",
+            "multibank": [
+                {"pins": ["A1"], "bank": 34, "offset": 0},
+                {"pins": "B1", "bank": 35, "offset": 1},
+            ],
+        },
+        "expected": SignalKind.MULTIBANK_PINS,
+    },
+    {
+        "id": "multibank-pinset",
+        "signal": {
+            "name": "lanes",
+            "multibank": [{"pinset": {"p": "D1", "n": "D2"}, "bank": 34, "offset": 0}],
+        },
+        "expected": SignalKind.MULTIBANK_PINSET,
+    },
+]
+
+invalid_cases = [
+    {
+        "id": "missing-pin-definition",
+        "signal": {"name": "nothing"},
+    },
+    {
+        "id": "mismatched-pinset-types",
+        "signal": {"name": "clk", "pinset": {"p": "C1", "n": ["C2"]}},
+    },
+    {
+        "id": "empty-multibank",
+        "signal": {"name": "ctrl", "multibank": []},
+    },
+    {
+        "id": "mixed-multibank",
+        "signal": {
+            "name": "ctrl",
+            "multibank": [
+                {"pins": ["A1"], "bank": 34, "offset": 0},
+                {"pinset": {"p": "D1", "n": "D2"}, "bank": 35, "offset": 1},
+            ],
+        },
+    },
+]
+
+
+@pytest.mark.parametrize("case", cases, ids=[c["id"] for c in cases])
+def test_classify_signal(case):
+    assert classify_signal(case["signal"]) == case["expected"]
+
+
+@pytest.mark.parametrize("case", invalid_cases, ids=[c["id"] for c in invalid_cases])
+def test_classify_signal_invalid(case):
+    with pytest.raises(ValueError):
+        classify_signal(case["signal"])
+
+
+def test_get_signal_kind_uses_cached_kind():
+    # A cached kind wins over the pin definition, which is never inspected
+    signal = {"name": "led", "kind": "array_pins"}
+    assert get_signal_kind(signal) is SignalKind.ARRAY_PINS
@@ -0,0 +1,96 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+np = pytest.importorskip("numpy")
+
+from io_gen.cache import build_tables
+from io_gen.columnar import ColumnarPinTable
+from io_gen.validate_pins import find_pin_conflicts
+
+FIXTURE_YAML = Path("tests/fixtures/pipeline/integration.yaml")
+
+
+@pytest.fixture
+def tables():
+    with open(FIXTURE_YAML) as f:
+        return build_tables(yaml.safe_load(f))
+
+
+@pytest.fixture
+def columnar(tables):
+    return ColumnarPinTable.from_pin_table(tables["signal_table"], tables["pin_table"])
+
+
+def test_rows_follow_pin_table(tables, columnar):
+    pin_table = tables["pin_table"]
+    assert len(columnar) == len(pin_table)
+
+    strings = columnar.strings
+    columns = columnar.columns
+    for row, entry in enumerate(pin_table):
+        assert strings["signal_names"][columns["signal_id"][row]] == entry["name"]
+        assert columns["index"][row] == entry["index"]
+        iostandard = strings["iostandards"][columns["iostandard"][row]]
+        assert iostandard == entry["iostandard"]
+
+        bank = pin_table.get_bank(entry["name"], entry["index"])
+        assert columns["bank"][row] == (-1 if bank is None else bank)
+
+        if entry["diff_pair"]:
+            assert strings["pin_names"][columns["pin"][row]] == entry["p"]
+            assert strings["pin_names"][columns["pin_n"][row]] == entry["n"]
+        else:
+            assert strings["pin_names"][columns["pin"][row]] == entry["pin"]
+            assert columns["pin_n"][row] == -1
+
+
+def test_check_widths(columnar):
+    columnar.check_widths()
+
+    # Repeat one bit of the first bus in place of another
+    signal_id = columnar.columns["signal_id"]
+    bus = int(np.flatnonzero(columnar.columns["width"] > 1)[0])
+    rows = np.flatnonzero(signal_id == bus)
+    columnar.columns["index"][rows[1]] = columnar.columns["index"][rows[0]]
+
+    name = columnar.strings["signal_names"][bus]
+    with pytest.raises(ValueError, match=name):
+        columnar.check_widths()
+
+
+def test_find_duplicate_pins(tables, columnar):
+    duplicates = columnar.find_duplicate_pins()
+    assert duplicates == find_pin_conflicts(tables["pin_table"])
+    assert "P14" in [conflict.pin for conflict in duplicates]
+
+
+def test_bank_aggregates(tables, columnar):
+    pin_table = tables["pin_table"]
+    assert columnar.count_pins_by_bank() == {
+        bank: len(entries) for bank, entries in pin_table.by_bank.items()
+    }
+    assert columnar.get_bank_iostandards() == {
+        bank: sorted({entry["iostandard"] for entry in entries})
+        for bank, entries in pin_table.by_bank.items()
+    }
+
+
+@pytest.mark.parametrize("name", ["pins.npz", "pins", "pins.bin"])
+def test_npz_round_trip(columnar, tmp_path, name):
+    path = tmp_path / name
+    columnar.save(path)
+
+    loaded = ColumnarPinTable.load(path)
+    assert loaded.strings == columnar.strings
+    assert set(loaded.columns) == set(columnar.columns)
+    for name, column in columnar.columns.items():
+        np.testing.assert_array_equal(loaded.columns[name], column)
+
+
+def test_load_missing_column(columnar, tmp_path):
+    path = tmp_path / "pins.npz"
+    np.savez(path, signal_id=columnar.columns["signal_id"])
+    with pytest.raises(ValueError, match="missing"):
+        ColumnarPinTable.load(path)
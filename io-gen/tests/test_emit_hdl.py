@@ -0,0 +1,372 @@
+from typing import Any
+
+import pytest
+from io_gen.bank_table import extract_bank_table
+from io_gen.build import freeze_signal_pins
+from io_gen.emit_hdl import check_hdl_buffer, iter_verilog, iter_vhdl
+from io_gen.pin_table import extract_pin_table
+from io_gen.signal_table import extract_signal_table
+
+BANKS = {34: {"iostandard": "LVCMOS33", "performance": "HR"}}
+
+
+def get_signal_pins(signals):
+    signal_table = extract_signal_table(signals)
+    pin_table = extract_pin_table(signal_table, extract_bank_table(BANKS))
+    return freeze_signal_pins(signal_table, pin_table)
+
+
+LED = {
+    "name": "led",
+    "pins": "H17",
+    "bank": 34,
+    "direction": "out",
+    "buffer": "obuf",
+    "parameters": {"DRIVE": 12, "SLEW": "FAST"},
+    "comment": {"hdl": "User LED"},
+}
+
+CLK = {
+    "name": "clk",
+    "pinset": {"p": "H16", "n": "H15"},
+    "iostandard": "LVDS_25",
+    "direction": "in",
+    "buffer": "ibufds",
+    "instance": "u_clk",
+    "parameters": {"DIFF_TERM": True},
+}
+
+VERILOG = """\
+// Top-level IO wrapper generated by io_gen
+
+module io_top (
+    // User LED
+    output wire led_pad,
+    input wire led,
+    input wire clk_p,
+    input wire clk_n,
+    output wire clk
+);
+
+    OBUF #(
+        .IOSTANDARD("LVCMOS33"),
+        .DRIVE(12),
+        .SLEW("FAST")
+    ) led_obuf (
+        .I(led),
+        .O(led_pad)
+    );
+
+    IBUFDS #(
+        .IOSTANDARD("LVDS_25"),
+        .DIFF_TERM("TRUE")
+    ) u_clk (
+        .I(clk_p),
+        .IB(clk_n),
+        .O(clk)
+    );
+
+endmodule
+"""
+
+VHDL = """\
+-- Top-level IO wrapper generated by io_gen
+
+library ieee;
+use ieee.std_logic_1164.all;
+
+library unisim;
+use unisim.vcomponents.all;
+
+entity board_io is
+    port (
+        -- User LED
+        led_pad : out std_logic;
+        led : in std_logic;
+        clk_p : in std_logic;
+        clk_n : in std_logic;
+        clk : out std_logic
+    );
+end entity board_io;
+
+architecture structural of board_io is
+begin
+
+    led_obuf : OBUF
+        generic map (
+            IOSTANDARD => "LVCMOS33",
+            DRIVE => 12,
+            SLEW => "FAST"
+        )
+        port map (
+            I => led,
+            O => led_pad
+        );
+
+    u_clk : IBUFDS
+        generic map (
+            IOSTANDARD => "LVDS_25",
+            DIFF_TERM => TRUE
+        )
+        port map (
+            I => clk_p,
+            IB => clk_n,
+            O => clk
+        );
+
+end architecture structural;
+"""
+
+
+def test_verilog_wrapper():
+    assert "".join(iter_verilog(get_signal_pins([LED, CLK]))) == VERILOG
+
+
+def test_vhdl_wrapper():
+    signal_pins = get_signal_pins([LED, CLK])
+    assert "".join(iter_vhdl(signal_pins, module="board_io")) == VHDL
+
+
+def test_bus_iobuf():
+    signal = {
+        "name": "gpio",
+        "pins": ["A1", "A2"],
+        "width": 2,
+        "bank": 34,
+        "direction": "inout",
+        "buffer": "iobuf",
+    }
+    text = "".join(iter_verilog(get_signal_pins([signal])))
+
+    assert "    inout wire [1:0] gpio_pad,\n" in text
+    assert "    input wire [1:0] gpio_i,\n" in text
+    assert "    output wire [1:0] gpio_o,\n" in text
+    assert "    input wire [1:0] gpio_t\n);\n\n    genvar idx;\n" in text
+    assert (
+        "    generate\n"
+        "        for (idx = 0; idx <= 1; idx = idx + 1) begin : g_gpio_iobuf\n"
+        "            IOBUF #(\n"
+        '                .IOSTANDARD("LVCMOS33")\n'
+        "            ) gpio_iobuf (\n"
+        "                .I(gpio_i[idx]),\n"
+        "                .O(gpio_o[idx]),\n"
+        "                .T(gpio_t[idx]),\n"
+        "                .IO(gpio_pad[idx])\n"
+        "            );\n"
+        "        end\n"
+        "    endgenerate\n"
+    ) in text
+
+
+MULTIBANK: dict[str, Any] = {
+    "name": "data",
+    "direction": "out",
+    "buffer": "obuf",
+    "width": 5,
+    "multibank": [
+        {"bank": 34, "offset": 0, "pins": ["A1", "A2"]},
+        {"bank": 35, "offset": 2, "pins": ["B1", "B2"]},
+        {"bank": 13, "offset": 4, "pins": ["C1"]},
+    ],
+}
+
+MULTIBANK_BANKS = {
+    34: {"iostandard": "LVCMOS33", "performance": "HR"},
+    35: {"iostandard": "LVCMOS18", "performance": "HP"},
+    13: {"iostandard": "LVCMOS18", "performance": "HP"},
+}
+
+
+def get_multibank_pins():
+    signal_table = extract_signal_table([MULTIBANK])
+    bank_table = extract_bank_table(MULTIBANK_BANKS)
+    return freeze_signal_pins(signal_table, extract_pin_table(signal_table, bank_table))
+
+
+@pytest.mark.parametrize(
+    "iter_hdl, loops",
+    [
+        (
+            iter_verilog,
+            [
+                "begin : g_data_obuf_0",
+                "for (idx = 0; idx <= 1;",
+                "begin : g_data_obuf_2",
+                "for (idx = 2; idx <= 4;",
+            ],
+        ),
+        (
+            iter_vhdl,
+            [
+                "g_data_obuf_0 : for idx in 0 to 1 generate",
+                "g_data_obuf_2 : for idx in 2 to 4 generate",
+            ],
+        ),
+    ],
+)
+def test_multibank_loop_per_fragment(iter_hdl, loops):
+    text = "".join(iter_hdl(get_multibank_pins()))
+
+    for loop in loops:
+        assert loop in text
+    # Banks 35 and 13 share an iostandard and adjoin, so they share one loop
+    assert text.count("OBUF") == 2
+
+
+def test_single_bit_run_and_no_loops():
+    signal = dict(MULTIBANK, width=3)
+    signal["multibank"] = [
+        {"bank": 34, "offset": 0, "pins": ["A1", "A2"]},
+        {"bank": 35, "offset": 2, "pins": ["B1"]},
+    ]
+    signal_table = extract_signal_table([signal])
+    bank_table = extract_bank_table(MULTIBANK_BANKS)
+    signal_pins = freeze_signal_pins(
+        signal_table, extract_pin_table(signal_table, bank_table)
+    )
+
+    text = "".join(iter_verilog(signal_pins))
+    assert "begin : g_data_obuf_0" in text
+    assert ") data_obuf_2 (\n        .I(data[2]),\n" in text
+
+    text = "".join(iter_verilog(signal_pins, loops=False))
+    assert "    generate\n" not in text
+    assert "genvar" not in text
+    assert [f") data_obuf_{i} (" in text for i in range(3)] == [True] * 3
+
+
+@pytest.mark.parametrize(
+    "iter_hdl, expected",
+    [
+        (
+            iter_verilog,
+            [
+                "    assign sda_pad[0] = sda_t[0] ? 1'bz : sda_i[0];\n",
+                "    assign sda_o[0] = sda_pad[0];\n",
+            ],
+        ),
+        (
+            iter_vhdl,
+            [
+                "    sda_pad(0) <= sda_i(0) when sda_t(0) = '0' else 'Z';\n",
+                "    sda_o(0) <= sda_pad(0);\n",
+            ],
+        ),
+    ],
+)
+def test_inferred_inout(iter_hdl, expected):
+    signal = {
+        "name": "sda",
+        "pins": ["B1"],
+        "width": 1,
+        "bank": 34,
+        "direction": "inout",
+        "buffer": "infer",
+    }
+    text = "".join(iter_hdl(get_signal_pins([signal])))
+
+    for line in expected:
+        assert line in text
+
+
+@pytest.mark.parametrize(
+    "signal, match",
+    [
+        (
+            {"name": "a", "buffer": "ibuf", "direction": "out", "diff_pair": False},
+            "uses buffer 'ibuf' for direction 'out'",
+        ),
+        (
+            {"name": "a", "buffer": "ibuf", "direction": "in", "diff_pair": True},
+            "uses buffer 'ibuf' for differential pins",
+        ),
+        (
+            {"name": "a", "buffer": "obufds", "direction": "out", "diff_pair": False},
+            "uses buffer 'obufds' for single-ended pins",
+        ),
+        (
+            {"name": "a", "buffer": "infer", "direction": "in", "diff_pair": True},
+            "cannot infer a buffer",
+        ),
+    ],
+)
+def test_check_hdl_buffer_rejects(signal, match):
+    with pytest.raises(ValueError, match=match):
+        check_hdl_buffer(signal)
+
+
+@pytest.mark.parametrize(
+    "signals, match",
+    [
+        (
+            [dict(LED, instance="clk_p"), CLK],
+            r"Name 'clk_p' of 'clk' \(p\) collides with the same name of 'led' "
+            r"\(instance\)",
+        ),
+        (
+            [dict(LED, instance="u_clk"), CLK],
+            r"Name 'u_clk' of 'clk' \(instance\).*of 'led' \(instance\)",
+        ),
+        (
+            [
+                dict(LED, name="data", pins=["A1", "A2"], width=2),
+                dict(LED, name="g_data_obuf"),
+            ],
+            r"Name 'g_data_obuf' of 'g_data_obuf' \(core\).*of 'data' \(label\)",
+        ),
+    ],
+    ids=["port", "instance", "label"],
+)
+@pytest.mark.parametrize("iter_hdl", [iter_verilog, iter_vhdl])
+def test_instance_collisions(iter_hdl, signals, match):
+    with pytest.raises(ValueError, match=match):
+        "".join(iter_hdl(get_signal_pins(signals)))
+
+
+@pytest.mark.parametrize(
+    "signals, match",
+    [
+        (
+            [dict(LED, name="foo"), dict(LED, name="foo_pad")],
+            r"Name 'foo_pad' of 'foo_pad' \(core\) collides with the same name "
+            r"of 'foo' \(pad\)",
+        ),
+        (
+            [CLK, dict(LED, name="clk_p")],
+            r"Name 'clk_p' of 'clk_p' \(core\).*of 'clk' \(p\)",
+        ),
+        (
+            [
+                dict(LED, name="sda", direction="inout", buffer="iobuf"),
+                dict(LED, name="sda_t"),
+            ],
+            r"Name 'sda_t' of 'sda_t' \(core\).*of 'sda' \(core_t\)",
+        ),
+    ],
+    ids=["pad", "diff", "inout"],
+)
+@pytest.mark.parametrize("iter_hdl", [iter_verilog, iter_vhdl])
+def test_core_port_collisions(iter_hdl, signals, match):
+    with pytest.raises(ValueError, match=match):
+        "".join(iter_hdl(get_signal_pins(signals)))
+
+
+def test_case_collisions():
+    signal_pins = get_signal_pins([LED, dict(LED, name="LED", pins="H16")])
+
+    # Verilog tells 'led' from 'LED', but VHDL does not
+    assert "LED_pad" in "".join(iter_verilog(signal_pins))
+    with pytest.raises(ValueError, match=r"Name 'LED_pad' of 'LED' \(pad\).*'led'"):
+        "".join(iter_vhdl(signal_pins))
+
+
+@pytest.mark.parametrize("iter_hdl", [iter_verilog, iter_vhdl])
+def test_genvar_collision(iter_hdl):
+    index = dict(LED, name="idx")
+    bus = dict(LED, name="data", pins=["A1", "A2"], width=2)
+
+    # Without a loop the loop index is free to name a port
+    assert "idx" in "".join(iter_hdl(get_signal_pins([index, CLK])))
+    for signals in ([index, bus], [bus, index]):
+        with pytest.raises(ValueError, match=r"Name 'idx' .* \(genvar\)"):
+            "".join(iter_hdl(get_signal_pins(signals)))
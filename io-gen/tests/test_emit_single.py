@@ -1,5 +1,6 @@
 import pytest
-from io_gen.emit_xdc import emit_xdc_single
+from io_gen.emit_xdc import emit_xdc_single, get_xdc_single_port_name
+from io_gen.port_names import NamingConvention
 
 cases = [
     {
@@ -82,3 +83,16 @@ cases = [
 def test_emit_xdc_single(case):
     result = emit_xdc_single(case["pins"])
     assert result == case["expected"]
+
+
+@pytest.mark.parametrize("case", cases, ids=[c["id"] for c in cases])
+def test_get_xdc_single_port_name(case):
+    pin = case["pins"][-1]
+    port = case["expected"][-1].split("{")[1][:-2]
+    assert get_xdc_single_port_name(pin) == port
+
+    convention = NamingConvention(pad="_io", bit="{port}_{index}")
+    port = f"{pin['name']}_io"
+    if pin["bus"]:
+        port = f"{port}_{pin['index']}"
+    assert get_xdc_single_port_name(pin, convention) == port
@@ -0,0 +1,120 @@
+import re
+from pathlib import Path
+
+import pytest
+from io_gen.cache import build_tables
+from io_gen.emit_xdc import emit_xdc, emit_xdc_compact
+from io_gen.loader import load_board
+
+
+def make_pins(name, iostandards, diff_pair=False, bus=True):
+    pins = []
+    for index, iostandard in enumerate(iostandards):
+        pin = {
+            "name": name,
+            "index": index,
+            "iostandard": iostandard,
+            "diff_pair": diff_pair,
+            "bus": bus,
+        }
+        if diff_pair:
+            pin.update(p=f"P{index}", n=f"N{index}")
+        else:
+            pin["pin"] = f"A{index}"
+        pins.append(pin)
+    return pins
+
+
+cases = [
+    {
+        "id": "scalar",
+        "signal": {"name": "btn", "diff_pair": False, "bus": False},
+        "iostandards": ["LVCMOS33"],
+        "expected": [
+            "set_property -dict {PACKAGE_PIN A0 IOSTANDARD LVCMOS33} "
+            "[get_ports {btn_pad}]",
+        ],
+    },
+    {
+        "id": "diff-scalar",
+        "signal": {"name": "clk", "diff_pair": True, "bus": False},
+        "iostandards": ["LVDS_25"],
+        "expected": [
+            "set_property -dict {PACKAGE_PIN P0 IOSTANDARD LVDS_25} "
+            "[get_ports {clk_p}]",
+            "set_property -dict {PACKAGE_PIN N0 IOSTANDARD LVDS_25} "
+            "[get_ports {clk_n}]",
+        ],
+    },
+    {
+        "id": "bus",
+        "signal": {"name": "led", "diff_pair": False, "bus": True},
+        "iostandards": ["LVCMOS33", "LVCMOS18"],
+        "expected": [
+            "set_property -dict {PACKAGE_PIN A0 IOSTANDARD LVCMOS33} "
+            "[get_ports {led_pad[0]}]",
+            "set_property -dict {PACKAGE_PIN A1 IOSTANDARD LVCMOS18} "
+            "[get_ports {led_pad[1]}]",
+        ],
+    },
+    {
+        "id": "diff-bus",
+        "signal": {"name": "d", "diff_pair": True, "bus": True},
+        "iostandards": ["LVDS", "LVDS"],
+        "expected": [
+            "set_property -dict {PACKAGE_PIN P0 IOSTANDARD LVDS} [get_ports {d_p[0]}]",
+            "set_property -dict {PACKAGE_PIN N0 IOSTANDARD LVDS} [get_ports {d_n[0]}]",
+            "set_property -dict {PACKAGE_PIN P1 IOSTANDARD LVDS} [get_ports {d_p[1]}]",
+            "set_property -dict {PACKAGE_PIN N1 IOSTANDARD LVDS} [get_ports {d_n[1]}]",
+        ],
+    },
+]
+
+
+@pytest.mark.parametrize("case", cases, ids=[c["id"] for c in cases])
+def test_emit_xdc_compact(case):
+    signal = {"direction": "in", **case["signal"]}
+    pins = make_pins(
+        signal["name"], case["iostandards"], signal["diff_pair"], signal["bus"]
+    )
+    assert emit_xdc_compact(signal, pins) == case["expected"]
+
+
+def get_port_properties(lines, ports):
+    """Returns the properties that XDC lines set on each port, expanding wildcards"""
+    properties = {}
+    for line in lines:
+        match = re.fullmatch(r"set_property (.+) \[get_ports \{(.+)\}\]", line)
+        if not match:
+            continue
+
+        setting, patterns = match.groups()
+        if setting.startswith("-dict "):
+            values = setting[len("-dict {") : -1].split()
+        else:
+            values = setting.split()
+        values = dict(zip(values[::2], values[1::2]))
+
+        for pattern in patterns.split():
+            regex = re.escape(pattern).replace(r"\*", r"\d+")
+            matched = [port for port in ports if re.fullmatch(regex, port)]
+            assert matched, pattern
+            for port in matched:
+                properties.setdefault(port, {}).update(values)
+
+    return properties
+
+
+def test_compact_sets_same_properties():
+    board, _ = load_board(Path("tests/fixtures/pipeline/integration.yaml"))
+    tables = build_tables(board)
+
+    default = emit_xdc(tables["signal_table"], tables["pin_table"])
+    compact = emit_xdc(tables["signal_table"], tables["pin_table"], compact=True)
+
+    ports = [
+        port for line in default for port in re.findall(r"\[get_ports \{(.+)\}\]", line)
+    ]
+    # One line per port, where the default form has two
+    assert sum(line.startswith("set_property") for line in compact) == len(set(ports))
+    assert get_port_properties(compact, ports) == get_port_properties(default, ports)
@@ -1,5 +1,6 @@
 import pytest
-from io_gen.emit_xdc import emit_xdc_diff
+from io_gen.emit_xdc import emit_xdc_diff, get_xdc_port_names_diff
+from io_gen.port_names import NamingConvention
 
 cases = [
     {
@@ -94,3 +95,12 @@ cases = [
 def test_emit_xdc_diff(case):
     result = emit_xdc_diff(case["pins"])
     assert result == case["expected"]
+
+
+def test_get_xdc_port_names_diff():
+    pin = cases[-1]["pins"][-1]
+    assert get_xdc_port_names_diff(pin) == ("hdmi_data_p[1]", "hdmi_data_n[1]")
+
+    convention = NamingConvention(p="_P", n="_N", bit="{port}<{index}>")
+    ports = get_xdc_port_names_diff(pin, convention)
+    assert ports == ("hdmi_data_P<1>", "hdmi_data_N<1>")
@@ -0,0 +1,94 @@
+import io
+from pathlib import Path
+
+import pytest
+from io_gen.cache import build_tables
+from io_gen.emit_xdc import XDC, emit_xdc
+from io_gen.emitters import (
+    Emitter,
+    compile_template,
+    get_emitter,
+    register_emitter,
+    write_output,
+)
+from io_gen.loader import load_board
+from io_gen.port_names import iter_named_signal_pins
+
+template_cases = [
+    {
+        "id": "fields",
+        "lines": ("set {key} = {value}",),
+        "fields": {"key": "a", "value": 1},
+        "expected": "set a = 1\n",
+    },
+    {
+        "id": "escaped-braces",
+        "lines": ("[get_ports {{{port}}}]",),
+        "fields": {"port": "led_pad"},
+        "expected": "[get_ports {led_pad}]\n",
+    },
+    {
+        "id": "repeated-field-many-lines",
+        "lines": ("{a}", "{a}{b}"),
+        "fields": {"a": "x", "b": "y"},
+        "expected": "x\nxy\n",
+    },
+    {
+        "id": "unused-fields-ignored",
+        "lines": ("{a}",),
+        "fields": {"a": "x", "b": "y"},
+        "expected": "x\n",
+    },
+    {
+        "id": "no-fields",
+        "lines": ("",),
+        "fields": {"a": "x"},
+        "expected": "\n",
+    },
+    {
+        "id": "quotes-and-spec",
+        "lines": ("'{a:>3}' \"{b!r}\"",),
+        "fields": {"a": 1, "b": "y"},
+        "expected": "'  1' \"'y'\"\n",
+    },
+]
+
+
+@pytest.mark.parametrize("case", template_cases, ids=[c["id"] for c in template_cases])
+def test_compile_template(case):
+    formatter = compile_template(case["lines"])
+    assert formatter(**case["fields"]) == case["expected"]
+
+
+@pytest.mark.parametrize("template", ["{a.b}", "{0}", "{}", "{a[0]}", "{a:{b}}"])
+def test_compile_template_rejects_fields(template):
+    with pytest.raises(ValueError, match="must be a plain name"):
+        compile_template([template])
+
+
+def test_get_emitter():
+    assert get_emitter("xdc") is XDC
+    with pytest.raises(ValueError, match="Unknown emitter 'nope'.*xdc"):
+        get_emitter("nope")
+
+
+def test_register_emitter_duplicate():
+    with pytest.raises(ValueError, match="already registered"):
+        register_emitter(Emitter("xdc", ".xdc", {}, XDC.render))
+
+
+def test_write_output_matches_emit_xdc():
+    board, _ = load_board(Path("tests/fixtures/pipeline/integration.yaml"))
+    tables = build_tables(board)
+    signal_table = tables["signal_table"]
+    pin_table = tables["pin_table"]
+
+    signal_pins = (
+        (signal, pin_table.get_pins_by_signal(signal["name"]))
+        for signal in signal_table
+    )
+    stream = io.StringIO()
+    write_output(get_emitter("xdc"), iter_named_signal_pins(signal_pins), stream)
+
+    expected = "".join(f"{line}\n" for line in emit_xdc(signal_table, pin_table))
+    assert stream.getvalue() == expected
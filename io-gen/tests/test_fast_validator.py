@@ -0,0 +1,93 @@
+import copy
+from pathlib import Path
+
+import pytest
+import yaml
+from jsonschema import Draft202012Validator
+
+from io_gen import schema_fast
+from io_gen.schema_bundle import hash_schema_sources, load_bundle
+from io_gen.schema_compiler import compile_schema, load_compiled
+
+FIXTURE_FILES = sorted(Path("tests/fixtures/schema").glob("*.yaml")) + sorted(
+    Path("tests/fixtures/pipeline").glob("*.yaml")
+)
+
+# Replacement values used to mutate every field of the fixtures
+MUTATIONS = [None, True, 0, 1.0, -1, "", "A1", [], ["A1", "A1"], {}, {"p": "A1"}]
+
+
+def load_yaml_file(path):
+    with open(path) as f:
+        return yaml.safe_load(f)
+
+
+def mutate(data):
+    """Yields copies of a document with one field of the first signal or bank changed"""
+    for key in list(data):
+        mutated = copy.deepcopy(data)
+        del mutated[key]
+        yield mutated
+
+    containers = []
+    if data.get("signals"):
+        containers.append(("signals", 0))
+    if data.get("banks"):
+        containers.append(("banks", next(iter(data["banks"]))))
+
+    for section, index in containers:
+        for key in list(data[section][index]):
+            mutated = copy.deepcopy(data)
+            del mutated[section][index][key]
+            yield mutated
+
+            for value in MUTATIONS:
+                mutated = copy.deepcopy(data)
+                mutated[section][index][key] = value
+                yield mutated
+
+
+def build_corpus():
+    corpus = []
+    for path in FIXTURE_FILES:
+        data = load_yaml_file(path)
+        corpus.append((path.name, data))
+        corpus.extend(
+            (f"{path.name}-mutation-{i}", mutated)
+            for i, mutated in enumerate(mutate(data))
+        )
+    return corpus
+
+
+CORPUS = build_corpus()
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return Draft202012Validator(load_bundle()["schema"])
+
+
+@pytest.fixture(scope="module")
+def compiled():
+    bundle = load_bundle()
+    return load_compiled(compile_schema(bundle["schema"], bundle["source_hash"]))
+
+
+def test_generated_module_is_current():
+    # If this fails, regenerate the fast validator with `make schema`
+    assert schema_fast.SOURCE_HASH == hash_schema_sources()
+
+
+def test_corpus_covers_both_outcomes(reference):
+    outcomes = {reference.is_valid(data) for _, data in CORPUS}
+    assert outcomes == {True, False}
+
+
+def test_fast_path_agrees_with_jsonschema(reference, compiled):
+    disagreements = [
+        name
+        for name, data in CORPUS
+        if compiled(data) != reference.is_valid(data)
+        or schema_fast.is_valid(data) != reference.is_valid(data)
+    ]
+    assert disagreements == []
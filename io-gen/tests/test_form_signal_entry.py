@@ -2,6 +2,7 @@ import pytest
 import yaml
 
 from io_gen.signal_table import form_signal_entry
+from io_gen.utils import SignalKind
 
 test_cases = [
     {
@@ -26,6 +27,7 @@ signals:
             "comment": {},
             "width": 1,
             "bus": False,
+            "kind": SignalKind.SCALAR_PINS,
             "diff_pair": False,
         },
     },
@@ -44,7 +46,7 @@ signals:
 """,
         "expected": {
             "name": "data",
-            "pins": ["A1", "A2", "A3"],
+            "pins": ("A1", "A2", "A3"),
             "direction": "in",
             "buffer": "ibuf",
             "parameters": {
@@ -56,6 +58,7 @@ signals:
             "comment": {},
             "width": 3,
             "bus": True,
+            "kind": SignalKind.ARRAY_PINS,
             "diff_pair": False,
         },
     },
@@ -83,6 +86,7 @@ signals:
             "comment": {},
             "width": 1,
             "bus": False,
+            "kind": SignalKind.SCALAR_PINSET,
             "diff_pair": True,
         },
     },
@@ -101,7 +105,7 @@ signals:
 """,
         "expected": {
             "name": "diff_bus",
-            "pinset": {"p": ["C1", "C3"], "n": ["C2", "C4"]},
+            "pinset": {"p": ("C1", "C3"), "n": ("C2", "C4")},
             "direction": "out",
             "buffer": "obuf",
             "parameters": {},
@@ -111,6 +115,7 @@ signals:
             "comment": {},
             "width": 2,
             "bus": True,
+            "kind": SignalKind.ARRAY_PINSET,
             "diff_pair": True,
         },
     },
@@ -132,10 +137,10 @@ signals:
 """,
         "expected": {
             "name": "ctrl",
-            "multibank": [
-                {"pins": ["A1", "A2"], "bank": 34, "offset": 0},
-                {"pins": ["B1", "B2"], "bank": 35, "offset": 2},
-            ],
+            "multibank": (
+                {"pins": ("A1", "A2"), "bank": 34, "offset": 0},
+                {"pins": ("B1", "B2"), "bank": 35, "offset": 2},
+            ),
             "direction": "out",
             "buffer": "obuf",
             "parameters": {},
@@ -144,6 +149,7 @@ signals:
             "comment": {},
             "width": 4,
             "bus": True,
+            "kind": SignalKind.MULTIBANK_PINS,
             "diff_pair": False,
         },
     },
@@ -169,14 +175,14 @@ signals:
 """,
         "expected": {
             "name": "clk_diff",
-            "multibank": [
+            "multibank": (
                 {
-                    "pinset": {"p": ["C1", "C3"], "n": ["C2", "C4"]},
+                    "pinset": {"p": ("C1", "C3"), "n": ("C2", "C4")},
                     "bank": 34,
                     "offset": 0,
                 },
-                {"pinset": {"p": ["D1"], "n": ["D2"]}, "bank": 35, "offset": 2},
-            ],
+                {"pinset": {"p": ("D1",), "n": ("D2",)}, "bank": 35, "offset": 2},
+            ),
             "direction": "in",
             "buffer": "ibuf",
             "parameters": {},
@@ -185,6 +191,7 @@ signals:
             "comment": {},
             "width": 3,
             "bus": True,
+            "kind": SignalKind.MULTIBANK_PINSET,
             "diff_pair": True,
         },
     },
@@ -196,3 +203,20 @@ def test_form_signal_entry(case):
     raw = yaml.safe_load(case["yaml"])["signals"][0]
     result = form_signal_entry(raw)
     assert result == case["expected"]
+
+
+def test_entry_is_read_only():
+    raw = yaml.safe_load(test_cases[1]["yaml"])["signals"][0]
+    raw["comment"] = {"hdl": "data bus"}
+    entry = form_signal_entry(raw)
+
+    with pytest.raises(TypeError):
+        entry["parameters"]["DRIVE"] = 4
+    with pytest.raises(TypeError):
+        entry["comment"]["hdl"] = "changed"
+
+    # Changing the YAML entry afterwards does not reach the signal table entry
+    raw["parameters"]["DRIVE"] = 4
+    raw["comment"]["hdl"] = "changed"
+    assert entry["parameters"] == {"DRIVE": 12, "SLEW": "FAST"}
+    assert entry["comment"] == {"hdl": "data bus"}
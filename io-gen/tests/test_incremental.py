@@ -0,0 +1,131 @@
+import copy
+from pathlib import Path
+
+import pytest
+import yaml
+
+from io_gen.cache import build_tables, get_memo_path, load_tables, read_memo
+from io_gen.incremental import SignalMemo, hash_signal
+from io_gen.validate_pins import PinConflict, PinUse, find_pin_conflicts
+
+FIXTURE_YAML = Path("tests/fixtures/pipeline/integration.yaml")
+
+
+@pytest.fixture
+def board():
+    with open(FIXTURE_YAML) as f:
+        return yaml.safe_load(f)
+
+
+def assert_same_tables(tables, expected):
+    assert tables["part"] == expected["part"]
+    assert tables["signal_table"] == expected["signal_table"]
+    assert tables["bank_table"] == expected["bank_table"]
+    assert list(tables["pin_table"]) == list(expected["pin_table"])
+
+
+def test_matches_full_build(board):
+    memo = SignalMemo()
+    assert_same_tables(memo.build_tables(board), build_tables(copy.deepcopy(board)))
+    assert memo.hits == 0
+
+
+def test_only_changed_signal_is_rebuilt(board):
+    memo = SignalMemo()
+    memo.build_tables(board)
+    misses = memo.misses
+
+    edited = copy.deepcopy(board)
+    edited["signals"][0]["comment"] = {"xdc": "moved"}
+    tables = memo.build_tables(edited)
+
+    assert memo.misses == misses + 1
+    assert memo.hits == len(board["signals"]) - 1
+    assert_same_tables(tables, build_tables(copy.deepcopy(edited)))
+
+
+def test_bank_edit_rebuilds_dependent_signals(board):
+    edited = copy.deepcopy(board)
+    edited["banks"][34]["iostandard"] = "LVCMOS25"
+
+    for signal in board["signals"]:
+        changed = hash_signal(signal, board["banks"]) != hash_signal(
+            signal, edited["banks"]
+        )
+        banks = [signal.get("bank")] + [f["bank"] for f in signal.get("multibank", [])]
+        assert changed == (34 in banks)
+
+    memo = SignalMemo()
+    memo.build_tables(board)
+    assert_same_tables(memo.build_tables(edited), build_tables(copy.deepcopy(edited)))
+
+
+def test_hash_ignores_key_order():
+    a = {"name": "led", "pins": "A1", "bank": 34}
+    b = {"bank": 34, "pins": "A1", "name": "led"}
+    assert hash_signal(a, {}) == hash_signal(b, {})
+
+
+def test_duplicate_names_tracked_incrementally(board):
+    memo = SignalMemo()
+    memo.build_tables(board)
+
+    duplicated = copy.deepcopy(board)
+    duplicated["signals"].append(copy.deepcopy(board["signals"][0]))
+    with pytest.raises(ValueError, match="Duplicate signal name"):
+        memo.build_tables(duplicated)
+    assert memo.duplicate_names == {board["signals"][0]["name"]}
+
+    # Removing the duplicate again clears it
+    memo.build_tables(board)
+    assert memo.duplicate_names == set()
+
+
+def test_pin_owners_tracked_incrementally(board):
+    memo = SignalMemo()
+    pin_table = memo.build_tables(board)["pin_table"]
+    conflicts = memo.get_pin_conflicts()
+    assert conflicts[0] == PinConflict(
+        "P14", (PinUse("sig_inherit", 0, "pin"), PinUse("bus_34_inherit", 0, "pin"))
+    )
+    # The memo's index finds the same conflicts as the check on the pin table
+    by_pin = {conflict.pin: conflict for conflict in find_pin_conflicts(pin_table)}
+    assert {conflict.pin: conflict for conflict in conflicts} == by_pin
+
+    # Dropping one of the two signals that share P14 removes the conflict
+    edited = copy.deepcopy(board)
+    edited["signals"] = [s for s in board["signals"] if s["name"] != "sig_inherit"]
+    pin_table = memo.build_tables(edited)["pin_table"]
+    assert "P14" not in [conflict.pin for conflict in memo.get_pin_conflicts()]
+    assert [entry.name for entry in memo.pin_owners["P14"]] == ["bus_34_inherit"]
+    assert sorted(memo.get_pin_conflicts(), key=str) == sorted(
+        find_pin_conflicts(pin_table), key=str
+    )
+
+    fresh = SignalMemo()
+    fresh.build_tables(edited)
+    assert fresh.pin_owners == memo.pin_owners
+    assert fresh.shared_pins.keys() == memo.shared_pins.keys()
+    assert fresh.names == memo.names
+
+
+def test_memo_persists_between_runs(tmp_path):
+    path = tmp_path / "board.yaml"
+    text = FIXTURE_YAML.read_text()
+    path.write_text(text)
+
+    cache_dir = tmp_path / "cache"
+    load_tables(path, cache_dir)
+
+    # A new comment changes the file bytes, so the table cache misses, but no
+    # signal changed
+    path.write_text("# edited\n" + text)
+    tables, hit = load_tables(path, cache_dir)
+    assert not hit
+
+    with open(FIXTURE_YAML) as f:
+        assert_same_tables(tables, build_tables(yaml.safe_load(f)))
+
+    memo = read_memo(get_memo_path(path, cache_dir))
+    assert len(memo.keys) == len(tables["signal_table"])
+    assert dict(memo.names) == {s["name"]: 1 for s in tables["signal_table"]}
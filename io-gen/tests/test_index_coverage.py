@@ -0,0 +1,123 @@
+import pytest
+
+from io_gen.flatten import check_flattened_width
+from io_gen.records import PinEntry
+from io_gen.utils import (
+    check_multibank_width,
+    find_coverage_errors,
+    get_index_runs,
+)
+
+cases = [
+    {
+        "id": "exact",
+        "intervals": [(4, 4), (0, 4)],
+        "width": 8,
+        "expected": [],
+    },
+    {
+        "id": "gap-between",
+        "intervals": [(0, 4), (6, 2)],
+        "width": 8,
+        "expected": [("gap", 4, 5)],
+    },
+    {
+        "id": "gap-at-end",
+        "intervals": [(0, 4)],
+        "width": 6,
+        "expected": [("gap", 4, 5)],
+    },
+    {
+        "id": "gap-at-start",
+        "intervals": [(2, 2)],
+        "width": 4,
+        "expected": [("gap", 0, 1)],
+    },
+    {
+        "id": "overlap",
+        "intervals": [(0, 4), (2, 4)],
+        "width": 6,
+        "expected": [("overlap", 2, 3)],
+    },
+    {
+        "id": "contained-overlap",
+        "intervals": [(0, 8), (2, 2)],
+        "width": 8,
+        "expected": [("overlap", 2, 3)],
+    },
+    {
+        "id": "beyond-width",
+        "intervals": [(0, 10)],
+        "width": 8,
+        "expected": [("out of range", 8, 9)],
+    },
+    {
+        "id": "beyond-width-after-gap",
+        "intervals": [(0, 2), (6, 2)],
+        "width": 4,
+        "expected": [("gap", 2, 3), ("out of range", 6, 7)],
+    },
+    {
+        "id": "beyond-width-twice",
+        "intervals": [(0, 4), (5, 2), (6, 3), (12, 1)],
+        "width": 4,
+        "expected": [
+            ("overlap", 6, 6),
+            ("out of range", 5, 8),
+            ("out of range", 12, 12),
+        ],
+    },
+    {
+        "id": "negative-offset",
+        "intervals": [(-2, 4), (2, 2)],
+        "width": 4,
+        "expected": [("out of range", -2, -1)],
+    },
+    {
+        "id": "gap-and-overlap",
+        "intervals": [(0, 2), (1, 2), (5, 3)],
+        "width": 8,
+        "expected": [("gap", 3, 4), ("overlap", 1, 1)],
+    },
+    {
+        "id": "empty",
+        "intervals": [],
+        "width": 3,
+        "expected": [("gap", 0, 2)],
+    },
+]
+
+
+@pytest.mark.parametrize("case", cases, ids=[c["id"] for c in cases])
+def test_find_coverage_errors(case):
+    assert find_coverage_errors(case["intervals"], case["width"]) == case["expected"]
+
+
+def test_get_index_runs():
+    assert get_index_runs([0, 1, 2, 5, 6, 3]) == [(0, 3), (5, 2), (3, 1)]
+    assert get_index_runs([]) == []
+
+
+def test_multibank_error_reports_ranges():
+    signal = {
+        "name": "ctrl",
+        "width": 100000,
+        "multibank": [
+            {"pins": ["A1"] * 40000, "bank": 34, "offset": 0},
+            {"pins": ["B1"] * 50000, "bank": 35, "offset": 50000},
+        ],
+    }
+    with pytest.raises(ValueError) as excinfo:
+        check_multibank_width(signal)
+
+    # The message names the missing range instead of listing every index
+    message = str(excinfo.value)
+    assert "gap at 40000..49999" in message
+    assert len(message) < 200
+
+
+def test_flattened_width_reports_ranges():
+    signal = {"name": "data", "width": 4}
+    pins = [PinEntry(signal, index, "A1", "LVCMOS33") for index in (0, 1, 1, 2)]
+    with pytest.raises(ValueError, match=r"gap at 3, overlap at 1$"):
+        check_flattened_width(signal, pins)
@@ -0,0 +1,179 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from io_gen.build import build_targets
+from io_gen.cache import build_tables, load_tables
+from io_gen.infer_banks import infer_board_banks, infer_signal_banks
+from io_gen.pinout import load_pinout
+
+PINOUT_DIR = Path("tests/fixtures/pinout")
+PART = "xc7z020clg400-1"
+
+BOARD = {
+    "title": "Inferred banks",
+    "part": PART,
+    "banks": {
+        34: {"iostandard": "LVCMOS18", "performance": "HR"},
+        35: {"iostandard": "LVCMOS33", "performance": "HR"},
+    },
+    "signals": [
+        {"name": "btn", "pins": "P14", "direction": "in", "buffer": "ibuf"},
+        {
+            "name": "led",
+            "pins": ["P14", "R14", "C1", "D1", "T14"],
+            "width": 5,
+            "direction": "out",
+            "buffer": "obuf",
+        },
+        {
+            "name": "adc",
+            "pinset": {"p": ["K13", "G1"], "n": ["J13", "G2"]},
+            "width": 2,
+            "direction": "in",
+            "buffer": "ibufds",
+            "iostandard": "LVDS_25",
+        },
+        {
+            "name": "data",
+            "width": 2,
+            "direction": "out",
+            "buffer": "obuf",
+            "multibank": [
+                {"offset": 0, "pins": "U12"},
+                {"offset": 1, "pins": "T15", "iostandard": "LVCMOS25"},
+            ],
+        },
+    ],
+}
+
+
+@pytest.fixture
+def pinout(tmp_path):
+    with load_pinout(PART, PINOUT_DIR, tmp_path) as pinout:
+        yield pinout
+
+
+def test_scalar_and_single_bank(pinout):
+    signal = {"name": "btn", "pins": "P14"}
+    assert infer_signal_banks(signal, pinout) == {**signal, "bank": 34}
+
+    pair = {"name": "rx", "pinset": {"p": ["C1", "G1"], "n": ["D1", "G2"]}}
+    assert infer_signal_banks(pair, pinout)["bank"] == 35
+
+
+def test_split_array(pinout):
+    signal = BOARD["signals"][1]
+    inferred = infer_signal_banks(signal, pinout)
+    assert "pins" not in inferred and "bank" not in inferred
+    assert inferred["multibank"] == [
+        {"bank": 34, "offset": 0, "pins": ["P14", "R14"]},
+        {"bank": 35, "offset": 2, "pins": ["C1", "D1"]},
+        {"bank": 34, "offset": 4, "pins": ["T14"]},
+    ]
+    assert "multibank" not in signal
+
+
+def test_multibank_fragments(pinout):
+    signal = {
+        "name": "rx",
+        "multibank": [
+            {"offset": 0, "pinset": {"p": ["K13", "C1"], "n": ["J13", "D1"]}},
+            {"bank": 35, "offset": 2, "pins": "U12"},
+        ],
+    }
+    assert infer_signal_banks(signal, pinout)["multibank"] == [
+        {"bank": 34, "offset": 0, "pinset": {"p": ["K13"], "n": ["J13"]}},
+        {"bank": 35, "offset": 1, "pinset": {"p": ["C1"], "n": ["D1"]}},
+        {"bank": 35, "offset": 2, "pins": "U12"},
+    ]
+
+
+def test_split_fragment_keeps_keys(pinout):
+    fragment = {"offset": 0, "pins": ["P14", "C1"], "iostandard": "LVCMOS25", "x": 1}
+    inferred = infer_signal_banks({"name": "rx", "multibank": [fragment]}, pinout)
+    assert inferred["multibank"] == [
+        {"bank": 34, "offset": 0, "pins": ["P14"], "iostandard": "LVCMOS25", "x": 1},
+        {"bank": 35, "offset": 1, "pins": ["C1"], "iostandard": "LVCMOS25", "x": 1},
+    ]
+
+
+@pytest.mark.parametrize(
+    "signal",
+    [
+        {"name": "a", "pins": "P14", "bank": 35},  # explicit bank wins
+        {"name": "b", "pins": ["P14", "C1"], "iostandard": "LVCMOS18"},
+        {"name": "c", "pins": ["P14", "ZZ99"]},  # not in the package
+        {"name": "d", "pins": "U9"},  # not a user IO
+        {"name": "e", "pinset": {"p": "K14", "n": "G2"}},  # pair across banks
+        {"name": "f", "pins": 14},  # left for the schema to reject
+    ],
+    ids=["bank", "iostandard", "unknown", "power", "split-pair", "malformed"],
+)
+def test_left_as_written(pinout, signal):
+    assert infer_signal_banks(signal, pinout) is signal
+
+
+def test_iostandard_inheritance(pinout):
+    tables = build_tables(infer_board_banks(BOARD, pinout))
+    pin_table = tables["pin_table"]
+    iostandards = {
+        (entry["name"], entry["index"]): entry["iostandard"] for entry in pin_table
+    }
+    assert iostandards == {
+        ("btn", 0): "LVCMOS18",
+        ("led", 0): "LVCMOS18",
+        ("led", 1): "LVCMOS18",
+        ("led", 2): "LVCMOS33",
+        ("led", 3): "LVCMOS33",
+        ("led", 4): "LVCMOS18",
+        ("adc", 0): "LVDS_25",
+        ("adc", 1): "LVDS_25",
+        ("data", 0): "LVCMOS33",
+        ("data", 1): "LVCMOS25",
+    }
+    assert pin_table.get_bank("btn", 0) == 34
+    assert pin_table.get_bank("led", 2) == 35
+
+
+def test_load_tables_infers_banks(tmp_path):
+    board_path = tmp_path / "board.yaml"
+    board_path.write_text(yaml.safe_dump(BOARD))
+    cache_dir = tmp_path / "cache"
+
+    with pytest.raises(ValueError, match="must specify either 'iostandard' or 'bank'"):
+        load_tables(board_path, cache_dir)
+
+    cold, hit = load_tables(board_path, cache_dir, True, PINOUT_DIR)
+    assert not hit
+    warm, hit = load_tables(board_path, cache_dir, True, PINOUT_DIR)
+    assert hit
+    assert warm["pinout"] == cold["pinout"]
+    assert list(warm["pin_table"]) == list(cold["pin_table"])
+
+    # Editing the pinout invalidates the tables inferred from it
+    pinout_dir = tmp_path / "pinouts"
+    pinout_dir.mkdir()
+    pinout_file = pinout_dir / "xc7z020clg400pkg.txt"
+    pinout_file.write_bytes((PINOUT_DIR / pinout_file.name).read_bytes())
+    _, hit = load_tables(board_path, cache_dir, True, pinout_dir)
+    assert hit
+    pinout_file.write_text(pinout_file.read_text().replace("IO_L6P_T0_34", "IO_6_34"))
+    _, hit = load_tables(board_path, cache_dir, True, pinout_dir)
+    assert not hit
+
+
+def test_build_infer_banks(tmp_path):
+    board_path = tmp_path / "board.yaml"
+    board_path.write_text(yaml.safe_dump(BOARD))
+    (result,) = build_targets(
+        board_path,
+        tmp_path,
+        cache_dir=tmp_path / "cache",
+        infer_banks=True,
+        pinout_dir=PINOUT_DIR,
+    )
+    xdc = result.path.read_text()
+    assert "set_property PACKAGE_PIN C1 [get_ports {led_pad[2]}]" in xdc
+    assert "set_property IOSTANDARD LVCMOS33 [get_ports {led_pad[2]}]" in xdc
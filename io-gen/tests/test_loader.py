@@ -0,0 +1,144 @@
+import io
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+from jsonschema.exceptions import ValidationError
+
+from io_gen.loader import YAML_BACKEND, iter_signals, load_board, load_json
+from io_gen.pipeline import iter_xdc_lines, iter_xdc_lines_from_yaml
+
+FIXTURE_FILES = sorted(Path("tests/fixtures/pipeline").glob("*.yaml"))
+FIXTURE_YAML = Path("tests/fixtures/pipeline/integration.yaml")
+
+YAML_LOADERS: list[type] = [yaml.SafeLoader]
+if yaml.__with_libyaml__:
+    YAML_LOADERS.append(yaml.CSafeLoader)
+
+
+@pytest.mark.parametrize("loader", YAML_LOADERS, ids=lambda c: c.__name__)
+@pytest.mark.parametrize("path", FIXTURE_FILES, ids=[p.name for p in FIXTURE_FILES])
+def test_iter_signals_matches_safe_load(path, loader):
+    with open(path) as f:
+        expected = yaml.safe_load(f)
+
+    header = {}
+    with open(path) as f:
+        signals = list(iter_signals(f, header, loader))
+
+    assert signals == expected["signals"]
+    assert header == {**expected, "signals": []}
+
+
+def test_header_after_signals():
+    text = """
+title: t
+signals:
+  - &led {name: led, pins: A1}
+  - *led
+part: xc7z020clg400-1
+"""
+    header = {}
+    signals = iter_signals(text, header)
+
+    assert next(signals) == {"name": "led", "pins": "A1"}
+    assert header == {"title": "t", "signals": []}
+
+    # Aliases to earlier signals still resolve
+    assert list(signals) == [{"name": "led", "pins": "A1"}]
+    assert header == {"title": "t", "signals": [], "part": "xc7z020clg400-1"}
+
+
+def test_signals_are_yielded_before_the_rest_is_parsed():
+    text = """
+title: t
+signals:
+  - {name: a, pins: A1}
+  - {name: b, pins: [
+"""
+    signals = iter_signals(io.StringIO(text), {})
+    assert next(signals)["name"] == "a"
+    with pytest.raises(yaml.YAMLError):
+        next(signals)
+
+
+def test_non_sequence_signals_kept_in_header():
+    header = {}
+    assert list(iter_signals("title: t\nsignals: nope\n", header)) == []
+    assert header == {"title": "t", "signals": "nope"}
+
+
+@pytest.mark.parametrize("text", ["", "- a\n- b\n", "title: a\n---\ntitle: b\n"])
+def test_invalid_documents(text):
+    with pytest.raises(ValueError):
+        list(iter_signals(text, {}))
+
+
+def test_xdc_from_yaml_matches_loaded_board():
+    with open(FIXTURE_YAML) as f:
+        expected = list(iter_xdc_lines(yaml.safe_load(f)))
+    with open(FIXTURE_YAML) as f:
+        assert list(iter_xdc_lines_from_yaml(f)) == expected
+
+
+def test_xdc_from_yaml_rejects_non_sequence_signals():
+    text = (
+        "title: t\npart: xc7z020clg400-1\nsignals: nope\n"
+        "banks: {34: {iostandard: LVCMOS18, performance: HP}}\n"
+    )
+    with pytest.raises(ValidationError):
+        list(iter_xdc_lines_from_yaml(text))
+
+
+def test_xdc_from_yaml_compact():
+    with open(FIXTURE_YAML) as f:
+        expected = list(iter_xdc_lines(yaml.safe_load(f), compact=True))
+    with open(FIXTURE_YAML) as f:
+        assert list(iter_xdc_lines_from_yaml(f, compact=True)) == expected
+
+
+def test_xdc_from_yaml_with_banks_last():
+    text = """
+title: t
+part: xc7z020clg400-1
+signals:
+  - {name: led, pins: A1, bank: 34, direction: out, buffer: obuf}
+banks:
+  34: {iostandard: LVCMOS33, performance: HR}
+"""
+    assert list(iter_xdc_lines_from_yaml(text)) == [
+        "set_property PACKAGE_PIN A1 [get_ports {led_pad}]",
+        "set_property IOSTANDARD LVCMOS33 [get_ports {led_pad}]",
+        "",
+    ]
+
+
+@pytest.mark.parametrize("path", FIXTURE_FILES, ids=[p.name for p in FIXTURE_FILES])
+def test_load_board_yaml(path):
+    with open(path) as f:
+        expected = yaml.safe_load(f)
+
+    board, backend = load_board(path)
+    assert board == expected
+    assert backend == YAML_BACKEND
+    assert backend == ("libyaml" if yaml.__with_libyaml__ else "pyyaml")
+
+
+@pytest.mark.parametrize("path", FIXTURE_FILES, ids=[p.name for p in FIXTURE_FILES])
+def test_load_board_json(path, tmp_path):
+    with open(path) as f:
+        expected = yaml.safe_load(f)
+
+    # JSON object keys are strings, so bank numbers have to be restored
+    json_path = tmp_path / f"{path.stem}.json"
+    json_path.write_text(json.dumps(expected))
+
+    board, backend = load_board(json_path)
+    assert board == expected
+    assert backend == "json"
+
+
+def test_load_json_leaves_other_bank_keys():
+    board = load_json('{"banks": {"34": {}, "bank_35": {}}}')
+    assert board == {"banks": {34: {}, "bank_35": {}}}
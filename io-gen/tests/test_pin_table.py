@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from io_gen.bank_table import extract_bank_table
+from io_gen.emit_xdc import emit_xdc
+from io_gen.pin_table import extract_pin_table
+from io_gen.signal_table import extract_signal_table
+
+FIXTURE_YAML = Path("tests/fixtures/pipeline/integration.yaml")
+
+
+@pytest.fixture
+def tables():
+    with open(FIXTURE_YAML) as f:
+        data = yaml.safe_load(f)
+    signal_table = extract_signal_table(data["signals"])
+    bank_table = extract_bank_table(data["banks"])
+    return signal_table, extract_pin_table(signal_table, bank_table)
+
+
+def test_pin_table_preserves_signal_and_index_order(tables):
+    signal_table, pin_table = tables
+    names = [entry["name"] for entry in pin_table]
+    expected = [
+        signal["name"] for signal in signal_table for _ in range(signal["width"])
+    ]
+    assert names == expected
+    assert len(pin_table) == sum(signal["width"] for signal in signal_table)
+
+
+def test_pin_table_by_signal(tables):
+    _, pin_table = tables
+    pins = pin_table.get_pins_by_signal("mb_edge_2")
+    assert [pin["index"] for pin in pins] == [0, 1, 2, 3]
+    assert [pin["p"] for pin in pins] == ["E2", "F2", "G2", "H2"]
+
+    with pytest.raises(ValueError):
+        pin_table.get_pins_by_signal("does_not_exist")
+
+
+def test_pin_table_by_package_pin(tables):
+    _, pin_table = tables
+    # P14 is claimed by both a scalar and a bus in the fixture
+    pins = pin_table.get_pins_by_package_pin("P14")
+    owners = [(pin["name"], pin["index"]) for pin in pins]
+    assert owners == [("sig_inherit", 0), ("bus_34_inherit", 0)]
+
+    # Differential pairs are reachable from either side
+    assert pin_table.get_pins_by_package_pin("R13")[0]["name"] == "d_inherit_34"
+    assert pin_table.get_pins_by_package_pin("ZZ99") == []
+
+
+def test_pin_table_by_bank(tables):
+    _, pin_table = tables
+    bank_35 = [(pin["name"], pin["index"]) for pin in pin_table.get_pins_by_bank(35)]
+    assert bank_35 == [
+        ("d_inherit_35", 0),
+        ("mb_override", 2),
+        ("mb_override", 3),
+        ("mb_inherit_d", 2),
+        ("mb_inherit_d", 3),
+        ("mb_edge_1", 3),
+        ("mb_edge_2", 0),
+    ]
+    # Signals that only declare an iostandard have no bank
+    assert pin_table.get_bank("sig_override", 0) is None
+    assert pin_table.get_bank("mb_edge_2", 1) == 34
+
+
+def test_emit_xdc_uses_index_order(tables):
+    signal_table, pin_table = tables
+    xdc = emit_xdc(signal_table, pin_table)
+    start = xdc.index("set_property PACKAGE_PIN E2 [get_ports {mb_edge_2_p[0]}]")
+    assert xdc[start + 4] == "set_property PACKAGE_PIN F2 [get_ports {mb_edge_2_p[1]}]"
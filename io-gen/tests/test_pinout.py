@@ -0,0 +1,132 @@
+import mmap
+from pathlib import Path
+
+import pytest
+from io_gen.pinout import (
+    PackagePin,
+    PackagePinout,
+    build_pinout_index,
+    get_package_name,
+    load_pinout,
+    parse_pinout,
+)
+
+PINOUT_DIR = Path("tests/fixtures/pinout")
+PART = "xc7z020clg400-1"
+
+
+@pytest.fixture
+def pinout(tmp_path):
+    with load_pinout(PART, PINOUT_DIR, tmp_path) as pinout:
+        yield pinout
+
+
+@pytest.mark.parametrize(
+    "part, package",
+    [
+        ("xc7z020clg400-1", "xc7z020clg400"),
+        ("xc7a35ticsg324-1L", "xc7a35ticsg324"),
+        ("XC7K325T-FFG900-2", "xc7k325tffg900"),
+        ("xczu9eg-ffvb1156-2-e", "xczu9egffvb1156"),
+    ],
+)
+def test_get_package_name(part, package):
+    assert get_package_name(part) == package
+
+
+def test_pin_fields(pinout):
+    assert pinout.get_pin("P14") == PackagePin(
+        pin="P14",
+        name="IO_L6P_T0_34",
+        bank=34,
+        io_type="HR",
+        pair=6,
+        side="p",
+        clock_capable=False,
+    )
+
+    clock_n = pinout.get_pin("R13")
+    assert (clock_n.pair, clock_n.side, clock_n.clock_capable) == (12, "n", True)
+    assert pinout.get_pin("U12").side is None
+    assert pinout.get_pin("U12").is_user_io
+
+    ground = pinout.get_pin("F9")
+    assert (ground.bank, ground.io_type, ground.is_user_io) == (None, None, False)
+
+    assert pinout.get_pin("ZZ99") is None
+    assert "T15" in pinout and "ZZ99" not in pinout
+
+
+def test_pins_by_bank(pinout):
+    assert pinout.banks == [34, 35, 500]
+    assert len(pinout) == 61
+
+    bank_35 = pinout.get_pins_by_bank(35)
+    assert [pin.pin for pin in bank_35[:4]] == ["U12", "V12", "C1", "D1"]
+    assert {pin.bank for pin in bank_35} == {35}
+    assert pinout.get_pins_by_bank(12) == []
+
+
+def test_index_matches_parse():
+    pins = parse_pinout((PINOUT_DIR / "xc7z020clg400pkg.txt").read_text())
+    index = PackagePinout(build_pinout_index(pins))
+
+    assert sorted(index, key=pins.index) == pins
+    assert all(index.get_pin(pin.pin) == pin for pin in pins)
+
+
+def test_cached_index_is_mapped(tmp_path):
+    load_pinout(PART, PINOUT_DIR, tmp_path).close()
+    assert len(list((tmp_path / "pinout").iterdir())) == 1
+    with load_pinout(PART, PINOUT_DIR, tmp_path) as second:
+        assert isinstance(second.buffer, mmap.mmap)
+        pin = second.get_pin("P14")
+        assert pin is not None
+        assert pin.bank == 34
+
+
+def test_corrupt_index_is_rebuilt(tmp_path):
+    load_pinout(PART, PINOUT_DIR, tmp_path).close()
+    (index_path,) = (tmp_path / "pinout").iterdir()
+    index_path.write_bytes(b"not an index")
+
+    with load_pinout(PART, PINOUT_DIR, tmp_path) as pinout:
+        pin = pinout.get_pin("P14")
+        assert pin is not None
+        assert pin.bank == 34
+
+
+def test_csv_pinout():
+    text = (
+        "Device/Package xc7a35tcpg236\n"
+        "Pin,Pin Name,Memory Byte Group,Bank,I/O Type\n"
+        "A1,IO_L1P_T0_SRCC_14,0,14,HR\n"
+        "A2,GND,NA,NA,NA\n"
+        "Total Number of Pins, 2\n"
+    )
+    pins = parse_pinout(text)
+    assert [(pin.pin, pin.bank, pin.clock_capable) for pin in pins] == [
+        ("A1", 14, True),
+        ("A2", None, False),
+    ]
+
+
+@pytest.mark.parametrize(
+    "text, match",
+    [
+        ("Device/Package xc7z020clg400\n", "no 'Pin'"),
+        ("Pin  Pin Name  I/O Type\n", r"missing columns \['Bank'\]"),
+        (
+            "Pin  Pin Name  Bank\nA1  IO_0_14  14\nA1  IO_25_14  14\n",
+            "'A1' is listed more than once",
+        ),
+    ],
+)
+def test_parse_pinout_rejects(text, match):
+    with pytest.raises(ValueError, match=match):
+        parse_pinout(text)
+
+
+def test_missing_pinout(tmp_path):
+    with pytest.raises(FileNotFoundError, match="xc7a35tcpg236pkg.txt"):
+        load_pinout("xc7a35tcpg236-1", PINOUT_DIR, tmp_path)
@@ -1,10 +1,11 @@
 import json
 from pathlib import Path
 
-import yaml
 from jsonschema.exceptions import ValidationError
 
+from io_gen.loader import load_board
 from io_gen.signal_table import extract_signal_table
+from io_gen.utils import thaw
 from io_gen.validate_signals import validate_signal_table
 from io_gen.validator import validate
 
@@ -15,8 +16,7 @@ FIXTURE_SIG_TABLE = Path("tests/fixtures/pipeline/integration.signal_table.json"
 
 def test_pipeline():
     # Load YAML
-    with open(FIXTURE_YAML) as f:
-        data = yaml.safe_load(f)
+    data, _ = load_board(FIXTURE_YAML)
 
     # Stage 1: Schema validation
     try:
@@ -41,5 +41,5 @@ def test_pipeline():
     with open(FIXTURE_SIG_TABLE) as f:
         expected = json.load(f)
 
-    # Compare
-    assert signal_table == expected
+    # Compare, with the read-only pin definitions in their JSON form
+    assert thaw(signal_table) == expected
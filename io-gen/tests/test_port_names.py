@@ -0,0 +1,110 @@
+import pytest
+from io_gen.port_names import NamingConvention, PortNamer, iter_named_signal_pins
+from io_gen.records import PinEntry
+
+
+def make_signal(name, direction="in", diff_pair=False, bus=False):
+    return {"name": name, "direction": direction, "diff_pair": diff_pair, "bus": bus}
+
+
+def make_pins(width):
+    return [PinEntry({}, index, f"A{index}", "LVCMOS33") for index in range(width)]
+
+
+def test_scalar_names():
+    ports = PortNamer().name_signal(make_signal("btn"), make_pins(1))
+
+    assert ports.package == {"pad": "btn_pad"}
+    assert ports.core == {"core": "btn"}
+    assert ports.bits == ("btn_pad",)
+    assert ports.patterns == ()
+
+
+def test_bus_names():
+    ports = PortNamer().name_signal(make_signal("led", "out", bus=True), make_pins(3))
+
+    assert ports.bits == ("led_pad[0]", "led_pad[1]", "led_pad[2]")
+    assert ports.patterns == ("led_pad[*]",)
+
+
+def test_one_bit_bus_keeps_index():
+    ports = PortNamer().name_signal(make_signal("led", bus=True), make_pins(1))
+    assert ports.bits == ("led_pad[0]",)
+
+
+def test_diff_bus_names():
+    signal = make_signal("adc", diff_pair=True, bus=True)
+    ports = PortNamer().name_signal(signal, make_pins(2))
+
+    assert ports.package == {"p": "adc_p", "n": "adc_n"}
+    assert ports.bits == (("adc_p[0]", "adc_n[0]"), ("adc_p[1]", "adc_n[1]"))
+    assert ports.patterns == ("adc_p[*]", "adc_n[*]")
+
+
+def test_inout_core_names():
+    ports = PortNamer().name_signal(make_signal("sda", "inout"), make_pins(1))
+    assert ports.core == {"core_i": "sda_i", "core_o": "sda_o", "core_t": "sda_t"}
+
+
+def test_custom_convention():
+    convention = NamingConvention(
+        pad="_io",
+        core={"core": "_c", "core_i": "_in", "core_o": "_out", "core_t": "_oe"},
+        bit="{port}_{index}",
+    )
+    namer = PortNamer(convention)
+
+    ports = namer.name_signal(make_signal("led", "out", bus=True), make_pins(2))
+    assert ports.bits == ("led_io_0", "led_io_1")
+    assert ports.patterns == ("led_io_*",)
+    assert ports.core == {"core": "led_c"}
+
+    ports = namer.name_signal(make_signal("sda", "inout"), make_pins(1))
+    assert ports.core == {"core_i": "sda_in", "core_o": "sda_out", "core_t": "sda_oe"}
+
+
+@pytest.mark.parametrize(
+    "convention, signals, match",
+    [
+        (
+            NamingConvention(pad=""),
+            [make_signal("clk", diff_pair=True), make_signal("clk_p")],
+            r"Name 'clk_p' of 'clk_p' \(pad\) collides with the same name "
+            r"of 'clk' \(p\)",
+        ),
+        (
+            NamingConvention(fold_case=True),
+            [make_signal("led"), make_signal("LED")],
+            r"Name 'LED_pad' of 'LED' \(pad\).*of 'led' \(pad\)",
+        ),
+    ],
+    ids=["pad", "case"],
+)
+def test_collisions(convention, signals, match):
+    signal_pins = [(signal, make_pins(1)) for signal in signals]
+    with pytest.raises(ValueError, match=match):
+        list(iter_named_signal_pins(signal_pins, PortNamer(convention)))
+
+
+@pytest.mark.parametrize(
+    "signals",
+    [
+        [make_signal("led"), make_signal("LED")],
+        [make_signal("foo"), make_signal("foo_pad")],
+        [make_signal("sda", "inout"), make_signal("sda_t", "out")],
+    ],
+    ids=["case", "pad", "inout"],
+)
+def test_only_package_ports_collide(signals):
+    # Core ports are checked by the HDL wrapper, the only output that has them
+    signal_pins = [(signal, make_pins(1)) for signal in signals]
+    assert len(list(iter_named_signal_pins(signal_pins))) == 2
+
+
+def test_names_are_shared_across_signals():
+    signal_pins = [(make_signal("a"), make_pins(1)), (make_signal("b"), make_pins(1))]
+    namer = PortNamer()
+    named = list(iter_named_signal_pins(signal_pins, namer))
+
+    assert [ports.bits for _, _, ports in named] == [("a_pad",), ("b_pad",)]
+    assert set(namer.owners) == {"a_pad", "b_pad"}
@@ -0,0 +1,153 @@
+import dataclasses
+from typing import Any, cast
+
+import pytest
+
+from io_gen.emit_xdc import emit_xdc_single, iter_xdc
+from io_gen.flatten import flatten_array_pinset
+from io_gen.pin_table import PinTable
+from io_gen.records import (
+    DiffPinEntry,
+    PinEntry,
+    as_pin_entries,
+    as_pin_entry,
+    make_pin_entry,
+)
+from io_gen.signal_table import form_signal_entry
+from io_gen.utils import SignalKind, thaw
+
+RAW_SIGNAL = {
+    "name": "led",
+    "pins": ["A1", "A2"],
+    "bank": 34,
+    "direction": "out",
+    "buffer": "obuf",
+    "width": 2,
+}
+
+BANK_TABLE = {34: {"iostandard": "LVCMOS33", "performance": "HR"}}
+
+
+def test_signal_entry_reads_like_a_dict():
+    entry = form_signal_entry(RAW_SIGNAL)
+
+    assert entry["name"] == "led"
+    assert entry.get("bank") == 34
+    assert "bank" in entry
+
+    # Optional fields that were not given are not keys
+    assert "iostandard" not in entry
+    assert entry.get("iostandard") is None
+    with pytest.raises(KeyError):
+        entry["iostandard"]
+
+    assert list(entry) == [
+        "name",
+        "direction",
+        "buffer",
+        "parameters",
+        "instance",
+        "group",
+        "comment",
+        "bank",
+        "pins",
+        "diff_pair",
+        "bus",
+        "kind",
+        "width",
+    ]
+    assert thaw(entry)["pins"] == ["A1", "A2"]
+    assert entry == dict(entry)
+    assert entry["kind"] is SignalKind.ARRAY_PINS
+
+
+def test_records_are_read_only():
+    entry = form_signal_entry(RAW_SIGNAL)
+    with pytest.raises(TypeError):
+        cast(Any, entry)["name"] = "other"
+
+
+def test_pin_entry_references_signal():
+    signal = form_signal_entry(RAW_SIGNAL)
+    pin = PinEntry(signal, 1, "A2", "LVCMOS33")
+
+    # Signal fields are read through the parent rather than stored on the pin
+    field_names = {field.name for field in dataclasses.fields(PinEntry)}
+    assert field_names == {"signal", "index", "pin", "iostandard"}
+    assert pin.signal is signal
+
+    assert pin == {
+        "name": "led",
+        "direction": "out",
+        "buffer": "obuf",
+        "diff_pair": False,
+        "bus": True,
+        "index": 1,
+        "pin": "A2",
+        "iostandard": "LVCMOS33",
+    }
+    assert pin.name == "led"
+
+
+def test_diff_pin_entry():
+    signal = {
+        "name": "clk",
+        "pinset": {"p": ["C1"], "n": ["C2"]},
+        "direction": "in",
+        "buffer": "ibufds",
+        "diff_pair": True,
+        "bus": True,
+        "width": 1,
+        "bank": 34,
+    }
+    (pin,) = flatten_array_pinset(signal, BANK_TABLE)
+
+    assert isinstance(pin, DiffPinEntry)
+    assert dict(pin) == {
+        "name": "clk",
+        "direction": "in",
+        "buffer": "ibufds",
+        "diff_pair": True,
+        "bus": True,
+        "index": 0,
+        "p": "C1",
+        "n": "C2",
+        "iostandard": "LVCMOS33",
+    }
+
+
+def test_make_pin_entry_round_trip():
+    signal = form_signal_entry(RAW_SIGNAL)
+    pin = PinEntry(signal, 0, "A1", "LVCMOS33")
+
+    restored = make_pin_entry(signal, thaw(pin))
+    assert restored == pin
+    assert restored.signal is signal
+
+
+def test_as_pin_entry():
+    signal = form_signal_entry(RAW_SIGNAL)
+    pin = PinEntry(signal, 0, "A1", "LVCMOS33")
+    assert as_pin_entry(pin) is pin
+
+    # A plain dict from an external caller becomes a record with the same fields
+    record = as_pin_entry(dict(pin))
+    assert isinstance(record, PinEntry)
+    assert (record.index, record.pin, record.name) == (0, "A1", "led")
+    assert record == pin
+
+
+def test_plain_dict_pins():
+    signal = form_signal_entry(RAW_SIGNAL)
+    pins = [PinEntry(signal, index, pin, "LVCMOS33") for index, pin in enumerate("AB")]
+    plain = [dict(pin) for pin in pins]
+
+    # Pins given as plain dicts are turned into records where they enter io_gen
+    assert as_pin_entries(pins) is pins
+    assert as_pin_entries(plain) == pins
+    assert list(iter_xdc([(signal, plain)])) == list(iter_xdc([(signal, pins)]))
+    assert emit_xdc_single(plain) == emit_xdc_single(pins)
+
+    pin_table = PinTable()
+    pin_table.add_signal(signal, plain)
+    assert pin_table.get_pins_by_package_pin("B") == [pins[1]]
@@ -0,0 +1,50 @@
+import json
+
+from io_gen.schema_bundle import (
+    BUNDLE_PATH,
+    build_bundle,
+    hash_schema_sources,
+    load_bundled_schema,
+)
+
+
+def find_refs(schema):
+    if isinstance(schema, dict):
+        if "$ref" in schema:
+            yield schema["$ref"]
+        for value in schema.values():
+            yield from find_refs(value)
+    elif isinstance(schema, list):
+        for item in schema:
+            yield from find_refs(item)
+
+
+def test_committed_bundle_is_current():
+    # If this fails, rebuild the bundle with `make schema`
+    with open(BUNDLE_PATH) as f:
+        bundle = json.load(f)
+    assert bundle["source_hash"] == hash_schema_sources()
+    assert bundle == build_bundle()
+
+
+def test_bundle_has_no_refs():
+    schema = build_bundle()["schema"]
+    assert list(find_refs(schema)) == []
+
+    signal = schema["properties"]["signals"]["items"]
+    assert signal["properties"]["direction"]["enum"] == ["in", "out", "inout"]
+
+    # Definitions referenced from other definitions are inlined too
+    fragment = signal["properties"]["multibank"]["items"]
+    assert fragment["properties"]["bank"]["type"] == "integer"
+
+
+def test_stale_bundle_is_rebuilt(tmp_path):
+    path = tmp_path / "schema.bundle.json"
+    path.write_text(json.dumps({"source_hash": "stale", "schema": {}}))
+
+    schema = load_bundled_schema(path)
+
+    assert schema == build_bundle()["schema"]
+    with open(path) as f:
+        assert json.load(f)["source_hash"] == hash_schema_sources()
@@ -1,7 +1,10 @@
+import copy
+
 import pytest
 import yaml
 
 from io_gen.signal_table import extract_signal_table
+from io_gen.utils import SignalKind
 
 test_cases = [
     {
@@ -24,6 +27,7 @@ test_cases = [
                 "pins": "A1",
                 "diff_pair": False,
                 "bus": False,
+                "kind": SignalKind.SCALAR_PINS,
                 "width": 1,
             }
         ],
@@ -51,9 +55,10 @@ test_cases = [
                 "instance": None,
                 "group": "",
                 "comment": {},
-                "pins": ["A1", "A2", "A3"],
+                "pins": ("A1", "A2", "A3"),
                 "diff_pair": False,
                 "bus": True,
+                "kind": SignalKind.ARRAY_PINS,
                 "width": 3,
             }
         ],
@@ -81,6 +86,7 @@ test_cases = [
                 "pinset": {"p": "C1", "n": "C2"},
                 "diff_pair": True,
                 "bus": False,
+                "kind": SignalKind.SCALAR_PINSET,
                 "width": 1,
             }
         ],
@@ -109,6 +115,7 @@ test_cases = [
                 "pins": "R1",
                 "diff_pair": False,
                 "bus": False,
+                "kind": SignalKind.SCALAR_PINS,
                 "width": 1,
             }
         ],
@@ -146,20 +153,21 @@ test_cases = [
                 "instance": None,
                 "group": "",
                 "comment": {},
-                "multibank": [
+                "multibank": (
                     {
                         "bank": 34,
                         "offset": 0,
-                        "pinset": {"p": ["C1", "C2", "C3"], "n": ["D1", "D2", "D3"]},
+                        "pinset": {"p": ("C1", "C2", "C3"), "n": ("D1", "D2", "D3")},
                     },
                     {
                         "bank": 35,
                         "offset": 3,
-                        "pinset": {"p": ["C4", "C5", "C6"], "n": ["D4", "D5", "D6"]},
+                        "pinset": {"p": ("C4", "C5", "C6"), "n": ("D4", "D5", "D6")},
                     },
-                ],
+                ),
                 "diff_pair": True,
                 "bus": True,
+                "kind": SignalKind.MULTIBANK_PINSET,
                 "width": 6,
             }
         ],
@@ -172,3 +180,30 @@ def test_extract_signal_table(case):
     raw = yaml.safe_load(case["yaml"])["signals"]
     result = extract_signal_table(raw)
     assert result == case["expected"]
+
+
+def test_extract_signal_table_does_not_mutate_input():
+    raw = yaml.safe_load(
+        """
+signals:
+  - name: led
+    pins: [A1, A2]
+    direction: out
+    buffer: obuf
+    width: 2
+    generate: true
+  - name: unused
+    pins: B1
+    direction: out
+    buffer: obuf
+    generate: false
+"""
+    )["signals"]
+    before = copy.deepcopy(raw)
+
+    (entry,) = extract_signal_table(raw)
+    assert raw == before
+
+    # Pin definitions are read-only views that share the input's pin names
+    assert entry["pins"] == ("A1", "A2")
+    assert entry["pins"][0] is raw[0]["pins"][0]
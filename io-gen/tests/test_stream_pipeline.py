@@ -0,0 +1,113 @@
+import copy
+import io
+from pathlib import Path
+
+import pytest
+import yaml
+from jsonschema.exceptions import ValidationError
+
+from io_gen.bank_table import extract_bank_table
+from io_gen.emit_xdc import emit_xdc
+from io_gen.pin_table import extract_pin_table
+from io_gen.pipeline import iter_xdc_lines, stream_xdc, stream_xdc_file
+from io_gen.signal_table import extract_signal_table
+
+FIXTURE_YAML = Path("tests/fixtures/pipeline/integration.yaml")
+
+
+@pytest.fixture
+def board():
+    with open(FIXTURE_YAML) as f:
+        return yaml.safe_load(f)
+
+
+def test_stream_matches_list_pipeline(board):
+    signal_table = extract_signal_table(copy.deepcopy(board["signals"]))
+    pin_table = extract_pin_table(signal_table, extract_bank_table(board["banks"]))
+    expected = "".join(f"{line}\n" for line in emit_xdc(signal_table, pin_table))
+
+    stream = io.StringIO()
+    stream_xdc(board, stream)
+
+    assert stream.getvalue() == expected
+
+
+def test_stream_fails_at_duplicate_without_reading_ahead(board):
+    signals = board["signals"]
+    signals.insert(3, copy.deepcopy(signals[0]))
+    consumed = []
+
+    def source():
+        for signal in signals:
+            consumed.append(signal["name"])
+            yield signal
+
+    lines = iter_xdc_lines(board, source())
+    with pytest.raises(ValueError, match="Duplicate signal name 'sig_inherit'"):
+        for _ in lines:
+            pass
+
+    assert len(consumed) == 4
+
+
+def test_stream_fails_at_width_mismatch(board):
+    board["signals"][2]["width"] = 4
+    emitted = []
+    with pytest.raises(ValueError, match="bus_34_inherit"):
+        for line in iter_xdc_lines(board):
+            emitted.append(line)
+
+    # Signals before the bad one were already emitted
+    assert "set_property PACKAGE_PIN T15 [get_ports {sig_override_pad}]" in emitted
+
+
+def test_stream_file_is_not_left_truncated(board, tmp_path):
+    path = tmp_path / "board.xdc"
+    board["signals"][5]["direction"] = "sideways"
+
+    with pytest.raises(ValidationError):
+        stream_xdc_file(board, path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_stream_file(board, tmp_path):
+    path = tmp_path / "board.xdc"
+    stream_xdc_file(board, path)
+
+    stream = io.StringIO()
+    stream_xdc(board, stream)
+    assert path.read_text() == stream.getvalue()
+
+
+def make_signal(name, pin, direction="out", buffer="obuf"):
+    return {
+        "name": name,
+        "direction": direction,
+        "buffer": buffer,
+        "pins": pin,
+        "bank": 34,
+    }
+
+
+@pytest.mark.parametrize(
+    "signals, ports",
+    [
+        (
+            [make_signal("led", "T15"), make_signal("LED", "U12")],
+            ["led_pad", "LED_pad"],
+        ),
+        (
+            [make_signal("sda", "T15", "inout", "iobuf"), make_signal("sda_t", "U12")],
+            ["sda_pad", "sda_t_pad"],
+        ),
+    ],
+    ids=["case", "core"],
+)
+def test_xdc_checks_only_its_ports(board, signals, ports):
+    # Names that only collide in VHDL or among HDL core ports are fine in XDC
+    board["signals"] = signals
+    lines = list(iter_xdc_lines(board))
+
+    for port in ports:
+        assert f"set_property IOSTANDARD LVCMOS18 [get_ports {{{port}}}]" in lines
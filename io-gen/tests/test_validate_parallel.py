@@ -0,0 +1,63 @@
+import copy
+from pathlib import Path
+
+import pytest
+import yaml
+from jsonschema.exceptions import ValidationError
+
+from io_gen.validator import find_signal_errors, validate, validate_parallel
+
+FIXTURE_YAML = Path("tests/fixtures/pipeline/integration.yaml")
+
+
+@pytest.fixture
+def large_board():
+    """Integration fixture with its signals repeated under unique names"""
+    with open(FIXTURE_YAML) as f:
+        data = yaml.safe_load(f)
+
+    signals = []
+    for copy_index in range(20):
+        for signal in data["signals"]:
+            signal = copy.deepcopy(signal)
+            signal["name"] = f"{signal['name']}_{copy_index}"
+            signals.append(signal)
+
+    data["signals"] = signals
+    return data
+
+
+def test_parallel_accepts_valid_board(large_board):
+    validate_parallel(large_board, jobs=2, chunk_size=16)
+
+
+def test_parallel_matches_serial_error(large_board):
+    large_board["signals"][57]["direction"] = "sideways"
+    large_board["signals"][130]["pins"] = 7
+
+    with pytest.raises(ValidationError) as serial:
+        validate(large_board)
+    with pytest.raises(ValidationError) as parallel:
+        validate_parallel(large_board, jobs=2, chunk_size=16)
+
+    assert list(parallel.value.path) == ["signals", 57, "direction"]
+    assert list(parallel.value.path) == list(serial.value.path)
+    assert list(parallel.value.schema_path) == list(serial.value.schema_path)
+    assert parallel.value.message == serial.value.message
+
+
+def test_signal_errors_in_source_order(large_board):
+    large_board["signals"][130]["pins"] = 7
+    large_board["signals"][3]["buffer"] = "none"
+    large_board["signals"][57]["direction"] = "sideways"
+
+    errors = find_signal_errors(large_board["signals"], jobs=2, chunk_size=16)
+
+    assert [error.path[1] for error in errors] == [3, 57, 130]
+
+
+def test_parallel_validates_top_level(large_board):
+    del large_board["part"]
+    with pytest.raises(ValidationError) as error:
+        validate_parallel(large_board, jobs=2, chunk_size=16)
+    assert "part" in error.value.message
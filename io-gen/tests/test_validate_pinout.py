@@ -0,0 +1,153 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from io_gen.bank_table import extract_bank_table
+from io_gen.build import build_targets
+from io_gen.cache import build_tables
+from io_gen.pin_table import extract_pin_table
+from io_gen.pinout import load_pinout
+from io_gen.signal_table import extract_signal_table
+from io_gen.validate_pinout import find_pinout_violations, validate_pinout
+
+PINOUT_DIR = Path("tests/fixtures/pinout")
+INTEGRATION = Path("tests/fixtures/pipeline/integration.yaml")
+VALID = Path("tests/fixtures/schema/valid-parameters.yaml")
+
+BANKS = {
+    34: {"iostandard": "LVCMOS18", "performance": "HR"},
+    35: {"iostandard": "LVCMOS33", "performance": "HR"},
+}
+
+
+@pytest.fixture
+def pinout(tmp_path):
+    with load_pinout("xc7z020clg400-1", PINOUT_DIR, tmp_path) as pinout:
+        yield pinout
+
+
+def get_violations(pinout, *signals):
+    signal_table = extract_signal_table(list(signals))
+    pin_table = extract_pin_table(signal_table, extract_bank_table(BANKS))
+    return [
+        (violation.signal, violation.index, violation.rule)
+        for violation in find_pinout_violations(signal_table, pin_table, pinout)
+    ]
+
+
+def make_signal(name, pins=None, pinset=None, **fields):
+    signal = {"name": name, "direction": "in", "buffer": "ibuf", "bank": 34}
+    if pinset is not None:
+        signal.update(buffer="ibufds", pinset=pinset)
+        width = len(pinset["p"]) if isinstance(pinset["p"], list) else 1
+    else:
+        signal["pins"] = pins
+        width = len(pins) if isinstance(pins, list) else 1
+    signal["width"] = width
+    signal.update(fields)
+    return signal
+
+
+def test_matching_pins(pinout):
+    signals = [
+        make_signal("btn", ["P14", "R14", "T14"]),
+        make_signal("adc", pinset={"p": ["K13", "K14"], "n": ["J13", "J14"]}),
+        make_signal("clk", pinset={"p": "T13", "n": "R13"}, group="clock"),
+        make_signal("clk_se", "W13", group="clock"),
+        make_signal("clk_out", "P14", direction="out", buffer="obuf", group="clock"),
+    ]
+    assert get_violations(pinout, *signals) == []
+
+
+def test_bank(pinout):
+    signal = make_signal("led", ["P14", "C1"], direction="out", buffer="obuf")
+    assert get_violations(pinout, signal) == [("led", 1, "bank")]
+
+
+def test_multibank_fragment_bank(pinout):
+    signal = {
+        "name": "data",
+        "direction": "out",
+        "buffer": "obuf",
+        "width": 2,
+        "multibank": [
+            {"bank": 34, "offset": 0, "pins": "P14"},
+            {"bank": 34, "offset": 1, "pins": "C1"},
+        ],
+    }
+    assert get_violations(pinout, signal) == [("data", 1, "bank")]
+
+
+@pytest.mark.parametrize(
+    "pinset, violations",
+    [
+        ({"p": "P14", "n": "T15"}, [("rx", 0, "pair")]),  # two different pairs
+        ({"p": "R14", "n": "P14"}, [("rx", 0, "pair")]),  # sides swapped
+        ({"p": "T14", "n": "T15"}, []),
+    ],
+    ids=["other-pair", "swapped", "matched"],
+)
+def test_pair(pinout, pinset, violations):
+    assert get_violations(pinout, make_signal("rx", pinset=pinset)) == violations
+
+
+def test_pair_in_two_banks(pinout):
+    # P side of pair 2 in bank 34 and N side of pair 2 in bank 35
+    signal = make_signal("rx", pinset={"p": "K14", "n": "G2"}, iostandard="LVDS_25")
+    del signal["bank"]
+    assert get_violations(pinout, signal) == [("rx", 0, "pair")]
+
+
+@pytest.mark.parametrize(
+    "pin, violations",
+    [
+        ("P14", [("clk", 0, "clock")]),  # not clock capable
+        ("R13", [("clk", 0, "clock")]),  # N side of a clock-capable pair
+        ("T13", []),
+    ],
+)
+def test_clock(pinout, pin, violations):
+    signal = make_signal("clk", pin, group="clock")
+    assert get_violations(pinout, signal) == violations
+
+
+def test_unknown_and_non_io_pins(pinout):
+    signal = make_signal("btn", ["ZZ99", "U9"])
+    assert get_violations(pinout, signal) == [("btn", 0, "pin"), ("btn", 1, "pin")]
+
+
+def test_integration_fixture(pinout):
+    with open(INTEGRATION) as f:
+        tables = build_tables(yaml.safe_load(f))
+    signal_table, pin_table = tables["signal_table"], tables["pin_table"]
+
+    # Only mb_edge_2 puts its pairs on the N sides of other pairs
+    violations = find_pinout_violations(signal_table, pin_table, pinout)
+    assert {violation.signal for violation in violations} == {"mb_edge_2"}
+    assert {violation.rule for violation in violations} == {"bank", "pair"}
+
+    with pytest.raises(ValueError) as excinfo:
+        validate_pinout(signal_table, pin_table, pinout)
+    assert str(excinfo.value).startswith(
+        "Pins do not match the package pinout: mb_edge_2[0] is declared in bank 35 "
+        "but pin 'E2' (IO_L9N_T1_DQS_34) is in bank 34; "
+    )
+
+
+def test_build_check_pinout(tmp_path):
+    cache_dir = tmp_path / "cache"
+    (result,) = build_targets(
+        VALID, tmp_path, cache_dir=cache_dir, check_pinout=True, pinout_dir=PINOUT_DIR
+    )
+    assert result.path.exists()
+
+    with pytest.raises(ValueError, match="mb_edge_2"):
+        build_targets(
+            INTEGRATION,
+            tmp_path,
+            cache_dir=cache_dir,
+            check_pinout=True,
+            pinout_dir=PINOUT_DIR,
+        )
+    assert not (tmp_path / "integration.xdc").exists()
@@ -0,0 +1,161 @@
+from pathlib import Path
+
+import pytest
+import yaml
+
+from io_gen.bank_table import extract_bank_table
+from io_gen.build import build_targets
+from io_gen.pin_table import extract_pin_table, iter_signal_pins
+from io_gen.pipeline import (
+    iter_xdc_lines,
+    iter_xdc_lines_cached,
+    iter_xdc_lines_from_yaml,
+    stream_xdc_file,
+)
+from io_gen.signal_table import extract_signal_table
+from io_gen.validate_pins import (
+    PinConflict,
+    PinUse,
+    find_pin_conflicts,
+    iter_checked_signal_pins,
+    validate_pin_table,
+)
+
+FIXTURE_YAML = Path("tests/fixtures/pipeline/integration.yaml")
+
+
+def get_pin_table(signals):
+    signal_table = extract_signal_table(signals)
+    return extract_pin_table(signal_table, {})
+
+
+def make_pins(name, pins):
+    return {
+        "name": name,
+        "direction": "in",
+        "buffer": "ibuf",
+        "pins": pins,
+        "width": len(pins) if isinstance(pins, list) else 1,
+        "iostandard": "LVCMOS33",
+    }
+
+
+def make_pinset(name, p, n):
+    return {
+        "name": name,
+        "direction": "in",
+        "buffer": "ibufds",
+        "pinset": {"p": p, "n": n},
+        "width": len(p) if isinstance(p, list) else 1,
+        "iostandard": "LVDS_25",
+    }
+
+
+def test_fixture_conflict():
+    with open(FIXTURE_YAML) as f:
+        data = yaml.safe_load(f)
+    signal_table = extract_signal_table(data["signals"])
+    pin_table = extract_pin_table(signal_table, extract_bank_table(data["banks"]))
+
+    conflicts = find_pin_conflicts(pin_table)
+    assert [conflict.pin for conflict in conflicts] == ["P14", "E2", "F2", "G2", "H2"]
+    assert conflicts[0].uses == (
+        PinUse("sig_inherit", 0, "pin"),
+        PinUse("bus_34_inherit", 0, "pin"),
+    )
+    # The N sides of one multibank pair are the P sides of another
+    assert conflicts[4].uses == (
+        PinUse("mb_inherit_d", 3, "n"),
+        PinUse("mb_edge_2", 3, "p"),
+    )
+    with pytest.raises(ValueError, match=r"P14 \(sig_inherit\[0\], bus_34_inherit"):
+        validate_pin_table(pin_table)
+
+
+def test_no_conflicts():
+    pin_table = get_pin_table(
+        [make_pins("a", ["A1", "A2"]), make_pinset("b", ["B1", "B2"], ["C1", "C2"])]
+    )
+    assert find_pin_conflicts(pin_table) == []
+    validate_pin_table(pin_table)
+
+
+def test_pair_sides_and_bits():
+    pin_table = get_pin_table(
+        [
+            make_pinset("clk", "A1", "A2"),
+            make_pinset("adc", ["B1", "A2"], ["B2", "B3"]),
+            make_pins("led", ["C1", "B3"]),
+        ]
+    )
+
+    assert find_pin_conflicts(pin_table) == [
+        PinConflict("A2", (PinUse("clk", 0, "n"), PinUse("adc", 1, "p"))),
+        PinConflict("B3", (PinUse("adc", 1, "n"), PinUse("led", 1, "pin"))),
+    ]
+
+    with pytest.raises(ValueError) as excinfo:
+        validate_pin_table(pin_table)
+    assert str(excinfo.value) == (
+        "Package pins are claimed more than once: "
+        "A2 (clk[0] (N), adc[1] (P)); B3 (adc[1] (N), led[1])"
+    )
+
+
+def test_pair_on_one_pin():
+    pin_table = get_pin_table([make_pinset("clk", "A1", "A1")])
+    assert find_pin_conflicts(pin_table) == [
+        PinConflict("A1", (PinUse("clk", 0, "p"), PinUse("clk", 0, "n")))
+    ]
+
+
+def test_build_check_pins(tmp_path):
+    with pytest.raises(ValueError, match="P14"):
+        build_targets(
+            FIXTURE_YAML, tmp_path, cache_dir=tmp_path / "cache", check_pins=True
+        )
+    assert not (tmp_path / "integration.xdc").exists()
+
+
+def test_streamed_conflicts():
+    signal_table = extract_signal_table(
+        [
+            make_pinset("clk", "A1", "A1"),
+            make_pins("led", ["B1", "B2"]),
+            make_pins("btn", ["C1", "B2"]),
+        ]
+    )
+    signal_pins = iter_checked_signal_pins(iter_signal_pins(signal_table, {}))
+
+    with pytest.raises(ValueError) as excinfo:
+        next(signal_pins)
+    assert str(excinfo.value) == (
+        "Package pins are claimed more than once: A1 (clk[0] (P), clk[0] (N))"
+    )
+
+    # Each signal is checked as it arrives, against the signals before it
+    signal_pins = iter_checked_signal_pins(iter_signal_pins(signal_table[1:], {}))
+    assert next(signal_pins)[0]["name"] == "led"
+    with pytest.raises(ValueError, match=r"B2 \(led\[1\], btn\[1\]\)"):
+        next(signal_pins)
+
+
+def test_pipeline_check_pins(tmp_path):
+    with open(FIXTURE_YAML) as f:
+        text = f.read()
+    board = yaml.safe_load(text)
+
+    assert list(iter_xdc_lines(board))
+    with pytest.raises(ValueError, match="P14"):
+        list(iter_xdc_lines(board, check_pins=True))
+    with pytest.raises(ValueError, match="P14"):
+        list(iter_xdc_lines_from_yaml(text, check_pins=True))
+
+    cache_dir = tmp_path / "cache"
+    with pytest.raises(ValueError, match="P14"):
+        next(iter_xdc_lines_cached(FIXTURE_YAML, cache_dir, check_pins=True))
+
+    path = tmp_path / "board.xdc"
+    with pytest.raises(ValueError, match="P14"):
+        stream_xdc_file(board, path, check_pins=True)
+    assert not path.exists()